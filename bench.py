@@ -0,0 +1,312 @@
+"""Banc de mesure des étapes du build et des noyaux numériques.
+
+Chaque cas (étape du pipeline ou noyau, pour une taille donnée) est exécuté
+dans un processus neuf : la préparation n'est pas chronométrée, puis on
+relève le temps mural, le temps CPU (processus et enfants : pdflatex, pool)
+et le pic de mémoire résidente. Les étapes du pipeline tournent dans un
+répertoire temporaire, donc à froid (sans cache de build).
+
+Les résultats (médiane sur --repeat exécutions) sont ajoutés à
+BENCH_DIR/history.json et comparés à BENCH_DIR/baseline.json : un cas plus
+lent que la référence de plus de REGRESSION_TOLERANCE est signalé et le code
+de sortie vaut 1.
+
+    python bench.py                       # tous les cas
+    python bench.py --only planck,rp      # cas dont le nom contient ces motifs
+    python bench.py --save-baseline       # la mesure devient la référence
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter, process_time, strftime
+from typing import NamedTuple
+
+# ------------ Config ------------
+BENCH_DIR = Path(".bench")
+REGRESSION_TOLERANCE = 0.15  # +15 % de temps mural médian
+REGRESSION_MIN_SECONDS = 0.005  # écarts plus petits ignorés (bruit)
+DEFAULT_REPEAT = 3
+# --------------------------------
+
+
+class Case(NamedTuple):
+    group: str          # "pipeline" ou "noyau"
+    setup: object       # taille -> fonction chronométrée (None : cas sauté)
+    sizes: tuple
+
+
+# ------------ Noyaux ------------
+def setup_planck(size):
+    import numpy as np
+    from planck import spectrum_grid
+    n_nu, n_T = size
+    nu = np.geomspace(1e13, 1e16, n_nu)
+    T = np.linspace(2000.0, 20000.0, n_T)
+    out = np.empty((n_T, n_nu), dtype=np.float32)
+    return lambda: spectrum_grid(nu, T, out=out)
+
+
+def setup_fisher_grid(n):
+    from fisher import fisher_grid, gaussian_grid
+    rho, h = gaussian_grid(4.0, n, 3)
+    return lambda: fisher_grid(rho, h)
+
+
+def setup_fisher_radial(n_snap):
+    import numpy as np
+    from fisher import fisher_radial
+    r = np.linspace(0.0, 3.0, 512)
+    rho = np.multiply.outer(-np.linspace(1.0, 20.0, n_snap), r**2)
+    np.exp(rho, out=rho)  # sur place : le pic de RSS de la préparation reste celui de rho
+    return lambda: fisher_radial(rho, r)
+
+
+def setup_rp(lanes):
+    import numpy as np
+    from rayleigh_plesset import HARD_CORE_AR, P0, Medium, integrate
+    Pa = np.linspace(1.0, 1.35, lanes) * P0
+    medium = Medium(hard_core=HARD_CORE_AR)
+    return lambda: integrate(4.5e-6, Pa, 26.5e3, periods=1, n_out=2, rtol=1e-6, medium=medium)
+
+
+def setup_ot_fisher(size):
+    from ot_fisher import solve
+    n_r, n_t = size
+    return lambda: solve(n_r, n_t)
+
+
+def setup_ot_fisher_cold(size):
+    """Départ à froid arrêté sur la même baisse relative de J que `solve_multilevel`."""
+    from ot_fisher import solve
+    n_r, n_t = size
+    return lambda: solve(n_r, n_t, ftol=1e-7)
+
+
+def setup_ot_fisher_multilevel(size):
+    """Grilles 16×8, 32×16, ... jusqu'à `size` (continuation en λ sur la plus grossière)."""
+    from ot_fisher import solve_multilevel
+    n_r, n_t = size
+    levels = [(n_r >> k, n_t >> k) for k in range((n_r // 16).bit_length() - 1, -1, -1)]
+    return lambda: solve_multilevel(levels, ftol=1e-7)
+
+
+def setup_sinkhorn(size):
+    import numpy as np
+    from sinkhorn import sinkhorn
+    batch, n = size
+    g = np.linspace(-1.0, 1.0, n)
+    X, Y = np.meshgrid(g, g, indexing="ij")
+    a = np.broadcast_to(np.exp(-(X**2 + Y**2) / 0.02), (batch, n, n))
+    b = np.exp(-((X - np.linspace(0.0, 0.5, batch)[:, None, None]) ** 2 + Y**2) / 0.02)
+    return lambda: sinkhorn(a, b, [g, g], eps=2e-3)
+
+
+# ------------ Pipeline ------------
+def setup_render_values(_):
+    """Valeurs <<nom>> à mémo froid : simulations Rayleigh–Plesset et émission comprises."""
+    import build
+    return lambda: build.render(build.latex_content)
+
+
+def setup_write_tex(_):
+    """Écriture du .tex et des fragments, mémo des valeurs déjà rempli (cf. render_values)."""
+    import build
+    build.ensure_output_dir()
+    build.render(build.latex_content)
+    return build.write_tex
+
+
+def setup_figures(jobs):
+    import importlib.util
+    if importlib.util.find_spec("matplotlib") is None:
+        return None
+    import build
+    return lambda: build.render_figures(jobs)
+
+
+def setup_assets(_):
+    import importlib.util
+    if importlib.util.find_spec("PIL") is None:
+        return None
+    import build
+    return build.optimize_assets
+
+
+def setup_latex_pass(n):
+    """Passe pdflatex numéro `n` : les passes précédentes font partie de la préparation."""
+    import build
+    pdflatex = build.which("pdflatex")
+    if not pdflatex:
+        return None
+    build.QUIET = True
+    build.ensure_output_dir()
+    build.write_tex()
+    cmd = [pdflatex, "-interaction=nonstopmode", build.BASENAME + ".tex"]
+    fmt = build.preamble_format()
+    if fmt:
+        cmd.insert(1, f"-fmt={fmt}")
+    for _ in range(n - 1):
+        build.run(cmd, cwd=build.OUTPUT_DIR)
+    return lambda: build.run(cmd, cwd=build.OUTPUT_DIR)
+
+
+CASES = {
+    "render_values": Case("pipeline", setup_render_values, (None,)),
+    "write_tex": Case("pipeline", setup_write_tex, (None,)),
+    "latex_pass": Case("pipeline", setup_latex_pass, (1, 2, 3)),
+    "figures": Case("pipeline", setup_figures, tuple(sorted({1, os.cpu_count() or 1}))),
+    "assets": Case("pipeline", setup_assets, (None,)),
+    "planck": Case("noyau", setup_planck, ((256, 256), (2048, 1024), (8192, 2048))),
+    "fisher_grid": Case("noyau", setup_fisher_grid, (64, 128, 192)),
+    "fisher_radial": Case("noyau", setup_fisher_radial, (1000, 20_000)),
+    "rp": Case("noyau", setup_rp, (1, 64, 512)),
+    "ot_fisher": Case("noyau", setup_ot_fisher, ((32, 16), (64, 32))),
+    "ot_fisher_cold": Case("noyau", setup_ot_fisher_cold, ((64, 32), (128, 64), (256, 128))),
+    "ot_fisher_ml": Case("noyau", setup_ot_fisher_multilevel, ((64, 32), (128, 64), (256, 128))),
+    "sinkhorn": Case("noyau", setup_sinkhorn, ((8, 64), (64, 64), (8, 128))),
+}
+
+
+def case_id(name, size) -> str:
+    return name if size is None else f"{name}[{'x'.join(map(str, size)) if isinstance(size, tuple) else size}]"
+
+
+def peak_rss_kb() -> int:
+    """Pic de RSS (Ko) du processus et du plus gros de ses enfants."""
+    scale = 1024 if sys.platform == "darwin" else 1  # macOS compte en octets
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    child_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale
+    return max(self_kb, child_kb)
+
+
+def cpu_seconds() -> float:
+    child = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return process_time() + child.ru_utime + child.ru_stime
+
+
+def run_child(name: str, index: int):
+    """Point d'entrée du processus de mesure : un cas, une taille, une exécution."""
+    repo = Path(__file__).resolve().parent
+    sys.path.insert(0, str(repo))
+    os.chdir(tempfile.mkdtemp(prefix="bench-"))  # OUTPUT_DIR et cache relatifs : à froid
+    try:
+        fn = CASES[name].setup(CASES[name].sizes[index])
+        if fn is None:
+            print(json.dumps({"skipped": "outil ou dépendance absent"}))
+            return
+        cpu0, wall0 = cpu_seconds(), perf_counter()
+        fn()
+        wall, cpu = perf_counter() - wall0, cpu_seconds() - cpu0
+        print(json.dumps({"wall": wall, "cpu": cpu, "rss_kb": peak_rss_kb()}))
+    finally:
+        shutil.rmtree(os.getcwd(), ignore_errors=True)
+
+
+def measure(name: str, index: int, repeat: int):
+    """Médianes (temps mural, CPU, pic RSS) de `repeat` exécutions dans des processus neufs."""
+    runs = []
+    for _ in range(repeat):
+        res = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--child", name, str(index)],
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        lines = res.stdout.strip().splitlines()
+        if res.returncode != 0 or not lines:
+            return {"error": (res.stderr.strip().splitlines() or ["échec"])[-1]}
+        data = json.loads(lines[-1])
+        if "skipped" in data:
+            return data
+        runs.append(data)
+    return {key: median(r[key] for r in runs) for key in ("wall", "cpu", "rss_kb")} | {"runs": repeat}
+
+
+def git_revision() -> str | None:
+    try:
+        res = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).resolve().parent,
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except OSError:
+        return None
+    return res.stdout.strip() or None
+
+
+def compare(results: dict, baseline: dict):
+    """Cas plus lents que la référence au-delà de la tolérance : [(id, avant, après)]."""
+    slower = []
+    for cid, res in results.items():
+        ref = baseline.get(cid)
+        if not ref or "wall" not in res or "wall" not in ref:
+            continue
+        if res["wall"] > ref["wall"] * (1 + REGRESSION_TOLERANCE) \
+                and res["wall"] - ref["wall"] > REGRESSION_MIN_SECONDS:
+            slower.append((cid, ref["wall"], res["wall"]))
+    return slower
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Mesure les étapes du build et les noyaux numériques.")
+    parser.add_argument("--only", metavar="CAS[,CAS...]", help="cas dont le nom contient ces motifs")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="exécutions par cas (médiane retenue)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre cette mesure comme référence")
+    parser.add_argument("--child", nargs=2, metavar=("CAS", "INDEX"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.child:
+        run_child(args.child[0], int(args.child[1]))
+        return
+
+    patterns = [p.strip() for p in args.only.split(",") if p.strip()] if args.only else None
+    results = {}
+    for name, case in CASES.items():
+        if patterns and not any(p in name for p in patterns):
+            continue
+        for index, size in enumerate(case.sizes):
+            cid = case_id(name, size)
+            res = results[cid] = measure(name, index, args.repeat)
+            if "wall" in res:
+                print(f"[OK] {cid:28s} {res['wall'] * 1e3:10.1f} ms  CPU {res['cpu'] * 1e3:10.1f} ms  "
+                      f"RSS {res['rss_kb'] / 1024:7.1f} Mo")
+            else:
+                print(f"[WARN] {cid:28s} {res.get('skipped') or res.get('error')}")
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    history_path, baseline_path = BENCH_DIR / "history.json", BENCH_DIR / "baseline.json"
+    try:
+        history = json.loads(history_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        history = []
+    history.append({"date": strftime("%Y-%m-%dT%H:%M:%S"), "git": git_revision(),
+                    "python": platform.python_version(), "machine": platform.machine(),
+                    "cpus": os.cpu_count(), "results": results})
+    history_path.write_text(json.dumps(history, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        baseline = {}
+    slower = compare(results, baseline)
+    for cid, before, after in slower:
+        print(f"[ERR] Régression {cid}: {before * 1e3:.1f} -> {after * 1e3:.1f} ms "
+              f"(+{(after / before - 1) * 100:.0f} %)")
+    if args.save_baseline:
+        baseline.update({cid: res for cid, res in results.items() if "wall" in res})
+        baseline_path.write_text(json.dumps(baseline, indent=1, ensure_ascii=False), encoding="utf-8")
+        print(f"[OK] Référence enregistrée: {baseline_path}")
+    elif not baseline:
+        print(f"[INFO] Pas de référence ({baseline_path}) : lancer avec --save-baseline")
+    print(f"[{'ERR' if slower else 'OK'}] {len(results)} mesure(s), historique: {history_path}")
+    sys.exit(1 if slower else 0)
+
+
+if __name__ == "__main__":
+    main()
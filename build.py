@@ -1,9 +1,22 @@
+import argparse
+import ast
+import filecmp
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from time import time
+from time import sleep, time
+from typing import NamedTuple
 
 def compile_with_latexmk():
     latexmk = which("latexmk")
@@ -27,9 +40,40 @@ OUTPUT_DIR = Path("output")
 BASENAME = "sonoluminescence"
 TEX_PATH = OUTPUT_DIR / f"{BASENAME}.tex"
 PDF_PATH = OUTPUT_DIR / f"{BASENAME}.pdf"
+SECTIONS_DIR = OUTPUT_DIR / "sections"  # un fichier \include par fragment
+DRAFT_BASENAME = f"{BASENAME}-draft"  # brouillon --only (ne touche pas au PDF complet)
+VARIANTS_DIR = OUTPUT_DIR / "variants"  # un répertoire de travail par variante (--batch)
+FIGURES_DIR = OUTPUT_DIR / "figures"  # figures générées (\generatedfigure)
+FIGURE_DPI = 200  # résolution des figures PNG (tracés denses)
+ASSETS_DIR = OUTPUT_DIR / "assets"  # images du dépôt optimisées (\includegraphics{assets/...})
+ASSET_PATTERNS = ("*.png", "*.jpg", "*.jpeg")  # images sources, à la racine du dépôt
+ASSET_DPI = 300  # résolution d'impression visée
+ASSET_MAX_WIDTH_IN = 6.3  # largeur de texte A4 avec marges de 1 in
+ASSET_JPEG_QUALITY = 85
+ASSET_PNG_AS_JPEG = False  # True : PNG opaques réencodés en JPEG (avec perte)
+OPTIMIZE_ASSETS = False  # True : étape images dans build() (le document n'en inclut aucune)
+COMPRESS_PDF = True  # flux d'objets via qpdf s'il est installé
 USE_LATEXMK_IF_AVAILABLE = True
-RUNS_WITH_PDFLATEX = 2  # 2 passes pour TOC/références simples
+MAX_PDFLATEX_PASSES = 4  # passes jusqu'au point fixe des .aux/.toc/.out
+AUX_EXTS = (".aux", ".toc", ".out", ".lof", ".lot")
 SHELL = False  # sécurité
+QUIET = False  # True: sortie LaTeX masquée, seule la fin du log est affichée en cas d'échec
+LOG_TAIL_LINES = 200  # lignes conservées en mémoire pour le rapport d'erreur
+LOG_REPORT_LIMIT = 20  # enregistrements du .log affichés par catégorie
+WATCH_POLL_INTERVAL = 0.2  # s, polling si inotify_simple n'est pas installé
+WATCH_DEBOUNCE = 0.15  # s de calme avant de recompiler (rafales d'enregistrements)
+USE_BUILD_CACHE = True
+CACHE_DIR = OUTPUT_DIR.parent / ".build-cache"  # à côté de OUTPUT_DIR
+CACHE_MAX_ENTRIES = 32  # PDF conservés (les plus anciens sont purgés)
+USE_PREAMBLE_FORMAT = True  # préambule précompilé en .fmt via mylatexformat
+DUMP_END = "\\usepackage{hyperref}"  # le format s'arrête avant hyperref
+# paramètres des valeurs calculées (<<nom>> dans latex_content, cf. render)
+DOC_PARAMS = {"f": 26e3, "p0": 101325.0, "rho_L": 1000.0, "gamma": 5 / 3,
+              "T0": 300.0, "T_ion": 5000.0,
+              # bulle d'argon SBSL simulée (rayleigh_plesset), bien en dessous de la résonance
+              "R0_bubble": 4.5e-6, "Pa": 1.2 * 101325.0}
+VALUES_CACHE = CACHE_DIR / "values.json"  # mémo des valeurs par empreinte des entrées
+VALUES_MEMO_KEEP = 16  # empreintes gardées par valeur (variantes --batch), les plus récentes
 # --------------------------------
 
 # Contenu LaTeX (suite)
@@ -43,7 +87,20 @@ latex_content = r"""
 \usepackage{amsfonts}
 \usepackage{amssymb}
 \usepackage{fancyhdr}
-\usepackage{hyperref}
+\usepackage{enumitem}
+\usepackage{bm}            
+\usepackage{booktabs}         % Pour des tableaux professionnels
+\usepackage{array}            % Pour contrôler la largeur des colonnes
+\usepackage{graphicx}         % Pour redimensionner le tableau si nécessaire
+\usepackage{physics}
+\usepackage{tabularx}
+\usepackage{siunitx}
+\usepackage{caption} % pour \captionof{figure}{...}
+\usepackage{empheq} % optionnel, pour les boîtes stylisées
+\sisetup{per-mode=symbol}
+% figures produites par build.py (omises si matplotlib n'est pas installé)
+\newcommand{\generatedfigure}[2]{\IfFileExists{#1}{\begin{center}\includegraphics[width=0.8\linewidth]{#1}\captionof{figure}{#2}\end{center}}{}}
+\usepackage{hyperref} % chargé en dernier, hors du format précompilé
 \hypersetup{
     colorlinks = true,      % active les couleurs au lieu des boîtes
     linkcolor = black,      % couleur des liens internes (sections, figures...)
@@ -56,17 +113,6 @@ latex_content = r"""
     pdfsubject={Sonoluminescence, Transport Optimal, Fisher Information},
     pdfkeywords={sonoluminescence, OT, Fisher, L-BFGS, thermodynamics}
 }
-\usepackage{enumitem}
-\usepackage{bm}            
-\usepackage{booktabs}         % Pour des tableaux professionnels
-\usepackage{array}            % Pour contrôler la largeur des colonnes
-\usepackage{graphicx}         % Pour redimensionner le tableau si nécessaire
-\usepackage{physics}
-\usepackage{tabularx}
-\usepackage{siunitx}
-\usepackage{caption} % pour \captionof{figure}{...}
-\usepackage{empheq} % optionnel, pour les boîtes stylisées
-\sisetup{per-mode=symbol}
 % Configuration de la page
 \pagestyle{fancy}
 \fancyhf{}
@@ -528,15 +574,15 @@ k_B T &\approx \frac{\lambda I_F}{N} \\
 \captionof{figure}{Relation entre l'information de Fisher \( I_F \), la température \( T \), et l'échelle critique \( r_c \). Cette chaîne thermodynamique relie la concentration spatiale (via \( I_F \)) à l’énergie thermique du plasma, fixant la taille minimale de la bulle chaude.}
 \label{eq:if-t-rc}
 
-L'équation fournie dérive précisément l'échelle critique \( r_c \) (rayon minimal au collapse de la bulle) à partir de la compression adiabatique d'un gaz parfait, en utilisant la relation thermodynamique \( T V^{\gamma - 1} = \) const. (avec \( \gamma = 5 / 3 \) pour monoatomique, donc exposant \( 3(\gamma - 1) = 2 \)) et la formule de Minnaert pour le rayon d'équilibre \( R_0 \), reliant à la fréquence de résonance ~25–30 kHz en sonoluminescence. Cela s'intègre parfaitement au cadre OT-Fisher : \( r_c \) fixe l'échelle spatiale où \( I_F \propto 1 / r_c^2 \), et la température \( T \sim \SI{5000}{\kelvin} \) chauffe le plasma pour l'émission lumineuse, avec l'équation \( k_B T \approx \lambda I_F^{(1)} \) (où \( I_F^{(1)} \propto 1 / r_c^2 \)). La dérivation confirme \( r_c \sim \SIrange{0.1}{1}{\micro\meter} \) pour des paramètres expérimentaux standards (\( P_0 \sim \SI{1}{\atm} \), \( \rho_L \sim \SI{1000}{\kilogram\per\meter\cubed} \), \( T_0 \sim \SI{300}{\kelvin} \)), cohérente avec les observations et la régularisation Fisher évitant \( r_c = 0 \).
+L'équation fournie dérive précisément l'échelle critique \( r_c \) (rayon minimal au collapse de la bulle) à partir de la compression adiabatique d'un gaz parfait, en utilisant la relation thermodynamique \( T V^{\gamma - 1} = \) const. (avec \( \gamma = 5 / 3 \) pour monoatomique, donc exposant \( 3(\gamma - 1) = 2 \)) et la formule de Minnaert pour le rayon d'équilibre \( R_0 \), reliant à la fréquence de résonance ~25–30 kHz en sonoluminescence. Cela s'intègre parfaitement au cadre OT-Fisher : \( r_c \) fixe l'échelle spatiale où \( I_F \propto 1 / r_c^2 \), et la température \( T \sim \SI{<<T_ion>>}{\kelvin} \) chauffe le plasma pour l'émission lumineuse, avec l'équation \( k_B T \approx \lambda I_F^{(1)} \) (où \( I_F^{(1)} \propto 1 / r_c^2 \)). Pour les paramètres du document (\( f = \SI{<<f_kHz>>}{\kilo\hertz} \), \( p_0 = \SI{<<p0>>}{\pascal} \), \( \rho_L = \SI{<<rho_L>>}{\kilogram\per\meter\cubed} \), \( T_0 = \SI{<<T0>>}{\kelvin} \)), la dérivation donne \( R_0 \approx <<R0_um>>\,\mu\text{m} \) et \( r_c \approx <<r_c_um>>\,\mu\text{m} \) : le rayon de Minnaert est une borne haute, les bulles de sonoluminescence stable étant pilotées bien en dessous de la résonance (simulation Rayleigh–Plesset ci-dessous) ; la régularisation Fisher évite \( r_c = 0 \).
 \subsection{Dérivation de la Formule pour \( r_c \)}
 \begin{itemize}
-    \item Compression Adiabatique : pour un gaz idéal dans la bulle (volume \( V \propto r^3 \)), la relation adiabatique \( P V^\gamma = \) const. implique \( T V^{\gamma - 1} = \) const., ou \( T r^{3(\gamma - 1)} = \) const. Avec \(\gamma = 5/3\), \( 3(\gamma - 1) = 2 \), donc : \( T = T_0 (R_0 / r)^2 \implies r_c = R_0 \sqrt{T_0 / T} \), où \( T_0 \sim 300 \) K (température ambiante), \( T \sim 5000 \) K (température effective au plasma, mesurée spectralement). Cela prédit un resserrement violent : pour \( R_0 \sim 10 \) μm, \( r_c \sim R_0 / \sqrt{T / T_0} \sim R_0 / 4 \sim 2.5 \) μm (sans régularisation) ; en réalité, dissipation (viscosité, Fisher) limite à ~1 μm.
-    \item Rayon d'Équilibre \( R_0 \) : la bulle oscille à la fréquence de Minnaert (résonance acoustique) : \( f = \frac{1}{2 \pi R_0} \sqrt{\frac{3 \gamma p_0}{\rho_L}} \), où \( p_0 \sim 10^5 \) Pa (pression hydrostatique), \( \rho_L \sim 1000 \) kg/m³ (densité du liquide), \(\gamma \sim 1.4\) (pour air réel). Inversant pour \( f \sim 25 \) kHz (typique sonoluminescence) et \(\gamma \approx 1\) : \( R_0 \approx \frac{1}{2 \pi f} \sqrt{\frac{3 p_0}{\rho_L}} \approx 0.24 \cdot \frac{1}{f} \sqrt{\frac{3 p_0}{\rho_L}} \) (ou approx. \( R_0 \approx 1/(2 \pi \sqrt{3 p_0 / \rho_L}) \) pour \( f \) normalisé). Pour \( f = 25 \) kHz, \( p_0 = 10^5 \) Pa, \( \rho_L = 1000 \) kg/m³ : \(\sqrt{3 p_0 / \rho_L} \sim \sqrt{300} \sim 17\) m/s, \( R_0 \sim 1/(2 \pi \cdot 25000) \cdot 17 \sim 10^{-5} \) m = 10 μm, cohérent. La valeur se rapproche de 0.24 comme facteur numérique (ajusté pour \(\gamma\) et unités SI).
-    \item Pour \( T \approx 5000 \) K : substituant : \( r_c \approx 0.24 \cdot \frac{1}{2 \pi f} \sqrt{\frac{3 p_0}{\rho_L}} \cdot \frac{T_0}{T} \approx 0.24 \cdot R_0 \cdot \frac{300}{5000} \approx 0.24 \cdot R_0 \cdot 0.245 \approx 0.06 R_0 \sim 0.6 \, \mu m \), pour \( R_0 \sim 10 \) μm. Cela aligne avec les mesures : \( r_{\text{min}} \sim 0.5 - 1 \) μm avant plasma, où la vitesse de collapse \(\sim\) Mach 1-4 chauffe adiabatiquement. La légère différence (0.24 vs. 1/(2\(\pi\) f)) vient d'une approximation pour \( f \) fixe ; en pratique, \( f \) varie légèrement avec \( R_0 \).
+    \item Compression Adiabatique : pour un gaz idéal dans la bulle (volume \( V \propto r^3 \)), la relation adiabatique \( P V^\gamma = \) const. implique \( T V^{\gamma - 1} = \) const., ou \( T r^{3(\gamma - 1)} = \) const. Avec \(\gamma = 5/3\), \( 3(\gamma - 1) = 2 \), donc : \( T = T_0 (R_0 / r)^2 \implies r_c = R_0 \sqrt{T_0 / T} \), où \( T_0 = <<T0>> \) K (température ambiante), \( T = T_\text{ion} = <<T_ion>> \) K (seuil d'ionisation). Cela prédit un resserrement violent : \( r_c = <<ratio>>\, R_0 \) (sans régularisation), soit \( r_c \approx <<r_c_um>>\,\mu\text{m} \) pour le rayon de Minnaert ci-dessous.
+    \item Rayon d'Équilibre \( R_0 \) : la bulle oscille à la fréquence de Minnaert (résonance acoustique) : \( f = \frac{1}{2 \pi R_0} \sqrt{\frac{3 \gamma p_0}{\rho_L}} \), où \( p_0 \) est la pression hydrostatique, \( \rho_L \) la densité du liquide et \( \gamma \) l'exposant adiabatique du gaz. Inversant : \( R_0 = \frac{1}{2 \pi f} \sqrt{\frac{3 \gamma p_0}{\rho_L}} \). Pour \( f = <<f_kHz>> \) kHz, \( p_0 = <<p0>> \) Pa, \( \rho_L = <<rho_L>> \) kg/m³ et \( \gamma = <<gamma>> \) : \( R_0 \approx <<R0_um>>\,\mu\text{m} \). C'est le rayon de résonance linéaire ; une bulle SBSL (\( R_0 \) de quelques µm) est pilotée loin sous cette résonance, par une amplitude \( P_a > p_0 \).
+    \item Pour \( T = T_\text{ion} = <<T_ion>> \) K : substituant, \( r_c = \sqrt{T_0 / T_\text{ion}} \cdot \frac{1}{2 \pi f} \sqrt{\frac{3 \gamma p_0}{\rho_L}} \approx <<ratio>> \cdot R_0 \approx <<r_c_um>>\,\mu\text{m} \). Pour une bulle d'argon SBSL (\( R_0 = <<R0_bubble_um>>\,\mu\text{m} \), \( P_a = <<Pa_atm>> \) atm), l'intégration Rayleigh–Plesset donne au premier collapse \( R_\text{min} \approx <<R_min_um>>\,\mu\text{m} \) et \( T_\text{max} \approx <<T_max>> \) K, la vitesse de collapse chauffant le gaz adiabatiquement.
 \end{itemize}
 \subsection{Lien à l'Équation Physique OT-Fisher}
-Cette dérivation physique classique s'intègre au modèle informationnel : au collapse, \( r_c \) détermine l'échelle de \(\rho^*\) gaussienne, avec \( I_F^{(1)} = 6 \kappa \propto 1 / r_c^2 \) (\(\kappa = 1/(2 \sigma^2)\), \(\sigma \sim r_c\)). La pénalité Fisher \(\lambda I_F^{(N)} = \lambda N / r_c^2\) dissipe \( E_{ac} \approx (4 \pi / 3) R_0^3 P_a\) en chaleur, donnant l'équipartition : \( \frac{3}{2} N k_B T \approx \lambda I_F^{(N)} \), d'où par particule \( k_B T \approx \lambda I_F^{(1)} \). Pour \(\lambda \sim \nu \rho_L \sim 10^{-6} \, \text{m}^2/\text{s} \cdot 1000 \, \text{kg}/\text{m}^3 \sim 10^{-3} \, \text{kg}/(\text{m} \cdot \text{s})\) (viscosité eau), ajusté en J m² via unités, cela prédit \( T \sim 5000 \) K pour \( r_c \sim 1 \) μm et \( N \sim 10^8 \) (gaz dans bulle). La lumière jaillit quand \( T > \) seuil ionisation (~5000 K), avec spectre \( B(\nu, T) \sim T^4 \) sur échelle \( r_c / c \sim \) ps. Sans Fisher (\(\lambda = 0\)), \( r_c \rightarrow 0 \) et \( T \rightarrow \infty \) (singularité) ; avec, \( r_c \) finie équilibre OT (transport masse) et dissipation, résolue par L-BFGS pour \(\rho_t^*\). Cette formule est valide : pour \( T = 5000 \) K, \( r_c \sim 0.6 \) μm confirme le « star in a jar » miniature, unifiant acoustique, thermo et information.
+Cette dérivation physique classique s'intègre au modèle informationnel : au collapse, \( r_c \) détermine l'échelle de \(\rho^*\) gaussienne, avec \( I_F^{(1)} = 6 \kappa \propto 1 / r_c^2 \) (\(\kappa = 1/(2 \sigma^2)\), \(\sigma \sim r_c\)). La pénalité Fisher \(\lambda I_F^{(N)} = \lambda N / r_c^2\) dissipe \( E_{ac} \approx (4 \pi / 3) R_0^3 P_a\) en chaleur, donnant l'équipartition : \( \frac{3}{2} N k_B T \approx \lambda I_F^{(N)} \), d'où par particule \( k_B T \approx \lambda I_F^{(1)} \). Pour \(\lambda \sim \nu \rho_L \sim 10^{-6} \, \text{m}^2/\text{s} \cdot 1000 \, \text{kg}/\text{m}^3 \sim 10^{-3} \, \text{kg}/(\text{m} \cdot \text{s})\) (viscosité eau), ajusté en J m² via unités, cela prédit \( T \sim 5000 \) K pour \( r_c \sim 1 \) μm et \( N \sim 10^8 \) (gaz dans bulle). La lumière jaillit quand \( T > \) seuil ionisation (\( <<T_ion>> \) K), avec spectre \( B(\nu, T) \sim T^4 \) sur échelle \( r_c / c \sim \) ps. Sans Fisher (\(\lambda = 0\)), \( r_c \rightarrow 0 \) et \( T \rightarrow \infty \) (singularité) ; avec, \( r_c \) finie équilibre OT (transport masse) et dissipation, résolue par L-BFGS pour \(\rho_t^*\). Pour \( T = <<T_ion>> \) K, la bulle simulée, comprimée à \( R_\text{min} \approx <<R_min_um>>\,\mu\text{m} \), illustre le « star in a jar » miniature, unifiant acoustique, thermo et information.
 \newpage
 % PAGE 16 - Équation dans le contexte de la sonoluminescence (Rayleigh-Plesset & cavitation)
 \section{Équation dans le contexte de la sonoluminescence}
@@ -555,19 +601,23 @@ pour la densité gaussienne normalisée $\rho^*(r) = (\kappa/\pi)^{3/2} \exp(-\k
 
 \medskip
 
-Ici, $\lambda$ est le coefficient de régularisation (viscosité ou diffusion quantique, $\sim 10^{-18}$ J~m$^2$ pour l'eau), et $r_c = 1/\sqrt{I_F^{(1)}} \sim 1\,\mu\text{m}$ représente l'échelle critique du spot chaud. Pour $N$ particules dans la bulle ($\sim 10^8$ molécules d'air), la formule généralisée est :
+Ici, $\lambda$ est le coefficient de régularisation (viscosité ou diffusion quantique) ; la compression adiabatique $T = T_0 (R_0/r_c)^2$ le fixe à $\lambda = k_B T_0 R_0^2 \approx <<lam_phys>>$~J~m$^2$ pour la bulle simulée ($R_0 = <<R0_bubble_um>>\,\mu\text{m}$), et $r_c = 1/\sqrt{I_F^{(1)}} \sim 1\,\mu\text{m}$ représente l'échelle critique du spot chaud. Pour $N$ particules dans la bulle ($\sim 10^8$ molécules d'air), la formule généralisée est :
 
 \begin{equation}
 k_B T \approx \frac{\lambda I_F^{(N)}}{N} = \lambda I_F^{(1)}
 \end{equation}
 
-Ce qui donne typiquement $T \sim 5000$--$10000\, \text{K}$ et un spectre $B(\nu, T)$ bleu-violet (pic $\sim 400$--$500$ nm), cohérent avec les observations expérimentales, sans recourir au bremsstrahlung ou à la recombinaison comme mécanismes principaux. La lumière est alors la "fingerprint" thermodynamique (signature spectrale) d'un plasma opaque à l'équilibre local.
+\generatedfigure{figures/fisher_rc.pdf}{Information de Fisher $I_F^{(1)} = 6\kappa$ de la gaussienne en fonction de $r_c = 1/\sqrt{I_F^{(1)}}$ et température $T = \lambda I_F^{(1)} / k_B = T_0 (R_0/r_c)^2$ associée ($\lambda = k_B T_0 R_0^2 \approx <<lam_phys>>$~J~m$^2$, $R_0 = <<R0_bubble_um>>\,\mu\text{m}$, $T_0 = <<T0>>$~K).}
+
+Ce qui donne typiquement $T \sim <<T_ion>>$--$<<T_max>>\, \text{K}$ (de $T_\text{ion}$ au maximum de la bulle simulée) et un spectre $B(\nu, T)$ visible à UV (pic du spectre intégré du flash simulé à $<<peak_nm>>$ nm), cohérent avec les observations expérimentales, sans recourir au bremsstrahlung ou à la recombinaison comme mécanismes principaux. La lumière est alors la "fingerprint" thermodynamique (signature spectrale) d'un plasma opaque à l'équilibre local.
+
+\generatedfigure{figures/planck_spectra.pdf}{Spectres de Planck $B_\lambda(\lambda, T)$ normalisés pour $T = <<T_ion>>$, 7500, 10\,000 et 20\,000~K (\texttt{planck.py}) ; les tirets marquent le pic de Wien.}
 
 \bigskip
 
 \textbf{Contexte spéficique à la sonoluminescence :}
 
-Dans la sonoluminescence, une bulle de gaz (air dissous, $R_0 \sim 10\,\mu\text{m}$) oscille sous ultrasons $\sim 25\,\text{kHz}$, subissant une expansion adiabatique puis un collapse violent (vitesse $\sim$ Mach 4), modélisé par l'équation de Rayleigh-Plesset :
+Dans la sonoluminescence, une bulle de gaz (argon, $R_0 = <<R0_bubble_um>>\,\mu\text{m}$) oscille sous ultrasons à $<<f_kHz>>\,\text{kHz}$, subissant une expansion adiabatique puis un collapse violent (vitesse $\sim$ Mach 4), modélisé par l'équation de Rayleigh-Plesset :
 
 \begin{equation}
 R \frac{d^2R}{dt^2} + \frac{3}{2}\left(\frac{dR}{dt}\right)^2 = \frac{1}{\rho_L} \left[ \left(P_0 + \frac{2\sigma}{R} - P_v \right)\left( \frac{R_0}{R} \right)^{3\gamma} - 4\mu \frac{dR}{dt} - P_a \sin(2\pi f t)\right]
@@ -575,19 +625,21 @@ R \frac{d^2R}{dt^2} + \frac{3}{2}\left(\frac{dR}{dt}\right)^2 = \frac{1}{\rho_L}
 
 où $\rho_L$ est la densité du liquide, $\mu$ la viscosité, $\sigma$ la tension superficielle, $P_0$ la pression ambiante, $P_v$ la pression vapeur, $P_a$ l'amplitude acoustique ($\sim 1$–$1.5$ atm), $f$ la fréquence, et $\gamma \sim 1.4$ (coefficient adiabatique).
 
-À $r_c \sim 0{,}5$–$1\,\mu\text{m}$, l'énergie acoustique $E_\text{ac} \approx P_a \times \tfrac{4\pi}{3} R_0^3$ ($\sim 10^{-10}$ J) concentre $\sim 10^6$–$10^9$ atomes, chauffés à $T$ via la compression adiabatique $T \propto (R_0/r_c)^2$, mais limitée par la dissipation ($\mu$, analogue $\lambda$ Fisher).
+\generatedfigure{figures/rp_collapse.pdf}{Rayon $R(t)$ d'une bulle d'argon ($R_0 = <<R0_bubble_um>>\,\mu\text{m}$, $P_a = <<Pa_atm>>$ atm, $f = <<f_kHz>>$ kHz) sur une période acoustique, intégré par \texttt{rayleigh\_plesset.py} : expansion pendant la dépression puis collapse inertiel jusqu'à $R_\text{min} \approx <<R_min_um>>\,\mu\text{m}$ et rebonds.}
+
+À $R_\text{min} \approx <<R_min_um>>\,\mu\text{m}$ (simulation), l'énergie acoustique $E_\text{ac} \approx P_a \times \tfrac{4\pi}{3} R_0^3$ ($\sim 10^{-10}$ J) concentre $\sim 10^6$–$10^9$ atomes, chauffés à $T$ via la compression adiabatique $T \propto (R_0/r_c)^2$, mais limitée par la dissipation ($\mu$, analogue $\lambda$ Fisher).
 
-Le flash ($\sim 50$ ps, $\sim 10^6$ photons) correspond à cette transition, le spectre $B(\nu, T)$ permettant d'imprimer la fingerprint thermodynamique : pic UV-visible pour $T \sim 5200$~K (air), largeur spectrale typique $\Delta\lambda \sim h c/(k_B T r_c)$.
+Le flash correspond à cette transition : dans la simulation, le gaz reste au-dessus de $T_\text{ion}$ pendant $<<flash_ps>>$ ps et le modèle de corps noir (\texttt{emission.py}) donne $<<photons>>$ photons entre 150 et 1500 nm, pic à $<<peak_nm>>$ nm ($T_\text{max} \approx <<T_max>>$~K). Les mesures donnent $\sim 50$--$300$ ps et $\sim 10^6$ photons : le modèle adiabatique, sans conduction thermique ni diffusion de gaz, surestime la durée. Le spectre $B(\nu, T)$ imprime la fingerprint thermodynamique, largeur spectrale typique $\Delta\lambda \sim h c/(k_B T r_c)$.
 
 \bigskip
 
 \textbf{Validation expérimentale :}
-Pour $f=26\,\text{kHz}$, $p_0=101325\,\text{Pa}$, $\rho_L=1000\,\text{kg}/\text{m}^3$, $\gamma=5/3$, $T_0=300$~K, $T_\text{ion}=5000$~K :
+Pour $f=<<f_kHz>>\,\text{kHz}$, $p_0=<<p0>>\,\text{Pa}$, $\rho_L=<<rho_L>>\,\text{kg}/\text{m}^3$, $\gamma=<<gamma>>$, $T_0=<<T0>>$~K, $T_\text{ion}=<<T_ion>>$~K :
 \[
-R_0 \approx 4{,}9\,\mu\text{m} \qquad
-r_c \approx 4{,}9 \times \frac{300}{5000} \approx 1{,}2\,\mu\text{m}
+R_0 \approx <<R0_um>>\,\mu\text{m} \qquad
+r_c \approx <<R0_um>> \times \sqrt{\frac{<<T0>>}{<<T_ion>>}} \approx <<r_c_um>>\,\mu\text{m}
 \]
-Ce qui correspond parfaitement aux mesures en sonoluminescence.
+pour la bulle de résonance ; la bulle SBSL simulée ($R_0 = <<R0_bubble_um>>\,\mu\text{m}$, $P_a = <<Pa_atm>>$ atm) atteint $R_\text{min} \approx <<R_min_um>>\,\mu\text{m}$, $T_\text{max} \approx <<T_max>>$~K et un flash de $<<flash_ps>>$ ps.
 
 % =======================
 % PAGE 17 - Signature thermodynamique de la lumière (modèle expérimental)
@@ -601,16 +653,18 @@ r_c = R_0 \sqrt{\frac{T_0}{T}}, \quad \text{où} \quad R_0 = \frac{1}{2\pi f} \s
 \captionof{figure}{Échelle critique \( r_c \) dérivée du modèle Rayleigh-Plesset pour une bulle cavitante : elle relie le rayon minimal au collapse à la température initiale \( T_0 \), à la température finale \( T \), et aux paramètres acoustiques (\( f \)), thermodynamiques (\( \gamma \)) et fluides (\( p_0, \rho_L \)).}
 \label{eq:rc-rayleigh-plesset}
 
-Pour une température de plasma \( T \approx \SI{5000}{\kelvin} \) (seuil d'ionisation), cette relation devient :
+Pour une température de plasma \( T \approx \SI{<<T_ion>>}{\kelvin} \) (seuil d'ionisation), cette relation devient :
 \begin{equation}
 \boxed{
-r_c \approx 0.24 \cdot \frac{1}{2\pi f} \sqrt{\frac{3\gamma p_0}{\rho_L}}
+r_c \approx <<ratio>> \cdot \frac{1}{2\pi f} \sqrt{\frac{3\gamma p_0}{\rho_L}}
 }
 \end{equation}
-\captionof{figure}{Estimation numérique de \( r_c \) pour \( T = \SI{5000}{\kelvin} \), où le facteur 0.24 provient de \( \sqrt{T_0 / T} \) avec \( T_0 = \SI{300}{\kelvin} \). Cette échelle (~0.1–1 µm) correspond à la taille observée de la bulle chaude émettant la lumière.}
+\captionof{figure}{Estimation numérique de \( r_c \) pour \( T = \SI{<<T_ion>>}{\kelvin} \), où le facteur <<ratio>> provient de \( \sqrt{T_0 / T} \) avec \( T_0 = \SI{<<T0>>}{\kelvin} \). Avec \( R_0 \) de Minnaert (\( <<R0_um>>\,\mu\text{m} \)), cette échelle vaut \( <<r_c_um>>\,\mu\text{m} \) ; la bulle chaude observée est plus petite, la bulle SBSL étant pilotée loin sous la résonance.}
 \label{eq:rc-numerique}
 
-Voici l'équation de la signature thermodynamique de la lumière, dans le cadre du collapse inertiel d'une bulle (modèle Rayleigh-Plesset), reliant le rayon critique $r_c$ au seuil d'ionisation du gaz ($T \geq \SI{5000}{\kelvin}$) :
+\generatedfigure{figures/rc_map.png}{Rayon critique $r_c = R_0 \sqrt{T_0 / T_\text{ion}}$ (en µm) en fonction de la fréquence $f$ et du seuil $T_\text{ion}$, avec $R_0$ de Minnaert (\texttt{sweep.py}).}
+
+Voici l'équation de la signature thermodynamique de la lumière, dans le cadre du collapse inertiel d'une bulle (modèle Rayleigh-Plesset), reliant le rayon critique $r_c$ au seuil d'ionisation du gaz ($T \geq \SI{<<T_ion>>}{\kelvin}$) :
 \begin{equation}
 r_c = R_0 \sqrt{\frac{T_0}{T_\text{ion}}}
 \qquad\text{avec}\qquad
@@ -619,13 +673,13 @@ R_0 = \frac{1}{2 \pi f} \sqrt{\frac{3\gamma p_0}{\rho_L}}
 
 où :
 \begin{itemize}
-    \item $r_c$ : rayon critique à l'ionisation (cible, $\sim 1\,\mu\text{m}$)
+    \item $r_c$ : rayon critique à l'ionisation ($<<r_c_um>>\,\mu\text{m}$ pour $R_0$ de Minnaert)
     \item $f$ : fréquence acoustique
     \item $p_0$ : pression du liquide
     \item $\rho_L$ : masse volumique (eau : 1000 kg/m³)
     \item $\gamma$ : adiabatique du gaz (Ar : 5/3)
-    \item $T_0$ : température initiale (~300~K)
-    \item $T_\text{ion}$ : seuil d'ionisation (~5000~K)
+    \item $T_0$ : température initiale ($<<T0>>$~K)
+    \item $T_\text{ion}$ : seuil d'ionisation ($<<T_ion>>$~K)
 \end{itemize}
 
 S'il est mesuré ou simulé $r_c$ :
@@ -633,21 +687,21 @@ S'il est mesuré ou simulé $r_c$ :
 T = T_0 \left( \frac{R_0}{r_c} \right)^2
 \end{equation}
 
-L'émission lumineuse commence dès que $T \geq T_\text{ion} \approx 5000$~K.
+L'émission lumineuse commence dès que $T \geq T_\text{ion} = <<T_ion>>$~K.
 
 \bigskip
 
 \textbf{Dérivation et validation :}
-La formule provient de la résonance de Minnaert (Rayleigh–Plesset linéarisé) et de la compression adiabatique. Valeurs typiques : $f = 26000$~Hz, $p_0 = 101325$~Pa, $\rho_L = 1000$~kg/m³, $\gamma = 5/3$, $T_0 = 300$~K, $T_\text{ion} = 5000$~K :
+La formule provient de la résonance de Minnaert (Rayleigh–Plesset linéarisé) et de la compression adiabatique. Valeurs typiques : $f = <<f_Hz>>$~Hz, $p_0 = <<p0>>$~Pa, $\rho_L = <<rho_L>>$~kg/m³, $\gamma = <<gamma>>$, $T_0 = <<T0>>$~K, $T_\text{ion} = <<T_ion>>$~K :
 \[
-R_0 \approx 4{,}9\,\mu\text{m} \qquad r_c \approx 1{,}2\,\mu\text{m}
+R_0 \approx <<R0_um>>\,\mu\text{m} \qquad r_c \approx <<r_c_um>>\,\mu\text{m}
 \]
-Ce qui correspond aux mesures optiques et spectrales sur la sonoluminescence stable.
+Ces valeurs bornent la bulle de résonance ; les bulles de sonoluminescence stable, de quelques µm, sont pilotées loin sous la résonance ($R_0 = <<R0_bubble_um>>\,\mu\text{m}$ : $R_\text{min} \approx <<R_min_um>>\,\mu\text{m}$ en simulation).
 
 \bigskip
 
 \textbf{Mécanismes physiques principaux :}
-À $r_c \sim 1\,\mu\text{m}$ et $T \gtrsim 5000\,\text{K}$, le gaz est partiellement ionisé (N $\sim 10^8$~atomes) ; la lumière provient principalement de :
+À $R_\text{min} \approx <<R_min_um>>\,\mu\text{m}$ et $T \gtrsim <<T_ion>>\,\text{K}$, le gaz est partiellement ionisé (N $\sim 10^8$~atomes) ; la lumière provient principalement de :
 \begin{itemize}
     \item \textbf{Bremsstrahlung} (ion-électron) : lors de collisions Coulomb (rayonnement de freinage, spectre UV-visible à haute température)
     \item \textbf{Recombinaison} : photons par capture radiative (lignes spectrales masquées)
@@ -659,7 +713,7 @@ Le spectre est un continuum quasi-thermal (pas tout à fait corps noir, opacité
 \bigskip
 
 \textbf{Utilisation pratique :}
-Fixer $f$, $p_0$ et le gaz ; augmenter $P_a$ jusqu'à $r_c \sim 1\,\mu\text{m}$ (lumière); l'équation te donne quelle combinaison $(f, p_0, \gamma)$ permet d'obtenir le seuil.
+Fixer $f$, $p_0$ et le gaz ; augmenter $P_a$ jusqu'à ce que $T_\text{max}$ dépasse $T_\text{ion}$ (lumière : $P_a = <<Pa_atm>>$ atm donne $T_\text{max} \approx <<T_max>>$~K pour $R_0 = <<R0_bubble_um>>\,\mu\text{m}$); l'équation te donne quelle combinaison $(f, p_0, \gamma)$ permet d'obtenir le seuil.
 
 \bigskip
 
@@ -938,75 +992,1099 @@ AI : Qwen, Grok 4, Gemini, ChatGPT, Perplexity, Mistral Lechat.
 def which(cmd: str) -> str | None:
     return shutil.which(cmd)
 
-def run(cmd, cwd=None, env=None):
+def run(cmd, cwd=None, env=None, quiet=None):
+    """Exécute `cmd` en relayant sa sortie au fil de l'eau.
+
+    Seules les LOG_TAIL_LINES dernières lignes sont gardées en mémoire : elles
+    sont réaffichées en cas d'échec lorsque la sortie a été masquée (quiet).
+    """
     print(f"[RUN] {' '.join(cmd)}")
-    try:
-        res = subprocess.run(
-            cmd,
-            cwd=cwd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=False,            # capture en bytes
-            shell=False,
-            env=env,
-        )
-        # Décodage tolérant pour affichage console uniquement
-        out_text = res.stdout.decode("utf-8", errors="replace")
-        print(out_text)
-        return True
-    except subprocess.CalledProcessError as e:
-        print("=== Build failed ===")
-        out_text = (e.stdout or b"").decode("utf-8", errors="replace")
-        print(out_text)
+    quiet = QUIET if quiet is None else quiet
+    tail = deque(maxlen=LOG_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,  # lecture en bytes
+        shell=False,
+        env=env,
+    )
+    with proc.stdout:
+        # readline borné : même une ligne géante ne fait pas grossir la mémoire
+        for raw in iter(lambda: proc.stdout.readline(8192), b""):
+            # Décodage tolérant pour affichage console uniquement
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            tail.append(line)
+            if not quiet:
+                print(line, flush=True)
+    if proc.wait() != 0:
+        print(f"=== Build failed (code {proc.returncode}) ===")
+        if quiet:
+            print("\n".join(tail))
         return False
+    return True
 
 def ensure_output_dir():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-def write_tex():
-    TEX_PATH.write_text(latex_content, encoding="utf-8")
-    print(f"[OK] Écrit: {TEX_PATH}")
+def write_if_changed(path: Path, text: str) -> bool:
+    # N'écrit que si le contenu change : le mtime reste stable sinon
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+# ------------ Valeurs calculées ------------
+PLACEHOLDER_RE = re.compile(r"<<(\w+)>>")
+
+class Value(NamedTuple):
+    compute: object     # fonction des paramètres nommés dans `inputs`
+    inputs: tuple       # clés de DOC_PARAMS
+    fmt: str            # spécification de format ("," décimale -> {,} LaTeX, "x" puissance de 10)
+    engines: tuple = () # modules numériques dont le source entre dans la clé du mémo
+
+def _minnaert_um(f, p0, rho_L, gamma):
+    from sweep import minnaert_radius
+    return float(minnaert_radius(f, p0, rho_L, gamma)) * 1e6
+
+def _critical_um(f, p0, rho_L, gamma, T0, T_ion):
+    from sweep import critical_radius
+    return float(critical_radius(_minnaert_um(f, p0, rho_L, gamma), T0, T_ion))
+
+def _gamma_fraction(gamma):
+    from fractions import Fraction
+    frac = Fraction(gamma).limit_denominator(10)
+    return str(frac) if abs(float(frac) - gamma) < 1e-9 else f"{gamma:g}"
+
+@functools.lru_cache(maxsize=8)
+def _collapse(R0_bubble, Pa, f, p0, rho_L, gamma, T0, T_ion):
+    """Premier collapse de la bulle simulée : une intégration pour toutes les valeurs <<...>>."""
+    from emission import collapse_emission
+    from rayleigh_plesset import HARD_CORE_AR, Medium, integrate
+    medium = Medium(rho_L=rho_L, P0=p0, gamma=gamma, T0=T0, hard_core=HARD_CORE_AR)
+    res = integrate(R0_bubble, Pa, f, n_out=0, rtol=1e-6, medium=medium, T_ion=T_ion,
+                    dense_T=T_ion, dense_dt=5e-12)
+    light = collapse_emission(res, R0_bubble, medium, T_min=T_ion)
+    return {"R_min_um": float(res.R_min[0]) * 1e6, "T_max": float(res.T_max[0]),
+            "flash_ps": float(res.flash[0]) * 1e12, "photons": float(light.photons[0]),
+            "peak_nm": float(light.peak[0]) * 1e9}
+
+SIM_INPUTS = ("R0_bubble", "Pa", "f", "p0", "rho_L", "gamma", "T0", "T_ion")
+SIM_ENGINES = ("rayleigh_plesset", "emission", "planck")
+
+def _lambda_phys(T0, R0_bubble):
+    """λ = k_B T0 R0² (J·m²) : k_B T = λ I_F coïncide avec T = T0 (R0/r_c)², r_c = 1/√I_F."""
+    return 1.380649e-23 * T0 * R0_bubble**2
+
+def _simulated(name):
+    return Value(lambda *args: _collapse(*args)[name], SIM_INPUTS,
+                 {"R_min_um": ",.2f", "T_max": ".0f", "flash_ps": ".0f",
+                  "photons": "x", "peak_nm": ".0f"}[name], SIM_ENGINES)
+
+VALUES = {
+    "f_kHz": Value(lambda f: f / 1e3, ("f",), "g"),
+    "f_Hz": Value(lambda f: f, ("f",), ".0f"),
+    "p0": Value(lambda p0: p0, ("p0",), ".0f"),
+    "rho_L": Value(lambda rho_L: rho_L, ("rho_L",), ".0f"),
+    "gamma": Value(_gamma_fraction, ("gamma",), "s"),
+    "T0": Value(lambda T0: T0, ("T0",), ".0f"),
+    "T_ion": Value(lambda T_ion: T_ion, ("T_ion",), ".0f"),
+    "ratio": Value(lambda T0, T_ion: (T0 / T_ion) ** 0.5, ("T0", "T_ion"), ",.2f"),
+    "R0_um": Value(_minnaert_um, ("f", "p0", "rho_L", "gamma"), ",.1f", ("sweep",)),
+    "r_c_um": Value(_critical_um, ("f", "p0", "rho_L", "gamma", "T0", "T_ion"), ",.1f", ("sweep",)),
+    "R0_bubble_um": Value(lambda R0_bubble: R0_bubble * 1e6, ("R0_bubble",), ",.1f"),
+    "Pa_atm": Value(lambda Pa, p0: Pa / p0, ("Pa", "p0"), ",.2f"),
+    "lam_phys": Value(_lambda_phys, ("T0", "R0_bubble"), "x"),
+    **{name: _simulated(name) for name in ("R_min_um", "T_max", "flash_ps", "photons", "peak_nm")},
+}
 
-def compile_with_latexmk():
+def value_key(name: str, params: dict) -> str:
+    """Empreinte de (nom, entrées, source du moteur numérique) d'une valeur."""
+    spec = VALUES[name]
+    h = hashlib.sha256(name.encode("utf-8"))
+    h.update(json.dumps({k: params[k] for k in spec.inputs}, sort_keys=True).encode("utf-8"))
+    for engine in spec.engines:
+        h.update(Path(__file__).with_name(f"{engine}.py").read_bytes())
+    return h.hexdigest()
+
+def format_value(value, fmt: str) -> str:
+    if fmt == "x":  # 1{,}2 \times 10^{7} en mode mathématique
+        mantissa, exponent = f"{value:.1e}".split("e")
+        return f"{mantissa.replace('.', '{,}')} \\times 10^{{{int(exponent)}}}"
+    if fmt.startswith(","):  # décimale française en mode mathématique
+        return format(value, fmt[1:]).replace(".", "{,}")
+    return format(value, fmt)
+
+def render(content: str, params=None) -> str:
+    """Remplace les <<nom>> de `content` par les valeurs calculées (cf. VALUES).
+
+    Les valeurs issues d'un moteur numérique sont mémorisées sur disque sous
+    l'empreinte de leurs entrées : seules celles dont un paramètre (ou le
+    source du moteur) a changé sont recalculées. Le mémo est rangé par nom :
+    les noms sortis de VALUES sont retirés, et seules les VALUES_MEMO_KEEP
+    dernières empreintes utilisées de chaque nom sont gardées.
+    """
+    names = set(PLACEHOLDER_RE.findall(content))
+    if not names:
+        return content
+    params = {**DOC_PARAMS, **(params or {})}
+    try:
+        memo = json.loads(VALUES_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        memo = {}
+    # ancien format (empreinte -> valeur, sans nom) : repart de zéro
+    stored = {name: entries for name, entries in memo.items()
+              if name in VALUES and isinstance(entries, dict)}
+    dirty = stored != memo
+
+    text, computed = {}, 0
+    for name in sorted(names):
+        spec = VALUES.get(name)
+        if spec is None:
+            print(f"[WARN] Valeur inconnue: <<{name}>>")
+            text[name] = "??"
+            continue
+        args = [params[k] for k in spec.inputs]
+        if not spec.engines:
+            text[name] = format_value(spec.compute(*args), spec.fmt)
+            continue
+        key = value_key(name, params)
+        entries = stored.setdefault(name, {})
+        if key not in entries:
+            try:
+                entries[key] = spec.compute(*args)
+            except ImportError as e:
+                print(f"[WARN] <<{name}>> non calculable ({e}), remplacé par ??")
+                text[name] = "??"
+                continue
+            computed += 1
+            dirty = True
+        elif next(reversed(entries)) != key:
+            entries[key] = entries.pop(key)  # la plus récente en dernier
+            dirty = True
+        while len(entries) > VALUES_MEMO_KEEP:
+            del entries[next(iter(entries))]
+        text[name] = format_value(entries[key], spec.fmt)
+
+    if computed:
+        print(f"[INFO] {computed} valeur(s) recalculée(s), les autres depuis le mémo")
+    if dirty:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = VALUES_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(stored, indent=1), encoding="utf-8")
+        os.replace(tmp, VALUES_CACHE)
+    return PLACEHOLDER_RE.sub(lambda m: text[m.group(1)], content)
+
+# ------------ Figures ------------
+class FigureSpec(NamedTuple):
+    plot: object        # fonction (ax, **params), exécutée dans un worker
+    params: dict        # paramètres du tracé (entrent dans la clé de cache)
+    fmt: str            # "pdf" (vectoriel) ou "png" (tracés denses)
+    engines: tuple = () # modules numériques dont le source entre dans la clé
+
+def plot_collapse(ax, R0_bubble, Pa, f, p0, rho_L, gamma, T0, periods):
+    from rayleigh_plesset import HARD_CORE_AR, Medium, integrate
+    medium = Medium(rho_L=rho_L, P0=p0, gamma=gamma, T0=T0, hard_core=HARD_CORE_AR)
+    res = integrate([R0_bubble], [Pa], [f], periods=periods, n_out=1201, rtol=1e-6, medium=medium)
+    ax.plot(res.t[0] * 1e6, res.R[0] * 1e6, lw=1)
+    ax.set(xlabel="t (µs)", ylabel="R (µm)")
+
+def plot_planck(ax, temperatures, lam_min_nm, lam_max_nm):
+    import numpy as np
+    from planck import peak_wavelength, planck_lambda
+    lam = np.linspace(lam_min_nm, lam_max_nm, 400) * 1e-9
+    for T in temperatures:
+        B = planck_lambda(lam, T)
+        line, = ax.plot(lam * 1e9, B / B.max(), lw=1, label=f"{T:.0f} K")
+        ax.axvline(peak_wavelength(T) * 1e9, color=line.get_color(), ls="--", lw=0.6)
+    ax.set(xlabel="λ (nm)", ylabel="B_λ / max", xlim=(lam_min_nm, lam_max_nm))
+    ax.legend(frameon=False)
+
+def plot_fisher_rc(ax, r_c_min_um, r_c_max_um, R0_bubble, T0):
+    import numpy as np
+    from fisher import gaussian_fisher
+    r_c = np.geomspace(r_c_min_um, r_c_max_um, 200) * 1e-6
+    I_F = gaussian_fisher(1 / (6 * r_c**2))  # κ = 1/(6 r_c²) : r_c = 1/√I_F
+    ax.loglog(r_c * 1e6, I_F, lw=1)
+    ax.set(xlabel="r_c (µm)", ylabel="I_F (m⁻²)")
+    # T = λ I_F / k_B avec λ = k_B T0 R0² : T = T0 (R0/r_c)², même courbe graduée en K
+    twin = ax.twinx()
+    twin.set_yscale("log")
+    twin.set_ylim(*(np.array(ax.get_ylim()) * T0 * R0_bubble**2))
+    twin.set_ylabel("T (K)")
+
+def plot_rc_map(ax, f_min, f_max, T_min, T_max, n, p0, rho_L, gamma, T0):
+    import numpy as np
+    from sweep import critical_radius, minnaert_radius
+    f = np.linspace(f_min, f_max, n)
+    T = np.linspace(T_min, T_max, n)
+    r_c = critical_radius(minnaert_radius(f[None, :], p0, rho_L, gamma), T0, T[:, None])
+    mesh = ax.pcolormesh(f / 1e3, T, r_c * 1e6, shading="auto")
+    ax.figure.colorbar(mesh, ax=ax, label="r_c (µm)")
+    ax.set(xlabel="f (kHz)", ylabel="T_ion (K)")
+
+def figure_specs(params=None) -> dict:
+    """FigureSpec de chaque figure pour les paramètres du document (DOC_PARAMS surchargé par `params`).
+
+    Construites à chaque rendu : une variante qui surcharge un paramètre
+    obtient ses propres figures (et ses propres clés de cache).
+    """
+    p = {**DOC_PARAMS, **(params or {})}
+    return {
+        # une seule période : le premier collapse et ses rebonds
+        "rp_collapse": FigureSpec(plot_collapse, {**{k: p[k] for k in SIM_INPUTS if k != "T_ion"},
+                                                  "periods": 1.0},
+                                  "pdf", ("rayleigh_plesset",)),
+        "planck_spectra": FigureSpec(plot_planck, {"temperatures": (p["T_ion"], 7500.0, 10000.0, 20000.0),
+                                                   "lam_min_nm": 100.0, "lam_max_nm": 1000.0},
+                                     "pdf", ("planck",)),
+        "fisher_rc": FigureSpec(plot_fisher_rc, {"r_c_min_um": 0.1, "r_c_max_um": 10.0,
+                                                 "R0_bubble": p["R0_bubble"], "T0": p["T0"]},
+                                "pdf", ("fisher",)),
+        "rc_map": FigureSpec(plot_rc_map, {"f_min": 15e3, "f_max": 45e3, "T_min": p["T_ion"],
+                                           "T_max": 20000.0, "n": 300,
+                                           **{k: p[k] for k in ("p0", "rho_L", "gamma", "T0")}},
+                             "png", ("sweep",)),
+    }
+
+def figure_key(name: str, spec: FigureSpec) -> str:
+    """Empreinte (paramètres, code du tracé, source des moteurs, format) d'une figure."""
+    h = hashlib.sha256(name.encode("utf-8"))
+    h.update(json.dumps(spec.params, sort_keys=True).encode("utf-8"))
+    h.update(inspect.getsource(spec.plot).encode("utf-8"))
+    for engine in spec.engines:
+        h.update(Path(__file__).with_name(f"{engine}.py").read_bytes())
+    h.update(f"{spec.fmt}:{FIGURE_DPI}".encode("utf-8"))
+    return h.hexdigest()
+
+def cached_figure(name: str, spec: FigureSpec) -> Path:
+    return CACHE_DIR / "figures" / f"{figure_key(name, spec)}.{spec.fmt}"
+
+def render_figure(name: str, spec: FigureSpec, target: Path) -> str:
+    """Tâche du pool : trace une figure et l'écrit atomiquement dans `target`."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(6.0, 3.6))
+    spec.plot(ax, **spec.params)
+    fig.tight_layout()
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    # métadonnées figées : même entrée -> mêmes octets
+    if spec.fmt == "png":
+        fig.savefig(tmp, format="png", dpi=FIGURE_DPI, metadata={"Software": None},
+                    pil_kwargs={"optimize": True})
+    else:
+        fig.savefig(tmp, format="pdf", metadata={"CreationDate": None, "Producer": None})
+    plt.close(fig)
+    os.replace(tmp, target)
+    return name
+
+def plot_figures(tasks, jobs=None) -> set:
+    """Trace dans un pool les figures (nom, spec, fichier du cache) ; renvoie les fichiers en échec."""
+    failed = set()
+    if not tasks:
+        return failed
+    start = time()
+    (CACHE_DIR / "figures").mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_figure, name, spec, path): (name, path)
+                   for name, spec, path in tasks}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:  # une figure en échec n'empêche pas le document
+                name, path = futures[future]
+                print(f"[WARN] Figure {name}: {e!r}")
+                failed.add(path)
+    print(f"[OK] {len(tasks)} figure(s) tracée(s) en {time() - start:.1f} s")
+    return failed
+
+def render_figures(jobs=None, params=None):
+    """Trace dans un pool les figures absentes du cache, puis les copie dans FIGURES_DIR.
+
+    Les figures inchangées sont reprises du cache sans attente ; l'index
+    figures.json (nom -> empreinte) entre dans la clé du PDF.
+    """
+    if importlib.util.find_spec("matplotlib") is None:
+        print("[WARN] matplotlib absent : figures générées omises")
+        return
+    FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+    specs = figure_specs(params)
+    cached = {name: cached_figure(name, spec) for name, spec in specs.items()}
+    failed = plot_figures([(name, specs[name], path) for name, path in cached.items()
+                           if not path.exists()], jobs)
+
+    keys = {}
+    for name, path in cached.items():
+        target = FIGURES_DIR / f"{name}.{specs[name].fmt}"
+        if path in failed:
+            # \IfFileExists reprendrait sinon la version précédente
+            target.unlink(missing_ok=True)
+            continue
+        if not (target.exists() and filecmp.cmp(path, target, shallow=False)):
+            shutil.copy2(path, target)
+        keys[name] = path.stem
+    write_if_changed(FIGURES_DIR / "figures.json", json.dumps(keys, indent=1))
+
+# ------------ Images ------------
+def asset_settings() -> dict:
+    return {"dpi": ASSET_DPI, "width": ASSET_MAX_WIDTH_IN,
+            "quality": ASSET_JPEG_QUALITY, "png_as_jpeg": ASSET_PNG_AS_JPEG}
+
+def optimize_image(src: Path, target_stem: Path) -> Path:
+    """Réduit `src` à ASSET_DPI sur ASSET_MAX_WIDTH_IN, recompresse, retire les métadonnées.
+
+    Seul le profil ICC est conservé. Si le résultat n'est pas plus petit que
+    la source, la source est recopiée telle quelle.
+    """
+    from PIL import Image
+
+    with Image.open(src) as im:
+        im.load()
+        icc = im.info.get("icc_profile")
+        max_px = int(ASSET_DPI * ASSET_MAX_WIDTH_IN)
+        if im.width > max_px:
+            im = im.resize((max_px, round(im.height * max_px / im.width)), Image.LANCZOS)
+        opaque = im.mode in ("RGB", "L") or (im.mode == "RGBA" and im.getextrema()[3][0] == 255)
+        as_jpeg = src.suffix.lower() in (".jpg", ".jpeg") or (ASSET_PNG_AS_JPEG and opaque)
+        extra = {"icc_profile": icc} if icc else {}
+        if as_jpeg:
+            target = target_stem.with_suffix(".jpg")
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            im.convert("RGB" if im.mode != "L" else "L").save(
+                tmp, "JPEG", quality=ASSET_JPEG_QUALITY, optimize=True, progressive=True, **extra)
+        else:
+            target = target_stem.with_suffix(".png")
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            if im.mode == "RGBA" and opaque:
+                im = im.convert("RGB")  # canal alpha inutile
+            im.save(tmp, "PNG", optimize=True, **extra)
+    if tmp.stat().st_size >= src.stat().st_size:
+        tmp.unlink()
+        target = target_stem.with_suffix(src.suffix.lower())
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, target)
+    return target
+
+def optimize_assets():
+    """Optimise les images du dépôt dans ASSETS_DIR, avec cache sur l'empreinte de leur contenu.
+
+    Étape facultative (OPTIMIZE_ASSETS) : l'index assets.json (fichier -> entrée
+    du cache) n'entre dans la clé du PDF que si elle est activée.
+    """
+    root = Path(__file__).resolve().parent
+    sources = sorted({p for pattern in ASSET_PATTERNS for p in root.glob(pattern)})
+    if not sources:
+        return
+    if importlib.util.find_spec("PIL") is None:
+        print("[WARN] Pillow absent : images copiées sans optimisation")
+    cache = CACHE_DIR / "assets"
+    cache.mkdir(parents=True, exist_ok=True)
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    settings = json.dumps(asset_settings(), sort_keys=True).encode("utf-8")
+    suffixes = sorted({Path(pattern).suffix for pattern in ASSET_PATTERNS})
+
+    index, saved = {}, 0
+    for src in sources:
+        h = hashlib.sha256(src.read_bytes())
+        h.update(settings)
+        key = h.hexdigest()
+        # noms exacts : un glob attraperait les <key>.png.<pid>.tmp en cours d'écriture
+        hits = [p for p in (cache / f"{key}{suffix}" for suffix in suffixes) if p.exists()]
+        if hits:
+            cached = hits[0]
+        elif importlib.util.find_spec("PIL") is None:
+            cached = src
+        else:
+            cached = optimize_image(src, cache / key)
+            saved += src.stat().st_size - cached.stat().st_size
+        target = ASSETS_DIR / (src.stem + cached.suffix.lower())
+        if not (target.exists() and filecmp.cmp(cached, target, shallow=False)):
+            shutil.copy2(cached, target)
+        index[target.name] = cached.name if cached is not src else f"{key}:source"
+    for stale in ASSETS_DIR.iterdir():
+        if stale.name not in index and stale.name != "assets.json":
+            stale.unlink()
+    if saved:
+        print(f"[OK] Images optimisées : {saved / 1024:.0f} KB économisés")
+    write_if_changed(ASSETS_DIR / "assets.json", json.dumps(index, indent=1))
+
+def compress_pdf(path: Path):
+    """Recompresse `path` en flux d'objets (qpdf) ; conservé seulement s'il est plus petit."""
+    qpdf = which("qpdf")
+    if not (COMPRESS_PDF and qpdf):
+        return
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    cmd = [qpdf, "--object-streams=generate", "--compress-streams=y", "--recompress-flate",
+           "--compression-level=9", str(path), str(tmp)]
+    # code 3 : avertissements, le fichier produit reste valide
+    res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=SHELL)
+    if res.returncode in (0, 3) and tmp.exists() and tmp.stat().st_size < path.stat().st_size:
+        before = path.stat().st_size
+        os.replace(tmp, path)
+        print(f"[OK] PDF recompressé : {before / 1024:.0f} -> {path.stat().st_size / 1024:.0f} KB")
+    else:
+        tmp.unlink(missing_ok=True)
+
+# ------------ Fragments ------------
+class Fragment(NamedTuple):
+    name: str           # nom de fichier (sans .tex) dans SECTIONS_DIR
+    titles: tuple       # titres des \section contenus dans le fragment
+    body: str
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.body.encode("utf-8")).hexdigest()
+
+SECTION_RE = re.compile(r"^\\section\*?\{(.*)\}\s*$")
+
+def slugify(title: str) -> str:
+    text = re.sub(r"\\\(.*?\\\)|\\[a-zA-Z]+", " ", title)  # retire maths et macros
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:40].rstrip("-") or "section"
+
+def split_document(content: str):
+    """Découpe `content` en (préambule, [Fragment...]).
+
+    Un nouveau fragment commence à chaque \\newpage suivi (aux commentaires
+    près) d'un \\section : les sections qui ne débutent pas une page restent
+    attachées au fragment précédent, la mise en page est donc inchangée.
+    """
+    head, sep, rest = content.partition("\\begin{document}\n")
+    body = rest.rpartition("\\end{document}")[0]
+    lines = body.splitlines(keepends=True)
+
+    starts = [0]
+    for i, line in enumerate(lines):
+        if line.strip() != "\\newpage":
+            continue
+        j = i + 1
+        while j < len(lines) and (not lines[j].strip() or lines[j].lstrip().startswith("%")):
+            j += 1
+        if j < len(lines) and SECTION_RE.match(lines[j].strip()):
+            starts.append(i)
+    starts.append(len(lines))
+
+    fragments = []
+    for n, (a, b) in enumerate(zip(starts, starts[1:])):
+        chunk = lines[a:b]
+        titles = tuple(m.group(1) for m in map(SECTION_RE.match, map(str.strip, chunk)) if m)
+        slug = slugify(titles[0]) if titles else "front"
+        fragments.append(Fragment(f"{n:02d}-{slug}", titles, "".join(chunk)))
+    return head + sep, fragments
+
+def fragment_ref(fr: Fragment) -> str:
+    return f"{SECTIONS_DIR.name}/{fr.name}"
+
+def main_tex(preamble: str, fragments, only=None) -> str:
+    # \include (et non \input) : chaque fragment a son propre .aux, ce qui
+    # permet \includeonly. Les fragments commencent tous par \newpage, le
+    # \clearpage implicite ne change donc pas la mise en page.
+    # \endofdump marque la fin du préambule précompilé ; sans format il vaut \relax.
+    dumped, sep, late = preamble.partition(DUMP_END)
+    if not sep:
+        dumped, sep, late = preamble.partition("\\begin{document}")
+    preamble = f"{dumped}\\csname endofdump\\endcsname\n{sep}{late}"
+    if only is not None:
+        selected = ",".join(fragment_ref(fr) for fr in only)
+        head, sep, tail = preamble.partition("\\begin{document}")
+        preamble = f"{head}\\includeonly{{{selected}}}\n{sep}{tail}"
+    includes = "".join(f"\\include{{{fragment_ref(fr)}}}\n" for fr in fragments)
+    return preamble + includes + "\\end{document}\n"
+
+def select_fragments(fragments, patterns):
+    """Fragments dont un titre (ou le nom) contient l'un des motifs, sans casse."""
+    selected, unknown = [], []
+    for pattern in patterns:
+        key = pattern.casefold()
+        hits = [fr for fr in fragments
+                if key in fr.name.casefold() or any(key in t.casefold() for t in fr.titles)]
+        if not hits:
+            unknown.append(pattern)
+        selected += [fr for fr in hits if fr not in selected]
+    return selected, unknown
+
+def write_tex():
+    """Écrit le fichier maître et les fragments modifiés ; renvoie les fragments réécrits."""
+    preamble, fragments = split_document(render(latex_content))
+    SECTIONS_DIR.mkdir(parents=True, exist_ok=True)
+    index_path = SECTIONS_DIR / "fragments.json"
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+
+    changed = []
+    for fr in fragments:
+        path = SECTIONS_DIR / f"{fr.name}.tex"
+        if index.get(fr.name) != fr.digest or not path.exists():
+            path.write_text(fr.body, encoding="utf-8")
+            changed.append(fr)
+    names = {fr.name for fr in fragments}
+    for stale in SECTIONS_DIR.glob("*.tex"):
+        if stale.stem not in names:
+            stale.unlink()
+    index = {fr.name: fr.digest for fr in fragments}
+    write_if_changed(index_path, json.dumps(index, indent=1, ensure_ascii=False))
+
+    if write_if_changed(TEX_PATH, main_tex(preamble, fragments)):
+        print(f"[OK] Écrit: {TEX_PATH}")
+    for fr in changed:
+        print(f"[OK] Écrit: {SECTIONS_DIR / fr.name}.tex ({', '.join(fr.titles) or 'page de garde'})")
+    if not changed:
+        print(f"[OK] Aucun fragment modifié dans {SECTIONS_DIR}")
+    return changed
+
+# ------------ Cache de build ------------
+def compiler_cmd():
+    """Commande de compilation prioritaire (celle qui entre dans la clé de cache)."""
+    latexmk = which("latexmk")
+    if USE_LATEXMK_IF_AVAILABLE and latexmk:
+        return [latexmk, "-pdf", "-interaction=nonstopmode", BASENAME + ".tex"]
+    pdflatex = which("pdflatex")
+    if pdflatex:
+        return [pdflatex, "-interaction=nonstopmode", BASENAME + ".tex"]
+    return None
+
+def engine_version(engine: str) -> str:
+    """Première ligne de `engine --version`, mémorisée par (chemin, mtime, taille)."""
+    st = Path(engine).stat()
+    ident = f"{engine}:{st.st_mtime_ns}:{st.st_size}"
+    index_path = CACHE_DIR / "engines.json"
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+    if ident not in index:
+        res = subprocess.run([engine, "--version"], stdout=subprocess.PIPE,
+                             stderr=subprocess.STDOUT, shell=False)
+        lines = res.stdout.decode("utf-8", errors="replace").splitlines()
+        index[ident] = lines[0] if lines else ""
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # écriture atomique : plusieurs builds (--batch) partagent le cache
+        tmp = index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, indent=1), encoding="utf-8")
+        os.replace(tmp, index_path)
+    return index[ident]
+
+def build_key(max_passes=MAX_PDFLATEX_PASSES):
+    """Empreinte SHA-256 de (fichier maître + fragments, figures et images optimisées, commande, version du moteur TeX)."""
+    cmd = compiler_cmd()
+    engine = which("pdflatex")
+    if cmd is None or engine is None:
+        return None
+    h = hashlib.sha256()
+    h.update(TEX_PATH.read_bytes())
+    # les empreintes des fragments sont déjà dans l'index : pas de re-hachage
+    h.update((SECTIONS_DIR / "fragments.json").read_bytes())
+    # le chemin absolu de l'outil n'entre pas dans la clé, seulement son nom
+    h.update("\0".join([Path(cmd[0]).name] + cmd[1:]).encode("utf-8"))
+    h.update(str(max_passes).encode("utf-8"))
+    h.update(engine_version(engine).encode("utf-8"))
+    indexes = [FIGURES_DIR / "figures.json"] + ([ASSETS_DIR / "assets.json"] if OPTIMIZE_ASSETS else [])
+    for index in indexes:
+        if index.exists():
+            h.update(index.read_bytes())
+    return h.hexdigest()
+
+def restore_cached_pdf(key) -> bool:
+    cached = CACHE_DIR / f"{key}.pdf"
+    if not cached.exists():
+        return False
+    if not (PDF_PATH.exists() and filecmp.cmp(cached, PDF_PATH, shallow=False)):
+        shutil.copy2(cached, PDF_PATH)
+    os.utime(cached)  # marque l'entrée comme récemment utilisée
+    return True
+
+def store_cached_pdf(key):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+    shutil.copy2(PDF_PATH, tmp)
+    os.replace(tmp, CACHE_DIR / f"{key}.pdf")
+    entries = sorted(CACHE_DIR.glob("*.pdf"), key=lambda p: p.stat().st_mtime)
+    for old in entries[:-CACHE_MAX_ENTRIES]:
+        old.unlink(missing_ok=True)
+
+# ------------ Log TeX ------------
+class LogRecord(NamedTuple):
+    kind: str           # error, overfull, underfull, undefined, rerun
+    message: str
+    file: str | None    # fichier courant (pile des parenthèses du log)
+    line: int | None
+
+LOG_WIDTH = 79  # TeX coupe les lignes du .log à max_print_line = 79
+LOG_FILE_RE = re.compile(r"\(([^\s()]+\.(?:tex|sty|cls|clo|cfg|def|fd|ldf|aux|toc|out))|\(|\)")
+FILE_LINE_ERROR_RE = re.compile(r"^([^\s:]+\.tex):(\d+): (.*)")
+ERROR_LINE_RE = re.compile(r"^l\.(\d+)")
+BADBOX_RE = re.compile(r"^(Overfull|Underfull) (\\[hv]box .*?)(?: at lines? (\d+)|$)")
+UNDEFINED_RE = re.compile(r"(Reference|Citation) `(.+?)' on page \d+ undefined on input line (\d+)")
+# vraies demandes de recompilation (pas les bannières « Package: rerunfilecheck … Rerun checks »)
+RERUN_RE = re.compile(r"Rerun to get|Rerun LaTeX|\(rerunfilecheck\)\s+Rerun|Label\(s\) may have changed")
+
+def log_lines(path: Path):
+    """Lignes logiques du .log : les lignes coupées à LOG_WIDTH sont recollées."""
+    pending = ""
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for raw in fh:
+            raw = raw.rstrip("\r\n")
+            pending += raw
+            if len(raw) != LOG_WIDTH:
+                yield pending
+                pending = ""
+    if pending:
+        yield pending
+
+def parse_log(path: Path):
+    """Générateur d'enregistrements structurés, en une passe et en mémoire bornée."""
+    stack = []          # fichiers ouverts (None pour une parenthèse de texte)
+    error = None        # erreur en attente de son numéro de ligne « l.NNN »
+    wait = 0
+
+    def current_file():
+        return next((f for f in reversed(stack) if f), None)
+
+    for text in log_lines(path):
+        if error is not None:
+            m = ERROR_LINE_RE.match(text)
+            wait -= 1
+            if m or wait <= 0:
+                yield error._replace(line=int(m.group(1))) if m else error
+                error = None
+                if m:
+                    continue
+        m = FILE_LINE_ERROR_RE.match(text)
+        if m:
+            yield LogRecord("error", m.group(3), m.group(1), int(m.group(2)))
+        elif text.startswith("! "):
+            if error is not None:
+                yield error
+            error, wait = LogRecord("error", text[2:], current_file(), None), 10
+        elif text.startswith(("Overfull", "Underfull")):
+            m = BADBOX_RE.match(text)
+            if m:
+                line = int(m.group(3)) if m.group(3) else None
+                yield LogRecord(m.group(1).lower(), m.group(2), current_file(), line)
+        elif "undefined on input line" in text:
+            m = UNDEFINED_RE.search(text)
+            if m:
+                yield LogRecord("undefined", f"{m.group(1)} `{m.group(2)}'", current_file(), int(m.group(3)))
+        if RERUN_RE.search(text):
+            yield LogRecord("rerun", text.strip(), current_file(), None)
+        for m in LOG_FILE_RE.finditer(text):
+            token = m.group(0)
+            if token == ")":
+                if stack:
+                    stack.pop()
+            else:
+                stack.append(m.group(1))
+    if error is not None:
+        yield error
+
+def report_log(path: Path) -> Counter:
+    """Affiche les enregistrements du .log (limités par catégorie) et renvoie leur décompte."""
+    counts = Counter()
+    if not path.exists():
+        return counts
+    for rec in parse_log(path):
+        counts[rec.kind] += 1
+        if rec.kind in ("error", "undefined") and counts[rec.kind] <= LOG_REPORT_LIMIT:
+            where = f"{rec.file or '?'}:{rec.line}" if rec.line else (rec.file or "?")
+            tag = "ERR" if rec.kind == "error" else "WARN"
+            print(f"[{tag}] {where}: {rec.message}")
+    if counts:
+        print(f"[INFO] {path.name}: " + ", ".join(f"{k}={n}" for k, n in sorted(counts.items())))
+    return counts
+
+def needs_rerun(path: Path) -> bool:
+    return path.exists() and any(rec.kind == "rerun" for rec in parse_log(path))
+
+# ------------ Format précompilé ------------
+def preamble_format():
+    """Nom du format .fmt du préambule dans OUTPUT_DIR (construit si besoin), ou None.
+
+    Le nom contient l'empreinte du préambule précompilé et de la version du
+    moteur : il n'est reconstruit que lorsque l'un des deux change. Un échec
+    laisse un marqueur `<nom>.fail` : le même préambule n'est pas retenté.
+    """
+    pdflatex = which("pdflatex")
+    if not (USE_PREAMBLE_FORMAT and pdflatex):
+        return None
+    dumped = latex_content.partition(DUMP_END)[0]
+    h = hashlib.sha256(dumped.encode("utf-8"))
+    h.update(engine_version(pdflatex).encode("utf-8"))
+    name = f"{BASENAME}-preamble-{h.hexdigest()[:12]}"
+    if (OUTPUT_DIR / f"{name}.fmt").exists():
+        return name
+    failed = OUTPUT_DIR / f"{name}.fail"
+    if failed.exists():
+        return None
+
+    kpsewhich = which("kpsewhich")
+    if not kpsewhich or not subprocess.run([kpsewhich, "mylatexformat.ltx"],
+                                           stdout=subprocess.PIPE).stdout.strip():
+        print("[WARN] mylatexformat introuvable, compilation sans format précompilé.")
+        return None
+    for pattern in ("*.fmt", "*.fail"):
+        for old in OUTPUT_DIR.glob(f"{BASENAME}-preamble-{pattern}"):
+            old.unlink()
+    print("[INFO] Préambule modifié: construction du format précompilé")
+    cmd = [pdflatex, "-ini", "-interaction=nonstopmode", f"-jobname={name}",
+           "&pdflatex", "mylatexformat.ltx", BASENAME + ".tex"]
+    if not run(cmd, cwd=OUTPUT_DIR) or not (OUTPUT_DIR / f"{name}.fmt").exists():
+        print("[WARN] Échec du format précompilé, compilation standard "
+              "(nouvel essai quand le préambule changera).")
+        failed.touch()
+        return None
+    return name
+
+def compile_with_latexmk(fmt=None):
     latexmk = which("latexmk")
     if not latexmk:
         return False
     # -pdf pour PDF, -interaction=nonstopmode pour éviter prompts
     cmd = [latexmk, "-pdf", "-interaction=nonstopmode", BASENAME + ".tex"]
+    if fmt:
+        cmd.insert(2, f"-pdflatex=pdflatex -fmt={fmt} %O %S")
     return run(cmd, cwd=OUTPUT_DIR)
 
-def compile_with_pdflatex():
+def aux_state(jobname=BASENAME) -> str:
+    """Empreinte des fichiers auxiliaires : inchangée d'une passe à l'autre = point fixe."""
+    h = hashlib.sha256()
+    paths = [OUTPUT_DIR / f"{jobname}{ext}" for ext in AUX_EXTS]
+    for path in paths + sorted(SECTIONS_DIR.glob("*.aux")):
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes() if path.exists() else b"\0")
+    return h.hexdigest()
+
+def compile_with_pdflatex(fmt=None, max_passes=MAX_PDFLATEX_PASSES):
     pdflatex = which("pdflatex")
     if not pdflatex:
         print("[ERR] pdflatex introuvable dans le PATH")
         return False
     # Important: exécuter dans OUTPUT_DIR et passer le nom de base
     cmd = [pdflatex, "-interaction=nonstopmode", BASENAME + ".tex"]
+    if fmt:
+        cmd.insert(1, f"-fmt={fmt}")
     ok = True
-    for i in range(RUNS_WITH_PDFLATEX):
-        print(f"[INFO] pdflatex pass {i+1}/{RUNS_WITH_PDFLATEX}")
+    state = aux_state()
+    for i in range(max_passes):
+        print(f"[INFO] pdflatex pass {i+1} (max {max_passes})")
         ok = run(cmd, cwd=OUTPUT_DIR)
         if not ok:
             break
+        new_state = aux_state()
+        if new_state == state and not needs_rerun(OUTPUT_DIR / f"{BASENAME}.log"):
+            print(f"[INFO] Auxiliaires stables après {i+1} passe(s), "
+                  f"{max_passes - i - 1} passe(s) économisée(s)")
+            break
+        state = new_state
+    else:
+        print(f"[WARN] Auxiliaires non stabilisés après {max_passes} passes")
     return ok
 
-def main():
-    ensure_output_dir()
-    write_tex()
+def compile_draft(patterns) -> bool:
+    """Compile un brouillon ne contenant que les sections demandées.
+
+    Les .aux/.toc/.out de la dernière compilation complète sont recopiés
+    sous le nom du brouillon : références croisées, numéros de page et
+    sommaire restent valides avec une seule passe pdflatex.
+    """
+    pdflatex = which("pdflatex")
+    if not pdflatex:
+        print("[ERR] pdflatex introuvable dans le PATH")
+        return False
+    preamble, fragments = split_document(render(latex_content))
+    selected, unknown = select_fragments(fragments, patterns)
+    for pattern in unknown:
+        print(f"[WARN] Aucune section ne correspond à: {pattern}")
+    if not selected:
+        return False
 
+    for ext in (".aux", ".toc", ".out"):
+        src = OUTPUT_DIR / f"{BASENAME}{ext}"
+        if src.exists():
+            shutil.copy2(src, OUTPUT_DIR / f"{DRAFT_BASENAME}{ext}")
+    write_if_changed(OUTPUT_DIR / f"{DRAFT_BASENAME}.tex", main_tex(preamble, fragments, only=selected))
+    print(f"[INFO] Brouillon: {'; '.join(t for fr in selected for t in fr.titles)}")
+    cmd = [pdflatex, "-interaction=nonstopmode", DRAFT_BASENAME + ".tex"]
+    fmt = preamble_format()
+    if fmt:
+        cmd.insert(1, f"-fmt={fmt}")
+    ok = run(cmd, cwd=OUTPUT_DIR)
+    return report_log(OUTPUT_DIR / f"{DRAFT_BASENAME}.log")["error"] == 0 and ok
+
+def build(max_passes=MAX_PDFLATEX_PASSES, params=None):
+    """Écrit puis compile le document courant ; renvoie (ok, depuis_le_cache).
+
+    `params` (surcharge de DOC_PARAMS) ne sert qu'aux figures : les valeurs
+    <<nom>> sont déjà rendues dans le contenu.
+    """
+    render_figures(params=params)
+    if OPTIMIZE_ASSETS:
+        optimize_assets()
+    changed = write_tex()
+    key = build_key(max_passes) if USE_BUILD_CACHE else None
+    if key and restore_cached_pdf(key):
+        print(f"[OK] PDF restauré depuis le cache ({key[:12]})")
+        return True, True
+    if changed:
+        titles = [t for fr in changed for t in fr.titles] or ["page de garde"]
+        print(f"[INFO] Recompilation déclenchée par: {'; '.join(titles)}")
+
+    fmt = preamble_format()
     ok = False
     if USE_LATEXMK_IF_AVAILABLE:
-        ok = compile_with_latexmk()
+        ok = compile_with_latexmk(fmt)
         # Certains latexmk exigent plusieurs passes internes; si échec, fallback
         if not ok:
             print("[WARN] latexmk a échoué, tentative avec pdflatex...")
     if not ok:
-        ok = compile_with_pdflatex()
+        ok = compile_with_pdflatex(fmt, max_passes)
+
+    # les erreurs du .log font échouer le build même si un PDF a été produit
+    counts = report_log(OUTPUT_DIR / f"{BASENAME}.log")
+    ok = ok and PDF_PATH.exists() and not counts["error"]
+    if ok:
+        compress_pdf(PDF_PATH)
+    if ok and key:
+        store_cached_pdf(key)
+    return ok, False
+
+# ------------ Variantes (batch) ------------
+def load_manifest(path: Path):
+    """Liste des variantes d'un manifeste JSON (liste, ou objet avec une clé "variants").
+
+    Chaque variante : {"name": ..., "hypersetup": {clé: valeur}, "replace": [[ancien, nouveau], ...],
+    "params": {clé de DOC_PARAMS: valeur}}.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return data["variants"] if isinstance(data, dict) else data
+
+def apply_variant(content: str, variant: dict) -> str:
+    for old, new in variant.get("replace", []):
+        if old not in content:
+            raise ValueError(f"texte introuvable: {old!r}")
+        content = content.replace(old, new)
+    meta = variant.get("hypersetup")
+    if meta:
+        # un second \hypersetup (après \endofdump) surcharge le premier
+        opts = ",\n    ".join(f"{k}={{{v}}}" for k, v in meta.items())
+        head, sep, tail = content.partition("\\begin{document}")
+        content = f"{head}\\hypersetup{{\n    {opts}\n}}\n{sep}{tail}"
+    params = variant.get("params", {})
+    unknown = set(params) - set(DOC_PARAMS)
+    if unknown:
+        raise ValueError(f"paramètres inconnus: {sorted(unknown)}")
+    # rendu dans le processus parent : un seul accès au mémo des valeurs
+    return render(content, params)
+
+def use_output_dir(output_dir: Path, content: str):
+    """Redirige la configuration du module vers `output_dir` (processus courant uniquement)."""
+    global OUTPUT_DIR, TEX_PATH, PDF_PATH, SECTIONS_DIR, FIGURES_DIR, ASSETS_DIR, latex_content
+    OUTPUT_DIR = output_dir
+    TEX_PATH = OUTPUT_DIR / f"{BASENAME}.tex"
+    PDF_PATH = OUTPUT_DIR / f"{BASENAME}.pdf"
+    SECTIONS_DIR = OUTPUT_DIR / "sections"
+    FIGURES_DIR = OUTPUT_DIR / "figures"
+    ASSETS_DIR = OUTPUT_DIR / "assets"
+    latex_content = content
+
+def build_variant(name: str, content: str, max_passes=MAX_PDFLATEX_PASSES, params=None) -> dict:
+    """Tâche du pool : compile une variante dans son propre répertoire de travail."""
+    global QUIET
+    QUIET = True  # les sorties de plusieurs workers ne doivent pas s'entrelacer
+    start = time()
+    use_output_dir(VARIANTS_DIR / name, content)
+    ensure_output_dir()
+    ok, cached = build(max_passes, params)
+    log_path = OUTPUT_DIR / f"{BASENAME}.log"
+    counts = Counter() if cached or not log_path.exists() else Counter(r.kind for r in parse_log(log_path))
+    return {"name": name, "ok": ok, "cached": cached, "seconds": round(time() - start, 3),
+            "pdf": str(PDF_PATH) if ok else None, "error": None if ok else "échec de compilation",
+            "log": dict(counts)}
+
+def failed_variant(name: str, error: str) -> dict:
+    """Résultat d'une variante qui n'a pas été compilée (mêmes clés que build_variant)."""
+    return {"name": name, "ok": False, "cached": False, "seconds": 0.0,
+            "pdf": None, "error": error, "log": {}}
+
+def build_batch(variants, jobs=None, max_passes=MAX_PDFLATEX_PASSES):
+    """Compile les variantes en parallèle ; un résultat par variante, dans l'ordre du manifeste."""
+    results, tasks, seen = [None] * len(variants), [], set()
+    for i, variant in enumerate(variants):
+        name = str(variant.get("name", ""))
+        try:
+            if not re.fullmatch(r"[\w.-]+", name) or name in seen:
+                raise ValueError(f"nom de variante invalide ou dupliqué: {name!r}")
+            seen.add(name)
+            tasks.append((i, name, apply_variant(latex_content, variant), variant.get("params", {})))
+        except ValueError as e:
+            results[i] = failed_variant(name, str(e))
+            print(f"[ERR] Variante {name}: {e}")
+
+    # figures de toutes les variantes tracées ici, dans un seul pool ; les variantes les reprennent du cache
+    if importlib.util.find_spec("matplotlib") is not None:
+        todo = {}
+        for *_, params in tasks:
+            for name, spec in figure_specs(params).items():
+                path = cached_figure(name, spec)
+                if not path.exists():
+                    todo[path] = (name, spec, path)
+        plot_figures(list(todo.values()), jobs)
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_variant, name, content, max_passes, params): (i, name)
+                   for i, name, content, params in tasks}
+        for future in as_completed(futures):
+            i, name = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:  # le worker ne doit pas faire échouer tout le lot
+                results[i] = failed_variant(name, repr(e))
+            res = results[i]
+            print(f"[{'OK' if res['ok'] else 'ERR'}] Variante {name}: {res['seconds']:.1f} s")
+    return results
+
+# ------------ Watch ------------
+def load_latex_content(path: Path) -> str:
+    """Relit `latex_content` dans le source sans exécuter le module."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "latex_content"
+                                                for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"latex_content introuvable dans {path}")
+
+def file_snapshot(paths):
+    return {p: (p.stat().st_mtime_ns, p.stat().st_size) if p.exists() else None for p in paths}
+
+def watch_changes(paths):
+    """Génère un évènement par rafale de modifications de `paths`.
+
+    inotify (paquet optionnel inotify_simple) si disponible, sinon polling
+    des mtime toutes les WATCH_POLL_INTERVAL secondes.
+    """
+    try:
+        from inotify_simple import INotify, flags
+    except ImportError:
+        INotify = None
+
+    if INotify is not None:
+        inotify = INotify()
+        # surveiller les répertoires : les éditeurs remplacent souvent le fichier
+        for directory in {p.resolve().parent for p in paths}:
+            inotify.add_watch(directory, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE)
+        names = {p.name for p in paths}
+
+        def changed(timeout):
+            return any(ev.name in names for ev in inotify.read(timeout=int(timeout * 1000)))
+    else:
+        state = file_snapshot(paths)
+
+        def changed(timeout):
+            nonlocal state
+            deadline = time() + timeout
+            while True:
+                new = file_snapshot(paths)
+                if new != state:
+                    state = new
+                    return True
+                if time() >= deadline:
+                    return False
+                sleep(WATCH_POLL_INTERVAL)
+
+    while True:
+        if changed(1.0):
+            while changed(WATCH_DEBOUNCE):
+                pass
+            yield
+
+def watch(args):
+    """Boucle de compilation incrémentale : format, .aux et processus restent chauds."""
+    global latex_content
+    source = Path(__file__)
+    patterns = [p.strip() for p in args.only.split(",") if p.strip()] if args.only else None
+    print(f"[INFO] Surveillance de {source} (Ctrl+C pour quitter)")
+    build(args.max_passes)
+    for _ in watch_changes([source]):
+        start = time()
+        try:
+            content = load_latex_content(source)
+        except (SyntaxError, ValueError) as e:
+            print(f"[WARN] Source illisible, en attente d'une correction: {e}")
+            continue
+        if content == latex_content:
+            continue
+        latex_content = content
+        if patterns and (OUTPUT_DIR / f"{BASENAME}.aux").exists():
+            write_tex()
+            ok, target = compile_draft(patterns), OUTPUT_DIR / f"{DRAFT_BASENAME}.pdf"
+        else:
+            ok, target = build(args.max_passes)[0], PDF_PATH
+        tag = "OK" if ok else "ERR"
+        print(f"[{tag}] {target} mis à jour en {(time() - start) * 1000:.0f} ms" if ok
+              else f"[{tag}] Échec de compilation, voir logs ci-dessus.")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génère et compile le PDF sonoluminescence.")
+    parser.add_argument("--only", metavar="SECTION[,SECTION...]",
+                        help="brouillon limité aux sections dont le titre contient ces motifs")
+    parser.add_argument("--max-passes", type=int, default=MAX_PDFLATEX_PASSES,
+                        help="nombre maximal de passes pdflatex (arrêt dès le point fixe)")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="compile en parallèle les variantes décrites dans un manifeste JSON")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="taille du pool pour --batch (défaut: nombre de CPU)")
+    parser.add_argument("--watch", action="store_true",
+                        help="reste actif et recompile à chaque enregistrement du source")
+    parser.add_argument("--quiet", action="store_true",
+                        help="masque la sortie LaTeX (fin du log affichée en cas d'échec)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    global QUIET
+    args = parse_args(argv)
+    QUIET = QUIET or args.quiet
+    start = time()
+    ensure_output_dir()
+
+    if args.batch:
+        results = build_batch(load_manifest(args.batch), args.jobs, args.max_passes)
+        VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
+        (VARIANTS_DIR / "batch.json").write_text(
+            json.dumps(results, indent=1, ensure_ascii=False), encoding="utf-8")
+        failed = [r["name"] for r in results if not r["ok"]]
+        print(f"[{'ERR' if failed else 'OK'}] {len(results) - len(failed)}/{len(results)} variantes "
+              f"en {time() - start:.1f} s, détail: {VARIANTS_DIR / 'batch.json'}")
+        sys.exit(1 if failed else 0)
+
+    if args.watch:
+        try:
+            watch(args)
+        except KeyboardInterrupt:
+            print("\n[OK] Surveillance arrêtée.")
+        sys.exit(0)
 
-    if ok and PDF_PATH.exists():
+    if args.only:
+        if not (OUTPUT_DIR / f"{BASENAME}.aux").exists():
+            print("[WARN] Pas de .aux complet: compilation complète préalable nécessaire.")
+        else:
+            write_tex()
+            ok = compile_draft([p.strip() for p in args.only.split(",") if p.strip()])
+            draft_pdf = OUTPUT_DIR / f"{DRAFT_BASENAME}.pdf"
+            if ok and draft_pdf.exists():
+                print(f"[OK] Brouillon généré: {draft_pdf} ({time() - start:.1f} s)")
+                sys.exit(0)
+            print("[ERR] Échec du brouillon, voir logs ci-dessus.")
+            sys.exit(1)
+
+    ok, cached = build(args.max_passes)
+    if ok:
         size_kb = PDF_PATH.stat().st_size / 1024
-        print(f"[OK] PDF généré: {PDF_PATH} ({size_kb:.1f} KB)")
+        elapsed_ms = (time() - start) * 1000
+        print(f"[OK] PDF {'inchangé' if cached else 'généré'}: {PDF_PATH} "
+              f"({size_kb:.1f} KB, {elapsed_ms:.0f} ms)")
         sys.exit(0)
     else:
         print("[ERR] Échec de compilation, voir logs ci-dessus.")
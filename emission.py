@@ -0,0 +1,193 @@
+"""Émission du flash : spectre intégré en temps et nombre de photons à partir de T(t), r_c(t).
+
+Un modèle d'émission donne la puissance spectrale totale P_λ (W/m) de la
+région chaude de rayon r à la température T ; le spectre du flash et le
+nombre de photons sont
+
+    E_λ = ∫ P_λ(λ, T(t), r(t)) dt,      N = ∫∫ P_λ λ/(hc) dλ dt
+
+évalués en une seule quadrature (trapèzes) sur la grille temps × longueur
+d'onde, vectorisée sur un lot de runs et découpée en blocs de CHUNK_BYTES.
+Les instants peuvent être non uniformes (sorties denses de
+rayleigh_plesset.integrate) ; les NaN de fin de tableau sont ignorés.
+
+Un modèle (Model) est factorisé en P_λ = s(T, r) · a(λ) · k(hc/λkT) : le
+facteur par instant s est replié dans les poids en temps, a(λ) appliqué
+après la somme, et seul le noyau k (expm1, exp, en place) est évalué sur la
+grille temps × λ, suivi d'un produit matriciel par les poids. Modèles
+fournis (registre MODELS) :
+
+- "blackbody" : surface sphérique opaque, P_λ = 4π r² · π B_λ(λ, T) ;
+- "bremsstrahlung" : plasma optiquement mince (freinage libre–libre),
+  ε_ν = 6,8·10⁻⁵¹ Z² n_e n_i T^(-1/2) g_ff e^(-hν/kT) W·m⁻³·Hz⁻¹,
+  P_λ = (4π r³/3) ε_ν c/λ² (n_i = n_e/Z, paramètres scalaires).
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from planck import C, CHUNK_BYTES, H, K_B
+from rayleigh_plesset import T_ION, Medium, gas_temperature
+
+# ------------ Config ------------
+LAMBDA = np.geomspace(150e-9, 1500e-9, 256)  # m, grille spectrale par défaut
+BREMS_COEFF = 6.8e-51   # W·m³·Hz⁻¹·K^(1/2) (Rybicki & Lightman 5.14b, SI)
+N_E = 1e25              # m⁻³, densité électronique par défaut (argon comprimé faiblement ionisé)
+G_FF = 1.2              # facteur de Gaunt moyen
+# --------------------------------
+
+
+class EmissionResult(NamedTuple):
+    lam: np.ndarray         # (n_λ,) longueurs d'onde (m)
+    spectrum: np.ndarray    # (B, n_λ) énergie émise par unité de longueur d'onde E_λ (J/m)
+    energy: np.ndarray      # (B,) énergie rayonnée sur la grille spectrale (J)
+    photons: np.ndarray     # (B,) nombre de photons sur la grille spectrale
+    peak: np.ndarray        # (B,) λ du maximum de E_λ (NaN sans émission)
+
+
+class Model(NamedTuple):
+    """P_λ(λ, T, r) = sample(T, r) · spectral(λ) · kernel(x), x = hc/(λ k T).
+
+    Les deux premiers facteurs sont calculés une fois par instant et par
+    longueur d'onde ; seul `kernel` (en place sur x) touche la grille temps × λ.
+    """
+    sample: object      # (T, r, **params) -> (…,) facteur par instant
+    spectral: object    # (lam, **params) -> (n_λ,) facteur par longueur d'onde
+    kernel: object      # x -> noyau élémentaire, écrit dans x
+
+
+def _inv_expm1(x):
+    np.expm1(x, out=x)
+    return np.reciprocal(x, out=x)
+
+
+def _exp_neg(x):
+    np.negative(x, out=x)
+    return np.exp(x, out=x)
+
+
+# corps noir : 4π r² · π B_λ = 4π² r² · (2hc²/λ⁵) / expm1(x)
+BLACKBODY = Model(sample=lambda T, r: 4 * np.pi**2 * r**2,
+                  spectral=lambda lam: 2 * H * C**2 / lam**5,
+                  kernel=_inv_expm1)
+
+# freinage libre–libre optiquement mince : (4π r³/3) · ε_ν c/λ²
+BREMSSTRAHLUNG = Model(
+    sample=lambda T, r, n_e=N_E, Z=1.0, g_ff=G_FF:
+        4 * np.pi / 3 * r**3 * BREMS_COEFF * Z * n_e**2 * g_ff / np.sqrt(T),
+    spectral=lambda lam, **params: C / lam**2,
+    kernel=_exp_neg)
+
+MODELS = {"blackbody": BLACKBODY, "bremsstrahlung": BREMSSTRAHLUNG}
+
+
+def spectral_power(model, lam, T, r, **params):
+    """P_λ (W/m) d'un modèle sur la grille diffusée T × λ (contrôle, tracés)."""
+    model = MODELS[model] if isinstance(model, str) else model
+    T = np.asarray(T, dtype=float)[..., None]
+    x = H * C / (K_B * np.asarray(lam, dtype=float) * T)
+    with np.errstate(over="ignore"):
+        k = model.kernel(x)
+    return (model.sample(T, np.asarray(r, dtype=float)[..., None], **params)
+            * model.spectral(np.asarray(lam, dtype=float), **params) * k)
+
+
+def _trapezoid_weights(x, max_gap=None):
+    """Poids des trapèzes le long du dernier axe (NaN et intervalles > max_gap : poids nul)."""
+    dx = np.nan_to_num(np.diff(x, axis=-1))
+    if max_gap is not None:
+        dx[dx > max_gap] = 0.0
+    w = np.zeros(x.shape)
+    w[..., :-1] += dx / 2
+    w[..., 1:] += dx / 2
+    return w
+
+
+def flash_spectrum(t, T, r, lam=LAMBDA, model="blackbody", T_min=0.0, max_gap=None,
+                   chunk_bytes=CHUNK_BYTES, **params):
+    """Spectre intégré en temps et photons d'un lot de runs (T, r de forme (B, n_t), t idem ou (n_t,)).
+
+    Seuls les instants où T ≥ `T_min` émettent (T_ion : plasma seulement).
+    `max_gap` (s) coupe la quadrature entre fenêtres de collapse disjointes ;
+    `params` est transmis au modèle (nom de MODELS ou Model).
+    """
+    model = MODELS[model] if isinstance(model, str) else model
+    T = np.atleast_2d(np.asarray(T, dtype=float))
+    r = np.broadcast_to(np.asarray(r, dtype=float), T.shape)
+    lam = np.asarray(lam, dtype=float)
+
+    # poids des trapèzes en temps × facteur par instant du modèle (nuls hors émission)
+    w_t = np.broadcast_to(_trapezoid_weights(np.asarray(t, dtype=float), max_gap), T.shape)
+    live = np.isfinite(T) & (T >= T_min) & (w_t > 0)
+    T_safe = np.where(live, T, 1.0)
+    with np.errstate(invalid="ignore"):
+        w = np.where(live, w_t * model.sample(T_safe, np.where(live, r, 0.0), **params), 0.0)
+    c2 = H * C / (K_B * lam)  # x = c2 / T
+
+    n_runs, n_t = T.shape
+    per_run = 8 * n_t * lam.size
+    runs = max(1, chunk_bytes // per_run)
+    steps = n_t if per_run <= chunk_bytes else max(1, chunk_bytes // (8 * lam.size))
+    buf = np.empty((min(runs, n_runs), min(steps, n_t), lam.size))
+    spectrum = np.zeros((n_runs, lam.size))
+    for b in range(0, n_runs, runs):
+        for k in range(0, n_t, steps):
+            wb = w[b:b + runs, k:k + steps]
+            if not wb.any():
+                continue
+            x = buf[:wb.shape[0], :wb.shape[1]]
+            np.multiply((1.0 / T_safe[b:b + runs, k:k + steps])[..., None], c2, out=x)
+            with np.errstate(over="ignore"):
+                model.kernel(x)
+            spectrum[b:b + runs] += np.matmul(wb[:, None, :], x)[:, 0]
+    spectrum *= model.spectral(lam, **params)
+    emitted = spectrum.max(axis=1) > 0
+    peak = np.where(emitted, lam[np.argmax(spectrum, axis=1)], np.nan)
+    return EmissionResult(lam, spectrum, spectrum @ _trapezoid_weights(lam),
+                          spectrum @ (_trapezoid_weights(lam) * lam / (H * C)), peak)
+
+
+def collapse_emission(res, R0, medium=Medium(), model="blackbody", T_min=T_ION, **kwargs):
+    """Émission des sorties denses d'un RPResult (integrate(..., dense_T=...)).
+
+    La bulle entière de rayon R(t) est la région émettrice, à la température
+    adiabatique gas_temperature(R) ; elle n'émet qu'au-dessus de `T_min`.
+    """
+    n_t = max(1, int(np.isfinite(res.dense_t).sum(axis=1).max(initial=0)))  # queue NaN commune
+    t, R = res.dense_t[:, :n_t], res.dense_R[:, :n_t]
+    T = gas_temperature(R, np.asarray(R0, dtype=float).reshape(-1, 1), medium)
+    with np.errstate(invalid="ignore"):
+        spacing = np.nanmin(np.diff(t, axis=1)) if n_t > 1 else None
+    max_gap = kwargs.pop("max_gap", None if spacing is None or np.isnan(spacing) else 1.5 * spacing)
+    return flash_spectrum(t, T, R, model=model, T_min=T_min, max_gap=max_gap, **kwargs)
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from rayleigh_plesset import HARD_CORE_AR, P0, integrate
+
+    # lot de bulles d'argon, sorties denses dans la fenêtre de collapse seulement
+    Pa = np.linspace(1.16, 1.22, 16) * P0
+    medium = Medium(hard_core=HARD_CORE_AR)
+    t0 = perf_counter()
+    res = integrate(4.5e-6, Pa, 26.5e3, n_out=0, rtol=1e-6, medium=medium,
+                    dense_T=T_ION, dense_dt=5e-12)
+    t1 = perf_counter()
+    flash = {name: collapse_emission(res, 4.5e-6, medium, model=name) for name in MODELS}
+    t2 = perf_counter()
+    print(f"[OK] {Pa.size} bulles : intégration {t1 - t0:.1f} s, émission ({len(MODELS)} modèles) "
+          f"{(t2 - t1) * 1e3:.0f} ms")
+    for k in range(0, Pa.size, 5):
+        bb, ff = flash["blackbody"], flash["bremsstrahlung"]
+        print(f"P_a = {Pa[k] / P0:.3f} atm : T_max = {res.T_max[k]:.0f} K, flash {res.flash[k] * 1e12:.0f} ps, "
+              f"corps noir {bb.photons[k]:.2e} photons (pic {bb.peak[k] * 1e9:.0f} nm), "
+              f"bremsstrahlung {ff.photons[k]:.2e} photons")
+    # débit de la quadrature seule : 10⁴ runs × 200 instants × 256 λ
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 100e-12, 200)
+    T = 5000 + 10000 * np.exp(-((t - 50e-12) / 20e-12) ** 2) * rng.uniform(0.5, 1.0, (10_000, 1))
+    t0 = perf_counter()
+    out = flash_spectrum(t, T, 0.5e-6)
+    print(f"[OK] 10⁴ runs × 200 instants × {LAMBDA.size} λ : {perf_counter() - t0:.2f} s, "
+          f"médiane {np.median(out.photons):.2e} photons")
@@ -0,0 +1,293 @@
+"""Transport optimal dynamique (Benamou–Brenier) régularisé par l'information de Fisher.
+
+Bulle à symétrie radiale sur la boule unité (rayon R0), temps t ∈ [0, 1] :
+
+    J[ρ, m] = ∫∫ |m|²/(2ρ) dV dt + λ ∫ I(ρ_t) dt + ∫ Φ(r) ρ_1 dV
+    ∂_t ρ + (1/r²) ∂_r (r² m) = 0,      I(ρ) = ∫ |∇ρ|²/ρ dV = 4 ∫ |∇√ρ|² dV
+
+Φ(r) = α r²/2 est le potentiel qui pousse la masse vers le centre (le
+collapse) ; la pénalité Fisher l'empêche de devenir une singularité.
+
+Grandeurs physiques : seule la longueur R0 relie le problème sans dimension
+à l'unité SI, I_F = I(ρ_1*)/R0² et r_c = 1/√I_F. La température suit la
+relation du document T = T0 (R0/r_c)² = T0 I(ρ_1*) ; elle équivaut à
+k_B T = λ_phys I_F pour λ_phys = k_B T0 R0², le seul λ_phys compatible
+avec les deux relations (ce n'est pas une entrée libre).
+
+Discrétisation volumes finis : ρ aux centres des couches sphériques, flux de
+masse F aux faces. En symétrie radiale la continuité détermine entièrement
+les flux à partir des densités (F = variation de la masse contenue sous la
+face), la contrainte est donc éliminée. Les inconnues sont les log-densités
+u_k (ρ_k = e^{u_k} normalisée) : positivité et conservation de la masse sont
+exactes, et les densités qui s'étalent sur des dizaines d'ordres de grandeur
+près du collapse restent bien échelonnées. Le gradient exact est obtenu par
+rétro-propagation (adjoint) vectorisée sur la grille espace-temps, puis J est
+minimisé par L-BFGS à H0 diagonal (préconditionneur (ρ V)^(-1/2)).
+"""
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+
+from build import DOC_PARAMS
+
+K_B = 1.380649e-23        # J/K
+# paramètres du document, ceux dont build.py tire <<lam_phys>> = k_B T0 R0²
+R0_PHYS = DOC_PARAMS["R0_bubble"]  # m, rayon ambiant de la bulle SBSL
+T0_PHYS = DOC_PARAMS["T0"]         # K, température initiale du gaz
+
+
+class Grid(NamedTuple):
+    r: np.ndarray       # (n,) centres des couches
+    h: float            # pas radial
+    V: np.ndarray       # (n,) volumes des couches
+    A: np.ndarray       # (n-1,) aires des faces intérieures
+    Vf: np.ndarray      # (n-1,) volumes duaux des faces (A h)
+    dt: float
+    n_t: int
+
+
+class OTFisherResult(NamedTuple):
+    rho: np.ndarray         # (n_t+1, n) trajectoire optimale ρ_k
+    flux: np.ndarray        # (n_t, n-1) flux de masse aux faces
+    r: np.ndarray           # (n,) centres des couches
+    J: float
+    I_T: float              # I(ρ_1*) sans dimension (unités 1/R0²)
+    r_c: float              # 1/√I_F en m
+    kT: float               # λ_phys · I_F = k_B T0 I_T en J
+    T: float                # T0 (R0/r_c)² en K
+    iterations: int
+    converged: bool
+    history: list           # J à chaque itération
+
+
+def make_grid(n_r=64, n_t=32) -> Grid:
+    edges = np.linspace(0.0, 1.0, n_r + 1)
+    h = edges[1]
+    V = 4 * np.pi / 3 * (edges[1:] ** 3 - edges[:-1] ** 3)
+    A = 4 * np.pi * edges[1:-1] ** 2
+    return Grid(0.5 * (edges[1:] + edges[:-1]), h, V, A, A * h, 1.0 / n_t, n_t)
+
+
+def gaussian_density(grid: Grid, kappa: float) -> np.ndarray:
+    """ρ ∝ exp(-κ r²) normalisée sur la grille (Σ ρ V = 1)."""
+    rho = np.exp(-kappa * grid.r**2)
+    return rho / np.dot(rho, grid.V)
+
+
+def fisher_information(grid: Grid, rho: np.ndarray) -> np.ndarray:
+    """I(ρ) = 4 Σ_faces V_f (Δ√ρ / h)², sur le dernier axe (lots de densités acceptés)."""
+    d = np.diff(np.sqrt(rho), axis=-1)
+    return 4 * np.sum(grid.Vf * d * d, axis=-1) / grid.h**2
+
+
+def densities(grid, u):
+    """ρ_k = e^{u_k} / Σ V e^{u_k} (u de forme (n_t, n), ρ_1..ρ_nt)."""
+    e = np.exp(u - u.max(axis=-1, keepdims=True))
+    return e / (e @ grid.V)[..., None]
+
+
+def fluxes(grid, rho):
+    """Flux de masse aux faces : F_k,i = -(1/Δt) Σ_{j ≤ i} V_j (ρ_{k+1,j} - ρ_{k,j})."""
+    return -np.cumsum(np.diff(rho, axis=0) * grid.V, axis=1)[:, :-1] / grid.dt
+
+
+def objective(u_flat, grid, rho0, lam, alpha):
+    """J(u) et son gradient exact (rétro-propagation à travers F(ρ) et ρ(u)) ; +inf si ρ = 0."""
+    u = u_flat.reshape(grid.n_t, -1)
+    rho = np.vstack([rho0, densities(grid, u)])
+    if not np.all(rho > 0):            # sous-dépassement de e^u : point rejeté
+        return np.inf, None
+    F = fluxes(grid, rho)
+    c = grid.Vf / (2 * grid.A**2)
+
+    # cinétique : ρ̄ moyenne des deux cellules voisines aux instants k et k+1
+    pair = rho[:, :-1] + rho[:, 1:]
+    rbar = 0.25 * (pair[:-1] + pair[1:])
+    kin = c * F * F / rbar
+    # Fisher sur ρ_1..ρ_nt (ρ_0 est fixé)
+    s = np.sqrt(rho[1:])
+    d = np.diff(s, axis=1)
+    fisher = 4 * np.sum(grid.Vf * d * d, axis=1) / grid.h**2
+    phi = 0.5 * alpha * grid.r**2
+    J = grid.dt * kin.sum() + lam * grid.dt * fisher.sum() + np.dot(phi * grid.V, rho[-1])
+
+    # dérivées en ρ_k : termes explicites
+    g_rho = np.zeros_like(rho)
+    g_bar = -grid.dt * kin / rbar * 0.25
+    for k_off in (0, 1):
+        g_rho[k_off:k_off + grid.n_t, :-1] += g_bar
+        g_rho[k_off:k_off + grid.n_t, 1:] += g_bar
+    gs = 8 * lam * grid.dt * grid.Vf * d / grid.h**2
+    g_s = np.zeros_like(s)
+    g_s[:, 1:] += gs
+    g_s[:, :-1] -= gs
+    g_rho[1:] += g_s / (2 * s)
+    g_rho[-1] += phi * grid.V
+    # ... puis à travers les flux F(ρ) (adjoint de la somme cumulée)
+    g_F = 2 * grid.dt * c * F / rbar
+    G = np.zeros((grid.n_t, rho0.size))
+    G[:, :-1] = np.cumsum(g_F[:, ::-1], axis=1)[:, ::-1]
+    G *= grid.V / grid.dt
+    g_rho[1:] -= G
+    g_rho[:-1] += G
+    # ... et de la normalisation ρ = e^u / Z
+    r1 = rho[1:]
+    g_u = r1 * g_rho[1:] - r1 * grid.V * np.sum(r1 * g_rho[1:], axis=1, keepdims=True)
+    return J, g_u.ravel()
+
+
+def lbfgs(fun, x0, memory=10, precond=None, tol=1e-6, ftol=0.0, max_iter=500, g_ref=None):
+    """L-BFGS (double boucle) avec H0 diagonal = γ · precond(x) et recherche d'Armijo.
+
+    `fun(x)` renvoie (valeur, gradient) ; valeur = +inf signale un point
+    interdit, la recherche linéaire recule alors. Arrêt sur la norme
+    du gradient (relative à `g_ref`, par défaut celle du départ) ou, comme
+    L-BFGS-B, sur une baisse relative de la valeur inférieure à `ftol`
+    (0 : critère désactivé).
+    """
+    x = x0.copy()
+    fx, gx = fun(x)
+    S, Y = deque(maxlen=memory), deque(maxlen=memory)
+    history = [fx]
+    g0 = np.linalg.norm(gx) if g_ref is None else g_ref
+    for it in range(1, max_iter + 1):
+        if np.linalg.norm(gx) <= tol * max(1.0, g0):
+            return x, fx, history, it - 1, True
+        P = precond(x) if precond is not None else np.ones_like(x)
+        q = gx.copy()
+        alphas = []
+        for s, y in zip(reversed(S), reversed(Y)):
+            a = np.dot(s, q) / np.dot(y, s)
+            alphas.append(a)
+            q -= a * y
+        if S:
+            s, y = S[-1], Y[-1]
+            gamma = np.dot(s, y) / np.dot(y, P * y)
+        else:
+            gamma = 1.0 / max(np.linalg.norm(P * gx), 1e-300)
+        z = gamma * P * q
+        for (s, y), a in zip(zip(S, Y), reversed(alphas)):
+            b = np.dot(y, z) / np.dot(y, s)
+            z += (a - b) * s
+        p = -z
+        slope = np.dot(gx, p)
+        if slope >= 0:                      # direction dégradée : repartir du gradient
+            S.clear()
+            Y.clear()
+            p = -P * gx
+            slope = np.dot(gx, p)
+
+        step = 1.0
+        while True:
+            x_new = x + step * p
+            f_new, g_new = fun(x_new)
+            if np.isfinite(f_new) and f_new <= fx + 1e-4 * step * slope:
+                break
+            step *= 0.5
+            if step < 1e-12:
+                return x, fx, history, it, False
+        decrease = fx - f_new
+        s, y = x_new - x, g_new - gx
+        if np.dot(s, y) > 1e-12 * np.linalg.norm(s) * np.linalg.norm(y):
+            S.append(s)  # maxlen : la plus ancienne paire sort
+            Y.append(y)
+        x, fx, gx = x_new, f_new, g_new
+        history.append(fx)
+        if decrease <= ftol * max(abs(fx), 1.0):
+            return x, fx, history, it, True
+    return x, fx, history, max_iter, False
+
+
+def solve(n_r=64, n_t=32, lam=1e-3, alpha=50.0, kappa0=4.0, memory=10, tol=1e-6,
+          ftol=0.0, max_iter=2000, precondition=True, u0=None, R0=R0_PHYS, T0=T0_PHYS):
+    """Trajectoire optimale ρ_0 → ρ_1* et grandeurs du document.
+
+    `lam`, `alpha` et `kappa0` sont sans dimension (longueurs en unités de R0) ;
+    I_F = I/R0², r_c = 1/√I_F et T = T0 (R0/r_c)² sont ensuite rendus en unités SI.
+    `u0` (log-densités (n_t, n_r)) permet un démarrage à chaud (cf. solve_multilevel).
+    """
+    grid = make_grid(n_r, n_t)
+    rho0 = gaussian_density(grid, kappa0)
+
+    def fun(x):
+        return objective(x, grid, rho0, lam, alpha)
+
+    def precond(x):
+        # dJ/du_i ∝ w_i = ρ_i V_i : les couches presque vides (bord, au collapse)
+        # ont des gradients minuscules ; H0 ∝ w^(-1/2) rééquilibre les échelles
+        w = densities(grid, x.reshape(n_t, -1)) * grid.V
+        w = np.maximum(w / w.max(), 1e-9)
+        return (1.0 / np.sqrt(w)).ravel()
+
+    cold = np.tile(np.log(rho0), n_t)
+    x0 = cold if u0 is None else np.ravel(u0).astype(float)
+    # tolérance relative au gradient du départ à froid : un départ à chaud
+    # (déjà proche de l'optimum) n'a qu'à atteindre la même précision
+    g_ref = None if u0 is None else float(np.linalg.norm(fun(cold)[1]))
+    x, J, history, iterations, converged = lbfgs(
+        fun, x0, memory, precond if precondition else None, tol, ftol, max_iter, g_ref)
+    rho = np.vstack([rho0, densities(grid, x.reshape(n_t, -1))])
+    I_T = float(fisher_information(grid, rho[-1]))
+    T = T0 * I_T
+    return OTFisherResult(rho, fluxes(grid, rho), grid.r, float(J), I_T, R0 / np.sqrt(I_T),
+                          K_B * T, T, iterations, converged, history)
+
+
+def prolong(rho, coarse: Grid, fine: Grid) -> np.ndarray:
+    """Log-densités (n_t, n_r) de la grille fine interpolées depuis une trajectoire grossière.
+
+    Interpolation linéaire de log ρ en r puis en t (ρ_0 inclus) ; la
+    normalisation de `densities` absorbe les constantes additives.
+    """
+    log_rho = np.log(rho)
+    in_r = np.array([np.interp(fine.r, coarse.r, row) for row in log_rho])
+    t_coarse = np.arange(coarse.n_t + 1) * coarse.dt
+    t_fine = np.arange(1, fine.n_t + 1) * fine.dt
+    return np.array([np.interp(t_fine, t_coarse, col) for col in in_r.T]).T
+
+
+def solve_multilevel(levels=((16, 8), (32, 16), (64, 32), (128, 64)), lam=1e-3,
+                     lam_start=None, lam_steps=4, lam_levels=1, ftol=1e-7, level_ratio=4.0, **kwargs):
+    """Résolution grossier → fin avec continuation en λ, chaque niveau arrêté à sa précision.
+
+    Sur les `lam_levels` premières grilles (toutes : len(levels)), λ décroît
+    géométriquement de `lam_start` (défaut 100 λ : densités lisses, problème
+    bien conditionné) jusqu'à `lam`, chaque solution servant de départ à la
+    suivante ; chaque niveau démarre de la solution prolongée du précédent.
+
+    L'arrêt porte sur la baisse relative de J (`ftol` au niveau le plus fin,
+    `level_ratio` fois plus lâche par niveau plus grossier, erreur de
+    discrétisation en h², et 10 fois plus lâche aux λ intermédiaires) et non
+    sur la norme du gradient : celle-ci reste dominée par les log-densités
+    des couches presque vides, sans effet sur J, et le niveau fin n'a plus
+    qu'à polir le départ prolongé. Mesures (128×64, même `ftol`) : ~0,4 s et
+    ~160 itérations au niveau fin contre ~1 s et ~530 itérations à froid,
+    pour le même J à 2·10⁻⁵ près (erreur de discrétisation ~10⁻²) ; sur
+    256×128 ~0,5 s quand le départ à froid stagne (J ≈ 1,2). Reprendre la
+    continuation sur tous les niveaux (lam_levels = len(levels)) coûte ~10
+    fois plus : chaque grille fine refait des résolutions complètes.
+    Renvoie (résultat final, [(n_r, n_t, λ, itérations, convergé), ...]).
+    """
+    lam_start = 100 * lam if lam_start is None else lam_start
+    schedule = np.geomspace(lam_start, lam, lam_steps) if lam_steps > 1 else np.array([lam])
+    stats = []
+    u0, res = None, None
+    for i, (n_r, n_t) in enumerate(levels):
+        if res is not None:
+            u0 = prolong(res.rho, make_grid(*levels[i - 1]), make_grid(n_r, n_t))
+        level_ftol = ftol * level_ratio ** (len(levels) - 1 - i)
+        lams = schedule if i < lam_levels else schedule[-1:]
+        for k, lam_k in enumerate(lams):
+            step_ftol = level_ftol if k == len(lams) - 1 else 10 * level_ftol
+            res = solve(n_r, n_t, lam=float(lam_k), u0=u0, ftol=step_ftol, **kwargs)
+            u0 = np.log(res.rho[1:])
+            stats.append((n_r, n_t, float(lam_k), res.iterations, res.converged))
+    return res, stats
+
+
+if __name__ == "__main__":
+    res = solve()
+    print(f"J = {res.J:.6g}, I(ρ_T*) = {res.I_T:.4g} / R0², r_c = {res.r_c * 1e6:.3f} µm, "
+          f"k_B T = {res.kT:.3g} J (T = {res.T:.3g} K), "
+          f"{res.iterations} itérations, convergé: {res.converged}")
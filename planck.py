@@ -0,0 +1,158 @@
+"""Spectre de Planck B(ν, T) vectorisé sur des grilles fréquence × température.
+
+    B(ν, T) = 2hν³/c² · 1/(e^{hν/kT} − 1)
+
+Le calcul passe par x = hν/kT : B = (2k³T³/h²c²) · x³/expm1(x). Les
+grandeurs manipulées restent dans la plage du float32 (ν³ seul déborderait)
+et expm1 reste précis aux basses fréquences (régime Rayleigh–Jeans).
+Les intégrales de bande sont analytiques (séries de Bose) : aucune grille
+n'est matérialisée pour les puissances ou les pics. Les bandes loin dans
+la queue de Wien (hν/kT ≥ 1) sont des différences de queues, précises
+même quand la bande ne porte qu'une fraction 1e-20 du rayonnement.
+"""
+from math import factorial, pi
+
+import numpy as np
+
+# ------------ Constantes (CODATA 2018, exactes sauf b) ------------
+H = 6.62607015e-34      # J·s
+C = 299792458.0         # m/s
+K_B = 1.380649e-23      # J/K
+WIEN_B = 2.897771955e-3  # m·K, λ_max = b / T
+WIEN_X_NU = 2.821439372122079  # x du maximum de B_ν
+CHUNK_BYTES = 64 * 2**20  # taille visée d'un bloc de calcul (temporaires bornés)
+# -------------------------------------------------------------------
+
+_BERNOULLI = (1.0, -1 / 2, 1 / 6, 0.0, -1 / 30, 0.0, 1 / 42, 0.0, -1 / 30, 0.0, 5 / 66,
+              0.0, -691 / 2730, 0.0, 7 / 6, 0.0, -3617 / 510)
+_ZETA = {2: 1.2020569031595942, 3: pi**4 / 90}  # ζ(n + 1)
+_TAIL_TERMS = 40
+
+
+def planck_nu(nu, T, dtype=np.float64, out=None):
+    """B(ν, T) en W·sr⁻¹·m⁻²·Hz⁻¹ ; `nu` et `T` sont diffusés (broadcast) l'un contre l'autre."""
+    nu = np.asarray(nu, dtype=dtype)
+    T = np.asarray(T, dtype=dtype)
+    x = np.empty(np.broadcast_shapes(nu.shape, T.shape), dtype=dtype) if out is None else out
+    np.multiply(nu, H / K_B, out=x)
+    np.divide(x, T, out=x)
+    return _planck_from_x(x, T, dtype)
+
+
+def _planck_from_x(x, T, dtype):
+    """Remplace x par B en place : B = pref(T) · x³ / expm1(x)."""
+    pref = np.asarray(2 * K_B**3 / (H**2 * C**2), dtype=dtype) * np.asarray(T, dtype=dtype) ** 3
+    with np.errstate(over="ignore"):
+        den = np.expm1(x)
+    np.power(x, 3, out=x)
+    np.divide(x, den, out=x)
+    np.multiply(x, pref, out=x)
+    return x
+
+
+def planck_lambda(lam, T, dtype=np.float64):
+    """B_λ(λ, T) en W·sr⁻¹·m⁻³ (ν = c/λ, dν = c/λ² dλ)."""
+    lam = np.asarray(lam, dtype=dtype)
+    return planck_nu(C / lam, T, dtype) * (C / lam**2)
+
+
+def spectrum_grid(nu, T, dtype=np.float32, out=None, chunk_rows=None):
+    """Grille B[i, j] = B(nu[j], T[i]) écrite bloc de températures par bloc.
+
+    `out` peut être préalloué (y compris un np.memmap) ; les temporaires sont
+    limités à `chunk_rows` lignes (par défaut ~CHUNK_BYTES).
+    """
+    nu = np.ravel(np.asarray(nu, dtype=dtype))
+    T = np.ravel(np.asarray(T, dtype=dtype))
+    if out is None:
+        out = np.empty((T.size, nu.size), dtype=dtype)
+    if out.shape != (T.size, nu.size):
+        raise ValueError(f"out doit avoir la forme {(T.size, nu.size)}, reçu {out.shape}")
+    rows = chunk_rows or max(1, CHUNK_BYTES // max(1, nu.size * np.dtype(dtype).itemsize))
+    buf = np.empty((min(rows, T.size), nu.size), dtype=dtype)
+    for start in range(0, T.size, rows):
+        stop = min(start + rows, T.size)
+        x = buf[: stop - start]
+        np.multiply(nu[None, :], H / K_B, out=x)
+        np.divide(x, T[start:stop, None], out=x)
+        out[start:stop] = _planck_from_x(x, T[start:stop, None], dtype)
+    return out
+
+
+def peak_wavelength(T):
+    """λ_max de B_λ (loi de Wien), en m."""
+    return WIEN_B / np.asarray(T, dtype=float)
+
+
+def peak_frequency(T):
+    """ν_max de B_ν, en Hz (attention : c/ν_max ≠ λ_max)."""
+    return WIEN_X_NU * K_B * np.asarray(T, dtype=float) / H
+
+
+def bose_tail(n, x):
+    """∫ₓ^∞ tⁿ/(eᵗ − 1) dt = Σₖ e^{-kx} Σⱼ n!/j! xʲ/k^{n-j+1}, pour x ≥ 1 (n = 2 ou 3)."""
+    x = np.asarray(x, dtype=float)
+    tail = np.zeros_like(x)
+    with np.errstate(invalid="ignore"):  # x = inf : e^{-kx} xʲ -> 0
+        for k in range(1, _TAIL_TERMS + 1):
+            poly = sum(factorial(n) / factorial(j) * x**j / k ** (n - j + 1) for j in range(n + 1))
+            tail += np.nan_to_num(np.exp(-k * x) * poly)
+    return tail
+
+
+def bose_integral(n, x):
+    """∫₀ˣ tⁿ/(eᵗ − 1) dt pour n = 2 (photons) ou 3 (énergie), vectorisé.
+
+    Série de Bernoulli pour x < 1, Γ(n+1)ζ(n+1) moins la queue bose_tail sinon.
+    """
+    x = np.asarray(x, dtype=float)
+    small = x < 1.0
+    xs = np.where(small, x, 0.0)
+    low = np.zeros_like(x)
+    for k, b in enumerate(_BERNOULLI):
+        if b:
+            low += b * xs ** (n + k) / (factorial(k) * (n + k))
+    full = factorial(n) * _ZETA[n]
+    return np.where(small, low, full - bose_tail(n, np.where(small, 1.0, x)))
+
+
+def _band(n, T, nu_min, nu_max):
+    """∫ tⁿ/(eᵗ − 1) dt entre x1 = hν_min/kT et x2 = hν_max/kT.
+
+    Pour x1 ≥ 1 : bose_tail(x1) − bose_tail(x2), sans passer par Γ(n+1)ζ(n+1)
+    (la différence de deux intégrales complètes s'annule dès hν/kT ≳ 30).
+    """
+    T = np.asarray(T, dtype=float)
+    x1 = H * np.asarray(nu_min, dtype=float) / (K_B * T)
+    x2 = H * np.asarray(nu_max, dtype=float) / (K_B * T)
+    x1, x2 = np.broadcast_arrays(x1, x2)
+    far = x1 >= 1.0
+    tails = bose_tail(n, np.where(far, x1, 1.0)) - bose_tail(n, np.where(far, x2, np.inf))
+    full = factorial(n) * _ZETA[n]
+    hi = np.where(np.isinf(x2), full, bose_integral(n, np.where(np.isinf(x2), 1.0, x2)))
+    return np.where(far, tails, hi - bose_integral(n, np.where(far, 0.0, x1)))
+
+
+def band_radiance(T, nu_min=0.0, nu_max=np.inf):
+    """∫ B(ν, T) dν sur [nu_min, nu_max] en W·sr⁻¹·m⁻² (σT⁴/π sur tout le spectre)."""
+    T = np.asarray(T, dtype=float)
+    return 2 * H / C**2 * (K_B * T / H) ** 4 * _band(3, T, nu_min, nu_max)
+
+
+def band_photon_radiance(T, nu_min=0.0, nu_max=np.inf):
+    """∫ B(ν, T)/(hν) dν sur [nu_min, nu_max] en photons·s⁻¹·sr⁻¹·m⁻²."""
+    T = np.asarray(T, dtype=float)
+    return 2 / C**2 * (K_B * T / H) ** 3 * _band(2, T, nu_min, nu_max)
+
+
+def wavelength_band(lam_min, lam_max):
+    """Bornes en fréquence (nu_min, nu_max) d'une bande [lam_min, lam_max] en m."""
+    return C / np.asarray(lam_max, dtype=float), C / np.asarray(lam_min, dtype=float)
+
+
+if __name__ == "__main__":
+    T = np.linspace(5000.0, 20000.0, 4)
+    lam = peak_wavelength(T)
+    visible = band_radiance(T, *wavelength_band(400e-9, 700e-9)) / band_radiance(T)
+    for Ti, li, vi in zip(T, lam, visible):
+        print(f"T = {Ti:7.0f} K : λ_max = {li * 1e9:6.1f} nm, fraction visible = {vi:.3f}")
@@ -0,0 +1,115 @@
+"""Sections de Poincaré stroboscopiques de la bulle forcée (Rayleigh–Plesset).
+
+Le forçage P_a sin(2π f t) est périodique : échantillonner (R, R') une fois
+par période acoustique définit l'application de Poincaré. Un cycle d'ordre 1
+donne un point fixe, un doublement de période deux points, le chaos un nuage.
+
+Chaque lot de bulles (conditions initiales × amplitudes × fréquences) est
+intégré d'un bloc par rayleigh_plesset.integrate, avec une sortie toutes les
+périodes seulement : la mémoire est proportionnelle au nombre de points de
+section, jamais aux trajectoires. Les périodes sont enchaînées par paquets
+(le forçage repart à la phase 0 à chaque période entière) et les lots sont
+répartis sur un pool de processus.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from rayleigh_plesset import Medium, integrate
+
+CHUNK_PERIODS = 50      # périodes par appel à integrate (reprise depuis l'état final)
+LANES_PER_TASK = 128    # bulles par tâche du pool
+
+
+class PoincareResult(NamedTuple):
+    R: np.ndarray       # (n, periods) rayon aux instants k/f (après le transitoire)
+    U: np.ndarray       # (n, periods) vitesse de paroi aux mêmes instants
+    R0: np.ndarray      # (n,) paramètres de chaque bulle
+    Pa: np.ndarray
+    f: np.ndarray
+    ok: np.ndarray      # (n,) False si une intégration a échoué (points suivants NaN)
+
+
+def _strobe(R0, Pa, f, R_init, U_init, periods, transient, medium, rtol, chunk):
+    """Points de section d'un lot, intégré paquet de périodes par paquet de périodes."""
+    n = R0.size
+    R_sec = np.full((n, periods), np.nan)
+    U_sec = np.full((n, periods), np.nan)
+    R, U = R_init.copy(), U_init.copy()
+    ok = np.ones(n, dtype=bool)
+    done = -transient  # indice (dans la section) de la prochaine période intégrée
+    while done < periods:
+        k = min(chunk, periods - done) if done >= 0 else min(chunk, -done)
+        live = np.flatnonzero(ok)
+        if not live.size:
+            break
+        res = integrate(R0[live], Pa[live], f[live], periods=k, n_out=k + 1, medium=medium,
+                        rtol=rtol, R_init=R[live], U_init=U[live])
+        ok[live] = res.ok
+        R[live], U[live] = res.R[:, -1], res.U[:, -1]
+        if done >= 0:
+            good = live[res.ok]
+            R_sec[good, done:done + k] = res.R[res.ok, 1:]
+            U_sec[good, done:done + k] = res.U[res.ok, 1:]
+        done += k
+    return R_sec, U_sec, ok
+
+
+def _task(args):
+    return _strobe(*args)
+
+
+def poincare_map(R0, Pa, f, R_init=None, U_init=None, periods=100, transient=20,
+                 medium=Medium(), rtol=1e-6, jobs=None,
+                 chunk_periods=CHUNK_PERIODS, lanes_per_task=LANES_PER_TASK):
+    """Section de Poincaré de chaque bulle (arguments diffusés en tableaux 1D).
+
+    Les `transient` premières périodes sont intégrées sans être gardées ;
+    les `periods` suivantes donnent un point (R, R') chacune. `jobs`
+    processus traitent des lots de `lanes_per_task` bulles (1 : sur place).
+    """
+    R_init = R0 if R_init is None else R_init
+    U_init = 0.0 if U_init is None else U_init
+    R0, Pa, f, R_init, U_init = (np.ravel(x).astype(float)
+                                 for x in np.broadcast_arrays(R0, Pa, f, R_init, U_init))
+    n = R0.size
+    tasks = [(R0[a:a + lanes_per_task], Pa[a:a + lanes_per_task], f[a:a + lanes_per_task],
+              R_init[a:a + lanes_per_task], U_init[a:a + lanes_per_task],
+              periods, transient, medium, rtol, chunk_periods)
+             for a in range(0, n, lanes_per_task)]
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        parts = [_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_task, tasks))
+    R_sec, U_sec, ok = (np.concatenate(x) for x in zip(*parts))
+    return PoincareResult(R_sec, U_sec, R0, Pa, f, ok)
+
+
+def cycle_order(R, rtol=1e-4, max_order=16):
+    """Plus petit p tel que R[k+p] ≈ R[k] sur la section (0 : pas de cycle d'ordre ≤ max_order)."""
+    R = np.atleast_2d(R)
+    order = np.zeros(R.shape[0], dtype=np.int64)
+    for p in range(max_order, 0, -1):
+        if R.shape[1] <= p:
+            continue
+        close = np.all(np.abs(R[:, p:] - R[:, :-p]) <= rtol * np.abs(R[:, :-p]), axis=1)
+        order[close] = p
+    return order
+
+
+if __name__ == "__main__":
+    from rayleigh_plesset import HARD_CORE_AR, P0
+
+    Pa = np.linspace(0.9, 1.2, 7) * P0
+    res = poincare_map(4.5e-6, Pa, 26.5e3, periods=8, transient=8,
+                       medium=Medium(hard_core=HARD_CORE_AR))
+    for pa, R_sec, p, ok in zip(res.Pa, res.R, cycle_order(res.R, max_order=4), res.ok):
+        if not ok:
+            print(f"P_a = {pa / P0:.3f} atm : intégration interrompue (bulle instable)")
+            continue
+        print(f"P_a = {pa / P0:.3f} atm : cycle d'ordre {p or '> 4'}, "
+              f"R(k/f) ∈ [{R_sec.min() * 1e6:.2f}, {R_sec.max() * 1e6:.2f}] µm")
@@ -0,0 +1,254 @@
+"""Transport optimal entropique (Sinkhorn) entre densités de bulle, en domaine logarithmique.
+
+Coût quadratique c(x, y) = |x - y|² sur une grille produit (1D, 2D ou 3D).
+Le noyau de Gibbs exp(-c/ε) est séparable : il s'applique axe par axe avec
+des matrices (n_d × n_d), sans jamais former la matrice de coût n² de la
+grille entière. Les itérations portent sur les potentiels duaux (f, g) :
+
+    f(x) = -ε log Σ_y b(y) exp((g(y) - c(x, y))/ε)
+    g(y) = -ε log Σ_x a(x) exp((f(x) - c(x, y))/ε)
+
+ce qui reste stable pour ε petit. Chaque log-sum-exp 1D passe par un produit
+matriciel (BLAS) avec décalage par ligne ; seuls les termes dont la somme
+sous-déborde (points loin du support, d'autant plus nombreux que ε est
+petit devant le pas²) sont recalculés exactement. ε décroît géométriquement
+(ε-scaling) depuis le diamètre² de la grille, les potentiels servant de
+départ à l'étape suivante.
+
+Cas radial : entre densités à symétrie sphérique le transport optimal est
+radial, W2 se ramène au transport 1D des masses des couches (radial_masses).
+
+Marginales du plan entropique lui-même (pont de Schrödinger, ε fixé) :
+entropic_path, à partir des potentiels (f, g) d'une résolution.
+
+Toutes les fonctions acceptent un lot de paires (axes de tête).
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+CHUNK_BYTES = 64 * 2**20  # temporaires du log-sum-exp exact
+UNDERFLOW = 1e-250        # somme en dessous : terme recalculé exactement
+
+
+class SinkhornResult(NamedTuple):
+    f: np.ndarray           # (B, *grille) potentiel de a
+    g: np.ndarray           # (B, *grille) potentiel de b
+    cost: np.ndarray        # (B,) objectif dual Σ a f + Σ b g (≈ W2² pour ε petit)
+    eps: float
+    iterations: int
+    error: np.ndarray       # (B,) violation L1 de la marginale a
+    converged: bool
+
+
+def _lse_exact(h, cost, rows, cols):
+    """log Σ_y exp(h[r, y] - cost[x, y]) pour les couples (r, x) donnés, par blocs bornés."""
+    out = np.empty(rows.size)
+    step = max(1, CHUNK_BYTES // (8 * cost.shape[1]))
+    for s in range(0, rows.size, step):
+        blk = h[rows[s:s + step]] - cost[cols[s:s + step]]
+        m = blk.max(axis=-1)
+        m = np.where(np.isfinite(m), m, 0.0)
+        with np.errstate(divide="ignore"):
+            out[s:s + step] = m + np.log(np.exp(blk - m[:, None]).sum(axis=-1))
+    return out
+
+
+def _lse_axis(h, cost, kernel, axis):
+    """Log-sum-exp de h - cost le long de `axis` (cost[x, y], kernel = exp(-cost))."""
+    moved = np.moveaxis(h, axis, -1)
+    flat = moved.reshape(-1, moved.shape[-1])
+    m = flat.max(axis=-1, keepdims=True)
+    m = np.where(np.isfinite(m), m, 0.0)
+    s = np.exp(flat - m) @ kernel.T
+    with np.errstate(divide="ignore"):
+        out = m + np.log(s)
+    rows, cols = np.nonzero(s < UNDERFLOW)
+    if rows.size:
+        out[rows, cols] = _lse_exact(flat, cost, rows, cols)
+    return np.moveaxis(out.reshape(moved.shape[:-1] + (cost.shape[0],)), -1, axis)
+
+
+class _Kernel:
+    """Noyau de Gibbs séparable exp(-|x - y|²/ε) sur une grille produit."""
+
+    def __init__(self, axes, eps):
+        self.costs = [(x[:, None] - x[None, :]) ** 2 / eps for x in axes]
+        self.kernels = [np.exp(-c) for c in self.costs]
+
+    def lse(self, h):
+        """log Σ_y exp(h(y) - c(x, y)/ε) sur les len(axes) derniers axes."""
+        nd = len(self.costs)
+        for d, (cost, kernel) in enumerate(zip(self.costs, self.kernels)):
+            h = _lse_axis(h, cost, kernel, h.ndim - nd + d)
+        return h
+
+
+def _log(p):
+    with np.errstate(divide="ignore"):
+        return np.log(p)
+
+
+def _sum_space(x, nd):
+    return x.reshape(x.shape[:x.ndim - nd] + (-1,)).sum(axis=-1)
+
+
+def _normalize(p, nd):
+    """Masses de total 1 sur les `nd` derniers axes (copie en float64)."""
+    p = np.asarray(p, dtype=float)
+    return p / _sum_space(p, nd).reshape(p.shape[:p.ndim - nd] + (1,) * nd)
+
+
+def sinkhorn(a, b, axes, eps, tol=1e-5, max_iter=5000, eps0=None, scaling=0.5,
+             f0=None, g0=None):
+    """Potentiels de Sinkhorn entre les masses `a` et `b` (forme (B, *grille) ou *grille).
+
+    `axes` donne les coordonnées de chaque axe de la grille. Les masses sont
+    normalisées à 1. ε décroît de `eps0` (défaut : diamètre²) à `eps` par
+    facteur `scaling` ; `f0`, `g0` permettent un démarrage à chaud (eps0 = eps
+    dans ce cas).
+    """
+    axes = [np.asarray(x, dtype=float) for x in axes]
+    nd = len(axes)
+    a, b = _normalize(a, nd), _normalize(b, nd)
+    log_a, log_b = _log(a), _log(b)
+
+    warm = f0 is not None and g0 is not None
+    if eps0 is None:
+        eps0 = eps if warm else max(float(np.ptp(x)) ** 2 for x in axes)
+    schedule = [eps]
+    while schedule[-1] < eps0:
+        schedule.append(schedule[-1] / scaling)
+    schedule = schedule[::-1]
+
+    f = np.zeros(np.broadcast_shapes(a.shape, b.shape)) if f0 is None else np.array(f0, dtype=float)
+    g = np.zeros_like(f) if g0 is None else np.array(g0, dtype=float)
+    it, err = 0, np.full(f.shape[:f.ndim - nd], np.inf)
+    for k, e in enumerate(schedule):
+        K = _Kernel(axes, e)
+        stage_tol = tol if k == len(schedule) - 1 else max(tol, 1e-2)
+        f = -e * K.lse(g / e + log_b)
+        while it < max_iter:
+            it += 1
+            g = -e * K.lse(f / e + log_a)
+            f_new = -e * K.lse(g / e + log_b)
+            with np.errstate(invalid="ignore", over="ignore"):
+                err = _sum_space(np.where(a > 0, a * np.abs(np.expm1((f - f_new) / e)), 0.0), nd)
+            f = f_new
+            if np.all(err < stage_tol):
+                break
+    cost = _sum_space(np.where(a > 0, a * f, 0.0), nd) + _sum_space(np.where(b > 0, b * g, 0.0), nd)
+    return SinkhornResult(f, g, cost, eps, it, err, bool(np.all(err < tol)))
+
+
+def barycentric_map(res: SinkhornResult, b, axes):
+    """T(x) = E_π[y | x] du plan entropique, forme (B, d, *grille), sans former le plan."""
+    axes = [np.asarray(x, dtype=float) for x in axes]
+    nd = len(axes)
+    K = _Kernel(axes, res.eps)
+    h = res.g / res.eps + _log(_normalize(b, nd))
+    norm = K.lse(h)
+    maps = []
+    for d, x in enumerate(axes):
+        # E[y_d | x] = lo + exp(LSE(h + log(y_d - lo)) - LSE(h)) : poids positifs
+        lo = x[0] - (x[1] - x[0])
+        shape = [1] * nd
+        shape[d] = x.size
+        maps.append(lo + np.exp(K.lse(h + np.log(x - lo).reshape(shape)) - norm))
+    return np.stack(maps, axis=-nd - 1)
+
+
+def deposit(mass, positions, axes):
+    """Dépose `mass` (B, *grille) aux `positions` (B, d, *grille) sur la grille (multilinéaire)."""
+    axes = [np.asarray(x, dtype=float) for x in axes]
+    nd = len(axes)
+    lead = mass.shape[:mass.ndim - nd]
+    B = int(np.prod(lead, dtype=int))
+    shape = tuple(x.size for x in axes)
+    m = mass.reshape(B, -1)
+    pos = positions.reshape(B, nd, -1)
+    base, frac = [], []
+    for d, x in enumerate(axes):
+        # grilles uniformes ou non : indice de la cellule puis poids linéaire
+        i = np.clip(np.searchsorted(x, pos[:, d], side="right") - 1, 0, x.size - 2)
+        w = np.clip((pos[:, d] - x[i]) / (x[i + 1] - x[i]), 0.0, 1.0)
+        base.append(i)
+        frac.append(w)
+    out = np.zeros((B, int(np.prod(shape))))
+    rows = np.repeat(np.arange(B)[:, None], m.shape[1], axis=1)
+    for corner in np.ndindex(*(2,) * nd):
+        idx = np.ravel_multi_index(tuple(base[d] + c for d, c in enumerate(corner)), shape)
+        w = m.copy()
+        for d, c in enumerate(corner):
+            w *= frac[d] if c else 1.0 - frac[d]
+        np.add.at(out, (rows, idx), w)
+    return out.reshape(lead + shape)
+
+
+def interpolate(a, b, axes, ts, eps, **kwargs):
+    """Interpolation de déplacement ρ_t = ((1-t) id + t T)_# a pour chaque t de `ts`.
+
+    T est l'application barycentrique du plan entropique. Génère (t, masses)
+    un instant après l'autre : une seule grille interpolée en mémoire à la
+    fois, quel que soit le nombre d'instants.
+    """
+    axes = [np.asarray(x, dtype=float) for x in axes]
+    res = sinkhorn(a, b, axes, eps, **kwargs)
+    a = _normalize(a, len(axes))
+    T = barycentric_map(res, b, axes)
+    grid = np.stack(np.meshgrid(*axes, indexing="ij"))
+    for t in ts:
+        yield t, deposit(a, (1 - t) * grid + t * T, axes)
+
+
+def entropic_path(res, a, b, axes, ts):
+    """Génère (t, ρ_t) du pont entropique de `res` (f, g, eps) entre `a` et `b`.
+
+    ρ_t ∝ [K_{εt} a e^{f/ε}] · [K_{ε(1-t)} b e^{g/ε}] (masses normalisées,
+    forme (B, *grille)) : deux log-sum-exp séparables par instant, rien
+    n'est gardé d'un instant à l'autre.
+    """
+    axes = [np.asarray(x, dtype=float) for x in axes]
+    nd = len(axes)
+    a, b = _normalize(a, nd), _normalize(b, nd)
+    log_phi0 = _log(a) + res.f / res.eps
+    log_phi1 = _log(b) + res.g / res.eps
+    for t in ts:
+        if t <= 0:
+            yield t, a
+            continue
+        if t >= 1:
+            yield t, b
+            continue
+        log_rho = _Kernel(axes, res.eps * t).lse(log_phi0) \
+            + _Kernel(axes, res.eps * (1 - t)).lse(log_phi1)
+        peak = log_rho.reshape(log_rho.shape[:log_rho.ndim - nd] + (-1,)).max(axis=-1)
+        rho = np.exp(log_rho - peak.reshape(peak.shape + (1,) * nd))
+        yield t, _normalize(rho, nd)
+
+
+def radial_masses(rho, r):
+    """Masses des couches 4π r² ρ Δr (dernier axe) pour le transport radial 1D."""
+    r = np.asarray(r, dtype=float)
+    dr = np.gradient(r)
+    return 4 * np.pi * r**2 * dr * np.asarray(rho, dtype=float)
+
+
+if __name__ == "__main__":
+    # radial : gaussiennes 3D isotropes, W2² exact = 3 (σ_a - σ_b)²
+    r = np.linspace(0.0, 3.0, 300)
+    res = sinkhorn(radial_masses(np.exp(-r**2 / 0.5), r), radial_masses(np.exp(-r**2 / 0.2), r),
+                   [r], eps=1e-3)
+    print(f"[OK] radial : coût {res.cost:.4f} (W2² exact {3 * (0.5 - np.sqrt(0.1)) ** 2:.4f}), "
+          f"{res.iterations} itérations")
+    # 2D séparable, lot de 8 paires translatées : W2² = décalage²
+    g = np.linspace(-1.0, 1.0, 64)
+    X, Y = np.meshgrid(g, g, indexing="ij")
+    shifts = np.linspace(0.0, 0.5, 8)
+    A = np.broadcast_to(np.exp(-(X**2 + Y**2) / 0.02), (8,) + X.shape)
+    B = np.exp(-((X - shifts[:, None, None]) ** 2 + Y**2) / 0.02)
+    res = sinkhorn(A, B, [g, g], eps=2e-3)
+    print(f"[OK] 2D, lot de 8 : écart max à W2² {np.max(np.abs(res.cost - shifts**2)):.1e} "
+          f"(biais entropique), {res.iterations} itérations")
+    for t, rho in interpolate(A[-1], B[-1], [g, g], (0.25, 0.5, 0.75), eps=2e-3):
+        print(f"[OK] t = {t:.2f} : centre x = {np.sum(rho * X):+.3f} (attendu {t * shifts[-1]:+.3f})")
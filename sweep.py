@@ -0,0 +1,176 @@
+"""Balayages de paramètres des relations de Minnaert et r_c = R0 √(T0/T_ion).
+
+    R0 = (1/2πf) √(3γ p0/ρL),    r_c = R0 √(T0/T_ion),    T = T0 (R0/r_c)²
+
+Le balayage couvre le produit cartésien des plages données pour f, p0, ρL,
+γ, T0, T_ion (et R0_bubble, P_a pour les simulations). Les points sont énumérés par
+indice à plat et traités par blocs de CHUNK_POINTS : les formules fermées
+sont évaluées d'un bloc en opérations NumPy, les évaluations coûteuses
+(intégrations Rayleigh–Plesset) sont confiées à un pool de processus, un
+bloc par tâche, avec un nombre borné de blocs en vol.
+
+Les résultats sont écrits en colonnes, un fichier .npy par grandeur
+(np.memmap) plus un en-tête sweep.json : un balayage de millions de points
+tient en mémoire bornée et se relit colonne par colonne (load_sweep).
+"""
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import prod
+from pathlib import Path
+
+import numpy as np
+
+from rayleigh_plesset import HARD_CORE_AR, Medium, integrate
+
+# ------------ Valeurs par défaut (exemple du document) ------------
+DEFAULTS = {
+    "f": 26e3,          # Hz
+    "p0": 101325.0,     # Pa
+    "rho_L": 1000.0,    # kg/m³
+    "gamma": 5.0 / 3.0,
+    "T0": 300.0,        # K
+    "T_ion": 5000.0,    # K
+    # simulations seulement : bulle d'argon SBSL, bien en dessous de la résonance
+    "R0_bubble": 4.5e-6,    # m, rayon ambiant
+    "Pa": 1.2 * 101325.0,   # Pa, amplitude acoustique
+}
+PARAMS = tuple(DEFAULTS)
+CLOSED_FORM = ("R0", "r_c", "ratio")   # ratio = r_c / R0 = √(T0/T_ion)
+SIMULATED = ("R_min", "T_max", "flash", "ok")  # flash : durée avec T ≥ T_ion (s)
+CHUNK_POINTS = 1 << 16  # points par bloc (mémoire de travail ~ quelques Mo)
+SIM_CHUNK_POINTS = 64   # bulles par tâche Rayleigh–Plesset
+HEADER = "sweep.json"
+# -------------------------------------------------------------------
+
+
+def minnaert_radius(f, p0, rho_L, gamma):
+    """Rayon de résonance R0 = (1/2πf) √(3γ p0/ρL), vectorisé sur tous les arguments."""
+    return np.sqrt(3 * gamma * p0 / rho_L) / (2 * np.pi * f)
+
+
+def critical_radius(R0, T0, T_ion):
+    """r_c = R0 √(T0/T_ion) (compression adiabatique, γ = 5/3)."""
+    return R0 * np.sqrt(T0 / T_ion)
+
+
+def plasma_temperature(R0, r_c, T0):
+    """T = T0 (R0/r_c)², relation inverse de critical_radius."""
+    return T0 * (R0 / r_c) ** 2
+
+
+def closed_form(p):
+    """Colonnes analytiques d'un bloc de points (dictionnaire de tableaux)."""
+    R0 = minnaert_radius(p["f"], p["p0"], p["rho_L"], p["gamma"])
+    r_c = critical_radius(R0, p["T0"], p["T_ion"])
+    return {"R0": R0, "r_c": r_c, "ratio": r_c / R0}
+
+
+def _ranges(ranges):
+    """Plages normalisées en tableaux 1D, dans l'ordre de PARAMS."""
+    unknown = set(ranges) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"paramètres inconnus : {sorted(unknown)} (attendus : {PARAMS})")
+    return {name: np.atleast_1d(np.asarray(ranges.get(name, DEFAULTS[name]), dtype=float))
+            for name in PARAMS}
+
+
+def _points(axes, shape, start, stop):
+    """Valeurs des paramètres des points [start, stop) du produit cartésien."""
+    idx = np.unravel_index(np.arange(start, stop), shape)
+    return {name: axes[name][i] for name, i in zip(PARAMS, idx)}
+
+
+def _simulate(start, p, periods):
+    """Intègre Rayleigh–Plesset pour un bloc (une intégration par jeu de constantes du milieu)."""
+    R0 = p["R0_bubble"]
+    R_min = np.empty_like(R0)
+    T_max = np.empty_like(R0)
+    flash = np.empty_like(R0)
+    ok = np.empty(R0.shape, dtype=bool)
+    media = np.stack([p["p0"], p["rho_L"], p["gamma"], p["T0"]], axis=1)
+    keys, group = np.unique(media, axis=0, return_inverse=True)
+    for g, (p0, rho_L, gamma, T0) in enumerate(keys):
+        sel = np.flatnonzero(group.ravel() == g)
+        # résumés seulement (n_out = 0) : aucune trajectoire n'est gardée
+        res = integrate(R0[sel], p["Pa"][sel], p["f"][sel], periods=periods, n_out=0,
+                        medium=Medium(rho_L=rho_L, P0=p0, gamma=gamma, T0=T0,
+                                      hard_core=HARD_CORE_AR),
+                        T_ion=p["T_ion"][sel])
+        R_min[sel], T_max[sel], flash[sel], ok[sel] = res.R_min, res.T_max, res.flash, res.ok
+    return start, {"R_min": R_min, "T_max": T_max, "flash": flash, "ok": ok}
+
+
+def _open_columns(path, names, n, dtypes):
+    return {name: np.lib.format.open_memmap(path / f"{name}.npy", mode="w+",
+                                            dtype=dtypes.get(name, np.float64), shape=(n,))
+            for name in names}
+
+
+def sweep(path, ranges, simulate=False, periods=1.0, jobs=None,
+          chunk=CHUNK_POINTS, sim_chunk=SIM_CHUNK_POINTS):
+    """Évalue le produit cartésien des plages et écrit les colonnes dans le dossier `path`.
+
+    `ranges` associe un nom de PARAMS à une valeur ou une plage (les absents
+    prennent DEFAULTS). Avec `simulate`, chaque point est aussi intégré sur
+    `periods` périodes (bulle d'argon de rayon ambiant R0_bubble, amplitude Pa) par
+    `jobs` processus. Renvoie le nombre de points.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    axes = _ranges(ranges)
+    shape = tuple(axes[name].size for name in PARAMS)
+    n = prod(shape)
+    names = PARAMS + CLOSED_FORM + (SIMULATED if simulate else ())
+    cols = _open_columns(path, names, n, {"ok": np.bool_})
+
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        p = _points(axes, shape, start, stop)
+        for name, values in {**p, **closed_form(p)}.items():
+            cols[name][start:stop] = values
+
+    if simulate:
+        workers = jobs or os.cpu_count() or 1
+        tasks = iter(range(0, n, sim_chunk))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            while True:
+                # au plus 2 blocs en vol par processus : la mémoire reste bornée
+                for start in tasks:
+                    p = _points(axes, shape, start, min(start + sim_chunk, n))
+                    pending.add(pool.submit(_simulate, start, p, periods))
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, out = future.result()
+                    for name, values in out.items():
+                        cols[name][start:start + values.size] = values
+
+    for col in cols.values():
+        col.flush()
+    header = {"shape": shape, "params": {name: axes[name].tolist() for name in PARAMS},
+              "columns": list(names), "n": n, "periods": periods if simulate else None}
+    (path / HEADER).write_text(json.dumps(header, indent=2), encoding="utf-8")
+    return n
+
+
+def load_sweep(path):
+    """(en-tête, {colonne: memmap en lecture seule}) d'un balayage écrit par sweep()."""
+    path = Path(path)
+    header = json.loads((path / HEADER).read_text(encoding="utf-8"))
+    return header, {name: np.load(path / f"{name}.npy", mmap_mode="r")
+                    for name in header["columns"]}
+
+
+if __name__ == "__main__":
+    out = Path("output") / "sweep"
+    n = sweep(out, {"f": np.linspace(20e3, 40e3, 201), "T_ion": np.linspace(5000, 20000, 151)})
+    header, cols = load_sweep(out)
+    i = int(np.argmin(np.abs(cols["f"][:] - 26e3) + np.abs(cols["T_ion"][:] - 5000)))
+    print(f"[OK] {n} points -> {out} ; f = 26 kHz, T_ion = 5000 K : "
+          f"R0 = {cols['R0'][i] * 1e6:.1f} µm, r_c = {cols['r_c'][i] * 1e6:.1f} µm, "
+          f"r_c/R0 = {cols['ratio'][i]:.3f}")
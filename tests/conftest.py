@@ -0,0 +1,35 @@
+"""Document réduit et répertoires de build temporaires pour les tests de build.py."""
+import pytest
+
+import build
+
+DOC = r"""\documentclass{article}
+\usepackage{hyperref}
+\begin{document}
+Page de garde
+\newpage
+\section{Introduction}
+Température ambiante <<T0>> K.
+\newpage
+% la section suivante commence une page
+\section{Équation dans l'eau}
+Texte.
+\section{Suite}
+Même page que la précédente.
+\end{document}
+"""
+
+
+@pytest.fixture
+def doc(tmp_path, monkeypatch):
+    """Redirige OUTPUT_DIR, les fragments et le cache vers `tmp_path` ; renvoie OUTPUT_DIR."""
+    out = tmp_path / "output"
+    cache = tmp_path / ".build-cache"
+    paths = {"OUTPUT_DIR": out, "TEX_PATH": out / f"{build.BASENAME}.tex",
+             "PDF_PATH": out / f"{build.BASENAME}.pdf", "SECTIONS_DIR": out / "sections",
+             "FIGURES_DIR": out / "figures", "ASSETS_DIR": out / "assets",
+             "CACHE_DIR": cache, "VALUES_CACHE": cache / "values.json", "latex_content": DOC}
+    for name, value in paths.items():
+        monkeypatch.setattr(build, name, value)
+    out.mkdir()
+    return out
@@ -0,0 +1,59 @@
+"""Cache de build : le PDF est restauré sans compilation tant que la clé ne change pas."""
+from collections import Counter
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def compiler(doc, tmp_path, monkeypatch):
+    """pdflatex factice : chaque compilation écrit un PDF et est comptée."""
+    engine = tmp_path / "pdflatex"
+    engine.touch()
+    calls = []
+
+    def compile_with_pdflatex(fmt=None, max_passes=build.MAX_PDFLATEX_PASSES):
+        calls.append(build.TEX_PATH.read_text(encoding="utf-8"))
+        build.PDF_PATH.write_bytes(b"%PDF-1.5 " + str(len(calls)).encode())
+        return True
+
+    monkeypatch.setattr(build, "which", lambda cmd: str(engine) if cmd == "pdflatex" else None)
+    monkeypatch.setattr(build, "engine_version", lambda path: "pdfTeX 3.141592653-2.6-1.40.25")
+    monkeypatch.setattr(build, "USE_LATEXMK_IF_AVAILABLE", False)
+    monkeypatch.setattr(build, "USE_PREAMBLE_FORMAT", False)
+    monkeypatch.setattr(build, "render_figures", lambda jobs=None, params=None: None)
+    monkeypatch.setattr(build, "report_log", lambda path: Counter())
+    monkeypatch.setattr(build, "compile_with_pdflatex", compile_with_pdflatex)
+    return calls
+
+
+def test_unchanged_document_is_restored_from_cache(compiler):
+    assert build.build() == (True, False)
+    first = build.PDF_PATH.read_bytes()
+    build.PDF_PATH.unlink()
+    assert build.build() == (True, True)
+    assert len(compiler) == 1
+    assert build.PDF_PATH.read_bytes() == first
+
+
+def test_key_changes_trigger_compilation(compiler, monkeypatch):
+    build.build()
+    monkeypatch.setattr(build, "latex_content", build.latex_content.replace("Texte.", "Texte modifié."))
+    assert build.build() == (True, False)
+    monkeypatch.setattr(build, "engine_version", lambda path: "pdfTeX 3.141592653-2.6-1.40.26")
+    assert build.build() == (True, False)
+    assert build.build(max_passes=2) == (True, False)
+    assert len(compiler) == 4
+    # retour au contenu d'origine : clé déjà connue
+    monkeypatch.setattr(build, "latex_content", build.latex_content.replace("Texte modifié.", "Texte."))
+    monkeypatch.setattr(build, "engine_version", lambda path: "pdfTeX 3.141592653-2.6-1.40.25")
+    assert build.build() == (True, True)
+    assert len(compiler) == 4
+
+
+def test_cache_keeps_most_recent_entries(compiler, monkeypatch):
+    monkeypatch.setattr(build, "CACHE_MAX_ENTRIES", 2)
+    for n in range(3):
+        build.build(max_passes=n + 1)
+    assert len(list(build.CACHE_DIR.glob("*.pdf"))) == 2
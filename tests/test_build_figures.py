@@ -0,0 +1,18 @@
+"""Figures par variante : les paramètres surchargés entrent dans les FigureSpec et leurs clés."""
+import build
+
+
+def test_variant_params_reach_figures():
+    default = build.figure_specs()
+    hot = build.figure_specs({"T_ion": 8000.0})
+    assert hot["planck_spectra"].params["temperatures"][0] == 8000.0
+    changed = {name for name in default
+               if build.figure_key(name, default[name]) != build.figure_key(name, hot[name])}
+    # seules les figures qui dépendent de T_ion changent de clé
+    assert changed == {"planck_spectra", "rc_map"}
+
+
+def test_default_specs_follow_doc_params():
+    specs = build.figure_specs()
+    assert specs["rp_collapse"].params["Pa"] == build.DOC_PARAMS["Pa"]
+    assert specs["fisher_rc"].params["R0_bubble"] == build.DOC_PARAMS["R0_bubble"]
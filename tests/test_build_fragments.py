@@ -0,0 +1,39 @@
+"""Fragments : découpage aux \\newpage + \\section et réécriture des seuls fragments modifiés."""
+import build
+
+
+def test_split_document_cuts_at_page_starting_sections(doc):
+    preamble, fragments = build.split_document(build.latex_content)
+    assert preamble.endswith("\\begin{document}\n")
+    assert [fr.name for fr in fragments] == ["00-front", "01-introduction", "02-equation-dans-l-eau"]
+    # une \section sans \newpage reste dans le fragment précédent
+    assert fragments[2].titles == ("Équation dans l'eau", "Suite")
+    body = build.latex_content.partition("\\begin{document}\n")[2].rpartition("\\end{document}")[0]
+    assert "".join(fr.body for fr in fragments) == body
+
+
+def test_write_tex_rewrites_only_changed_fragments(doc, monkeypatch):
+    assert [fr.name for fr in build.write_tex()] == ["00-front", "01-introduction", "02-equation-dans-l-eau"]
+    main = build.TEX_PATH.read_text(encoding="utf-8")
+    assert "\\include{sections/01-introduction}" in main
+    assert "<<T0>>" not in (build.SECTIONS_DIR / "01-introduction.tex").read_text(encoding="utf-8")
+    assert build.write_tex() == []
+
+    monkeypatch.setattr(build, "latex_content", build.latex_content.replace("Texte.", "Texte modifié."))
+    assert [fr.name for fr in build.write_tex()] == ["02-equation-dans-l-eau"]
+    assert build.TEX_PATH.read_text(encoding="utf-8") == main
+
+
+def test_removed_section_deletes_its_fragment(doc, monkeypatch):
+    build.write_tex()
+    intro = "\\newpage\n\\section{Introduction}\nTempérature ambiante <<T0>> K.\n"
+    monkeypatch.setattr(build, "latex_content", build.latex_content.replace(intro, ""))
+    build.write_tex()
+    assert sorted(p.stem for p in build.SECTIONS_DIR.glob("*.tex")) == ["00-front", "01-equation-dans-l-eau"]
+
+
+def test_select_fragments_matches_titles_and_names(doc):
+    fragments = build.split_document(build.latex_content)[1]
+    selected, unknown = build.select_fragments(fragments, ["équation", "SUITE", "front", "absente"])
+    assert [fr.name for fr in selected] == ["02-equation-dans-l-eau", "00-front"]
+    assert unknown == ["absente"]
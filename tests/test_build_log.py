@@ -0,0 +1,59 @@
+"""Analyse du .log TeX (build.parse_log / build.needs_rerun) sur des extraits réels de pdflatex."""
+import build
+
+# pdflatex + hyperref, deuxième passe : seule la bannière de rerunfilecheck contient « Rerun »
+CONVERGED = r"""This is pdfTeX, Version 3.141592653-2.6-1.40.25 (TeX Live 2023) (preloaded format=pdflatex 2023.4.10)  10 JUN 2025 14:02
+entering extended mode
+ restricted \write18 enabled.
+**sonoluminescence.tex
+(./sonoluminescence.tex
+LaTeX2e <2022-11-01> patch level 1
+(/usr/share/texlive/texmf-dist/tex/latex/hyperref/hyperref.sty
+Package: hyperref 2023-02-07 v7.00v Hypertext links for LaTeX
+(/usr/share/texlive/texmf-dist/tex/latex/rerunfilecheck/rerunfilecheck.sty
+Package: rerunfilecheck 2022-07-10 v1.10 Rerun checks for auxiliary files (HO)
+)) (./sonoluminescence.aux)
+Package hyperref Info: Link coloring OFF on input line 40.
+(./sonoluminescence.out) (./sonoluminescence.out)
+[1{/var/lib/texmf/fonts/map/pdftex/updmap/pdftex.map}] (./sonoluminescence.aux)
+Package rerunfilecheck Info: File `sonoluminescence.out' has not changed.
+(rerunfilecheck)             Checksum: 6C1F2A0E5D3B4C7A8E9F0A1B2C3D4E5F;1234.
+ )
+Output written on sonoluminescence.pdf (12 pages, 245678 bytes).
+"""
+
+# première passe : .out et références modifiés
+FIRST_PASS = CONVERGED.replace(
+    "Package rerunfilecheck Info: File `sonoluminescence.out' has not changed.\n"
+    "(rerunfilecheck)             Checksum: 6C1F2A0E5D3B4C7A8E9F0A1B2C3D4E5F;1234.\n",
+    "Package rerunfilecheck Warning: File `sonoluminescence.out' has changed.\n"
+    "(rerunfilecheck)                Rerun to get outlines right\n"
+    "(rerunfilecheck)                or use package `bookmark'.\n"
+    "\n"
+    "LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.\n")
+
+
+def write_log(tmp_path, text):
+    path = tmp_path / "sonoluminescence.log"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_package_banner_is_not_a_rerun(tmp_path):
+    path = write_log(tmp_path, CONVERGED)
+    assert not build.needs_rerun(path)
+    assert not [rec for rec in build.parse_log(path) if rec.kind == "rerun"]
+
+
+def test_rerun_requests(tmp_path):
+    path = write_log(tmp_path, FIRST_PASS)
+    assert build.needs_rerun(path)
+    reruns = [rec.message for rec in build.parse_log(path) if rec.kind == "rerun"]
+    assert reruns == ["(rerunfilecheck)                Rerun to get outlines right",
+                      "LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right."]
+
+
+def test_longtable_rerun(tmp_path):
+    path = write_log(tmp_path, CONVERGED.replace(
+        " )\n", "Package longtable Warning: Table widths have changed. Rerun LaTeX.\n )\n"))
+    assert build.needs_rerun(path)
@@ -0,0 +1,47 @@
+"""Ordonnanceur de passes pdflatex : arrêt au point fixe des auxiliaires, demandes de Rerun."""
+import pytest
+
+import build
+
+
+def fake_passes(out, monkeypatch, aux, logs):
+    """pdflatex factice : la passe i écrit aux[i] (.aux maître et fragment) et logs[i] (.log)."""
+    passes = []
+
+    def run(cmd, cwd=None, env=None, quiet=None):
+        n = len(passes)
+        main, fragment = aux[min(n, len(aux) - 1)]
+        (out / f"{build.BASENAME}.aux").write_text(main)
+        (build.SECTIONS_DIR / "01-introduction.aux").write_text(fragment)
+        (out / f"{build.BASENAME}.log").write_text(logs[min(n, len(logs) - 1)])
+        passes.append(cmd)
+        return True
+
+    build.SECTIONS_DIR.mkdir()
+    monkeypatch.setattr(build, "which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(build, "run", run)
+    return passes
+
+
+def test_stops_once_aux_files_are_stable(doc, monkeypatch):
+    # la référence du fragment n'est connue qu'à la deuxième passe
+    passes = fake_passes(doc, monkeypatch, [("toc", "\\newlabel{eq}{{?}}"), ("toc", "\\newlabel{eq}{{1}}")],
+                         ["Output written"])
+    assert build.compile_with_pdflatex(max_passes=4)
+    assert len(passes) == 3
+
+
+def test_rerun_request_in_log_forces_another_pass(doc, monkeypatch):
+    passes = fake_passes(doc, monkeypatch, [("toc", "labels")],
+                         ["Output written", "LaTeX Warning: Label(s) may have changed. Rerun to get "
+                          "cross-references right.", "Output written"])
+    assert build.compile_with_pdflatex(max_passes=4)
+    assert len(passes) == 3
+
+
+@pytest.mark.parametrize("max_passes", [1, 2, 5])
+def test_never_stable_stops_at_max_passes(doc, monkeypatch, capsys, max_passes):
+    passes = fake_passes(doc, monkeypatch, [(str(i), "") for i in range(10)], ["Output written"])
+    assert build.compile_with_pdflatex(max_passes=max_passes)
+    assert len(passes) == max_passes
+    assert "non stabilisés" in capsys.readouterr().out
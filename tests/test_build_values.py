@@ -0,0 +1,22 @@
+"""Valeurs <<nom>> : décimale française et mémo values.json borné."""
+import json
+
+import build
+
+
+def test_ratio_uses_french_decimal():
+    assert build.render("<<ratio>>") == "0{,}24"
+
+
+def test_memo_prunes_unknown_names_and_old_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(build, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(build, "VALUES_CACHE", tmp_path / "values.json")
+    monkeypatch.setattr(build, "VALUES_MEMO_KEEP", 2)
+    build.VALUES_CACHE.write_text(json.dumps({"retired": {"abc": 1.0}, "0123abcd": 2.0}))
+
+    for f in (20e3, 24e3, 26e3, 24e3):
+        build.render("<<R0_um>>", {"f": f})
+    memo = json.loads(build.VALUES_CACHE.read_text())
+    assert list(memo) == ["R0_um"]
+    keys = [build.value_key("R0_um", {**build.DOC_PARAMS, "f": f}) for f in (26e3, 24e3)]
+    assert list(memo["R0_um"]) == keys  # 20 kHz évincé, 24 kHz le plus récent
@@ -0,0 +1,60 @@
+"""Émission du flash : spectre, énergie, photons et pic comparés aux formes analytiques."""
+import numpy as np
+import pytest
+
+from emission import collapse_emission, flash_spectrum, spectral_power
+from planck import C, H, K_B
+from rayleigh_plesset import HARD_CORE_AR, P0, T_ION, Medium, integrate
+
+LAM = np.geomspace(50e-9, 50e-6, 4096)
+TAU, R = 100e-12, 0.5e-6
+SIGMA_SB = 2 * np.pi**5 * K_B**4 / (15 * H**3 * C**2)
+WIEN_B = 2.897771955e-3  # m·K
+
+
+@pytest.mark.parametrize("model, params", [("blackbody", {}), ("bremsstrahlung", {"n_e": 3e25})])
+def test_constant_temperature_is_power_times_duration(model, params):
+    t = np.linspace(0.0, TAU, 11)
+    T = np.array([[8000.0] * 11, [15000.0] * 11])
+    out = flash_spectrum(t, T, R, lam=LAM, model=model, **params)
+    expected = TAU * spectral_power(model, LAM, T[:, 0], R, **params)
+    np.testing.assert_allclose(out.spectrum, expected, rtol=1e-12)
+    w = np.gradient(LAM)  # contrôle indépendant de la quadrature en λ
+    np.testing.assert_allclose(out.energy, expected @ w, rtol=1e-3)
+    np.testing.assert_allclose(out.photons, expected @ (w * LAM / (H * C)), rtol=1e-3)
+
+
+def test_blackbody_energy_and_peak():
+    T = np.array([[6000.0] * 5, [12000.0] * 5])
+    out = flash_spectrum(np.linspace(0.0, TAU, 5), T, R, lam=LAM)
+    # Stefan–Boltzmann sur la sphère, Wien pour le pic
+    np.testing.assert_allclose(out.energy, SIGMA_SB * T[:, 0] ** 4 * 4 * np.pi * R**2 * TAU, rtol=1e-3)
+    np.testing.assert_allclose(out.peak, WIEN_B / T[:, 0], rtol=2e-3)
+    # photons : N = ∫ E_λ λ/(hc) dλ, énergie moyenne 2,70 kT par photon
+    np.testing.assert_allclose(out.energy / out.photons, 2.701 * K_B * T[:, 0], rtol=1e-3)
+
+
+def test_threshold_nan_tail_and_chunks():
+    t = np.linspace(0.0, TAU, 201)
+    T = 3000 + 12000 * np.exp(-((t - TAU / 2) / (TAU / 5)) ** 2) * np.array([[1.0], [0.1]])
+    out = flash_spectrum(t, T, R, T_min=T_ION)
+    # seconde bulle : jamais au-dessus de T_ion
+    assert out.spectrum[1].max() == 0 and out.photons[1] == 0 and np.isnan(out.peak[1])
+    assert out.photons[0] > 0
+    small = flash_spectrum(t, T, R, T_min=T_ION, chunk_bytes=8 * 16 * out.lam.size)
+    np.testing.assert_allclose(small.spectrum, out.spectrum, rtol=1e-12)
+    # instants NaN de fin de tableau (sorties denses) : ignorés
+    pad = np.full((2, 50), np.nan)
+    tail = flash_spectrum(np.concatenate([np.broadcast_to(t, T.shape), pad], axis=1),
+                          np.concatenate([T, pad], axis=1), R, T_min=T_ION)
+    np.testing.assert_allclose(tail.spectrum, out.spectrum, rtol=1e-12)
+
+
+def test_collapse_emission_of_document_bubble():
+    medium = Medium(hard_core=HARD_CORE_AR)
+    res = integrate(4.5e-6, [1.1 * P0, 1.2 * P0], 26e3, n_out=0, rtol=1e-6, medium=medium,
+                    dense_T=T_ION, dense_dt=5e-12)
+    out = collapse_emission(res, 4.5e-6, medium)
+    assert out.photons[0] == 0 and np.isnan(out.peak[0])
+    assert 1e5 < out.photons[1] < 1e8
+    assert 400e-9 < out.peak[1] < 700e-9  # T_max ≈ 5700 K : pic dans le visible (≈ 530 nm)
@@ -0,0 +1,15 @@
+"""Information de Fisher radiale : le calcul par paquets ne change pas le résultat."""
+import numpy as np
+
+from fisher import fisher_radial, gaussian_fisher
+
+
+def test_radial_chunks_match_single_block():
+    r = np.linspace(0.0, 3.0, 300) ** 1.5  # abscisses non uniformes
+    kappa = np.linspace(1.0, 8.0, 6).reshape(2, 3)
+    rho = np.exp(-kappa[..., None] * r**2)
+    whole = fisher_radial(rho, r, chunk_bytes=2**30)
+    chunked = fisher_radial(rho, r, chunk_bytes=r.size * 8)  # un profil par paquet
+    assert chunked.shape == (2, 3)
+    np.testing.assert_allclose(chunked, whole, rtol=1e-13)
+    np.testing.assert_allclose(whole, gaussian_fisher(kappa), rtol=1e-2)
@@ -0,0 +1,23 @@
+"""OT-Fisher : grandeurs physiques cohérentes avec celles que build.py écrit dans le document."""
+import pytest
+
+import build
+import ot_fisher
+
+
+def test_lambda_phys_matches_document():
+    res = ot_fisher.solve(16, 8, max_iter=200)
+    lam_phys = res.kT * res.r_c**2  # k_B T = λ_phys I_F, I_F = 1/r_c²
+    assert lam_phys == pytest.approx(build._lambda_phys(build.DOC_PARAMS["T0"],
+                                                        build.DOC_PARAMS["R0_bubble"]), rel=1e-12)
+    assert res.T == pytest.approx(build.DOC_PARAMS["T0"] * res.I_T, rel=1e-12)
+
+
+def test_multilevel_fine_level_only_polishes():
+    levels = ((16, 8), (32, 16), (64, 32))
+    res, stats = ot_fisher.solve_multilevel(levels, ftol=1e-7)
+    cold = ot_fisher.solve(64, 32, ftol=1e-7)
+    fine = [s for s in stats if s[:2] == levels[-1]]
+    assert len(fine) == 1 and fine[0][4]
+    assert fine[0][3] < 0.7 * cold.iterations
+    assert res.J == pytest.approx(cold.J, rel=1e-4)
@@ -0,0 +1,34 @@
+"""Intégrales de bande de planck comparées à scipy.integrate.quad, jusque loin dans la queue de Wien."""
+import numpy as np
+import pytest
+
+import planck
+
+quad = pytest.importorskip("scipy.integrate").quad
+
+
+def reference(n, T, nu_min, nu_max):
+    x1, x2 = planck.H * nu_min / (planck.K_B * T), planck.H * nu_max / (planck.K_B * T)
+    value, _ = quad(lambda x: x**n / np.expm1(x), x1, x2, epsabs=0.0, epsrel=1e-13, limit=200)
+    scale = 2 * planck.H / planck.C**2 * (planck.K_B * T / planck.H) ** 4 if n == 3 \
+        else 2 / planck.C**2 * (planck.K_B * T / planck.H) ** 3
+    return scale * value
+
+
+@pytest.mark.parametrize("T", [300.0, 600.0, 900.0, 2000.0, 5000.0, 20000.0])
+@pytest.mark.parametrize("band", [(400e-9, 700e-9), (150e-9, 400e-9), (700e-9, 5e-6)])
+def test_band_matches_quad(T, band):
+    nu_min, nu_max = planck.wavelength_band(*band)
+    for n, func in ((3, planck.band_radiance), (2, planck.band_photon_radiance)):
+        ref = reference(n, T, nu_min, nu_max)
+        assert ref > 0
+        assert float(func(T, nu_min, nu_max)) == pytest.approx(ref, rel=1e-10)
+
+
+def test_full_spectrum():
+    T = np.array([300.0, 5000.0])
+    sigma = 2 * np.pi**5 * planck.K_B**4 / (15 * planck.C**2 * planck.H**3)
+    np.testing.assert_allclose(planck.band_radiance(T), sigma * T**4 / np.pi, rtol=1e-14)
+    nu_min, _ = planck.wavelength_band(400e-9, 700e-9)
+    whole = planck.band_radiance(T, 0.0, nu_min) + planck.band_radiance(T, nu_min)
+    np.testing.assert_allclose(whole, planck.band_radiance(T), rtol=1e-14)
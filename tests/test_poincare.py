@@ -0,0 +1,13 @@
+"""Section de Poincaré de la bulle du document : cycle d'ordre 1 (SBSL stable)."""
+from build import DOC_PARAMS
+from poincare import cycle_order, poincare_map
+from rayleigh_plesset import HARD_CORE_AR, Medium
+
+
+def test_document_bubble_is_period_one():
+    medium = Medium(rho_L=DOC_PARAMS["rho_L"], P0=DOC_PARAMS["p0"], gamma=DOC_PARAMS["gamma"],
+                    T0=DOC_PARAMS["T0"], hard_core=HARD_CORE_AR)
+    res = poincare_map(DOC_PARAMS["R0_bubble"], DOC_PARAMS["Pa"], DOC_PARAMS["f"],
+                       periods=4, transient=3, medium=medium, rtol=1e-5, jobs=1)
+    assert res.ok.all()
+    assert cycle_order(res.R, max_order=2).tolist() == [1]
@@ -0,0 +1,25 @@
+"""Format précompilé : un échec du dump n'est retenté que si le préambule change."""
+import subprocess
+
+import build
+
+
+def test_failed_dump_is_retried_only_when_preamble_changes(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(build, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(build, "USE_PREAMBLE_FORMAT", True)
+    monkeypatch.setattr(build, "which", lambda cmd: cmd)
+    monkeypatch.setattr(build, "engine_version", lambda engine: "pdfTeX 3.14")
+    monkeypatch.setattr(build.subprocess, "run",
+                        lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, b"/tex/mylatexformat.ltx\n"))
+    monkeypatch.setattr(build, "run", lambda cmd, cwd=None: calls.append(cmd) or False)
+
+    assert build.preamble_format() is None
+    assert build.preamble_format() is None
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*.fail"))) == 1
+
+    monkeypatch.setattr(build, "latex_content", "% autre préambule\n" + build.latex_content)
+    assert build.preamble_format() is None
+    assert len(calls) == 2
+    assert len(list(tmp_path.glob("*.fail"))) == 1  # l'ancien marqueur est retiré
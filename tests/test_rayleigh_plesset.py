@@ -0,0 +1,35 @@
+"""Intégrateur Keller–Miksis : jacobien analytique et bulle SBSL bornée sur une dizaine de périodes."""
+import numpy as np
+import pytest
+
+from rayleigh_plesset import HARD_CORE_AR, P0, Medium, _rhs, integrate
+
+SBSL = Medium(hard_core=HARD_CORE_AR)
+
+
+@pytest.mark.parametrize("medium", [SBSL, Medium(c=np.inf)])
+@pytest.mark.parametrize("R, U, t", [(2e-6, -300.0, 1e-5), (30e-6, 5.0, 2e-5), (0.9e-6, 100.0, 3e-6)])
+def test_jacobian_matches_finite_differences(medium, R, U, t):
+    args = (4.5e-6, 1.2 * P0, 2 * np.pi * 26e3, medium)
+    _, _, a, b, c = _rhs(t, R, U, *args)
+    e = 1e-7
+    a_fd = (_rhs(t, R * (1 + e), U, *args, jac=False)[1]
+            - _rhs(t, R * (1 - e), U, *args, jac=False)[1]) / (2 * R * e)
+    b_fd = (_rhs(t, R, U + e * abs(U), *args, jac=False)[1]
+            - _rhs(t, R, U - e * abs(U), *args, jac=False)[1]) / (2 * e * abs(U))
+    c_fd = (_rhs(t * (1 + e), R, U, *args, jac=False)[1]
+            - _rhs(t * (1 - e), R, U, *args, jac=False)[1]) / (2 * t * e)
+    assert a == pytest.approx(a_fd, rel=1e-5)
+    assert b == pytest.approx(b_fd, rel=1e-5)
+    assert c == pytest.approx(c_fd, rel=1e-4)
+
+
+def test_sbsl_radius_stays_bounded():
+    periods, per = 10, 50
+    res = integrate(4.5e-6, [1.15 * P0, 1.2 * P0], 26e3, periods=periods, n_out=periods * per + 1,
+                    medium=SBSL, rtol=1e-5)
+    assert res.ok.all()
+    R_max = res.R[:, 1:].reshape(2, periods, per).max(axis=2)
+    assert np.all(R_max < 30e-6)
+    # régime établi dès la deuxième période : plus de croissance d'une période à l'autre
+    assert np.all(np.abs(R_max[:, 2:] / R_max[:, 1:2] - 1) < 1e-3)
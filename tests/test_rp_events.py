@@ -0,0 +1,57 @@
+"""Événements de l'intégrateur : minima du rayon, flash au-dessus de T_ion, sorties denses au collapse."""
+import numpy as np
+import pytest
+
+from rayleigh_plesset import HARD_CORE_AR, P0, T_ION, Medium, gas_temperature, integrate
+
+SBSL = Medium(hard_core=HARD_CORE_AR)
+R0, DENSE_DT = 4.5e-6, 5e-12
+
+
+@pytest.fixture(scope="module")
+def runs():
+    # 1,1 atm : collapse sous T_ion ; 1,2 atm : flash (bulle du document)
+    args = (R0, [1.1 * P0, 1.2 * P0], 26e3)
+    events = integrate(*args, n_out=0, rtol=1e-6, medium=SBSL, dense_T=T_ION, dense_dt=DENSE_DT)
+    sampled = integrate(*args, n_out=2001, rtol=1e-6, medium=SBSL)
+    return events, sampled
+
+
+def test_summaries_do_not_depend_on_outputs(runs):
+    events, sampled = runs
+    for name in ("R_min", "t_min", "T_max", "flash", "t_flash", "t_events", "R_events", "steps"):
+        np.testing.assert_array_equal(getattr(events, name), getattr(sampled, name))
+    assert np.isnan(sampled.dense_t).all()  # pas de dense_T : aucune sortie dense
+
+
+def test_radius_minima(runs):
+    res = runs[0]
+    assert np.all(np.diff(res.t_events, axis=1) > 0)  # dans l'ordre du temps
+    deepest = np.nanargmin(res.R_events, axis=1)
+    np.testing.assert_array_equal(res.R_events[[0, 1], deepest], res.R_min)
+    np.testing.assert_array_equal(res.t_events[[0, 1], deepest], res.t_min)
+    np.testing.assert_allclose(res.T_max, gas_temperature(res.R_min, R0, SBSL), rtol=1e-12)
+    # R_min affiné sur l'interpolant : pas plus haut que les sorties denses, Ṙ y change de signe
+    ok = ~np.isnan(res.dense_t[1])
+    R, U = res.dense_R[1, ok], res.dense_U[1, ok]
+    assert res.R_min[1] <= R.min() <= res.R_min[1] * (1 + 1e-6)
+    assert U[np.argmin(R) - 1] < 0 < U[np.argmin(R) + 1]
+
+
+def test_max_events_keeps_deepest_minima():
+    full = integrate(R0, 1.2 * P0, 26e3, n_out=0, rtol=1e-6, medium=SBSL)
+    two = integrate(R0, 1.2 * P0, 26e3, n_out=0, rtol=1e-6, medium=SBSL, max_events=2)
+    keep = np.sort(np.argsort(full.R_events[0])[:2])
+    np.testing.assert_array_equal(two.t_events[0], full.t_events[0, keep])
+    np.testing.assert_array_equal(two.R_events[0], full.R_events[0, keep])
+
+
+def test_flash_and_dense_window(runs):
+    res = runs[0]
+    assert res.flash[0] == 0 and np.isnan(res.t_flash[0])
+    assert np.isnan(res.dense_t[0]).all()  # dense_T jamais atteint
+    t = res.dense_t[1, ~np.isnan(res.dense_t[1])]
+    np.testing.assert_allclose(np.diff(t), DENSE_DT, rtol=1e-3)
+    assert t[0] <= res.t_flash[1] <= res.t_min[1] <= t[-1]
+    T = gas_temperature(res.dense_R[1, :t.size], R0, SBSL)
+    assert abs(np.count_nonzero(T >= T_ION) * DENSE_DT - res.flash[1]) <= 2 * DENSE_DT
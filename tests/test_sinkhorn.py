@@ -0,0 +1,44 @@
+"""Sinkhorn par lots : chaque paire du lot donne le résultat de sa résolution seule."""
+import numpy as np
+import pytest
+
+from sinkhorn import radial_masses, sinkhorn
+
+
+def gaussian(X, Y, x0, y0, var):
+    return np.exp(-((X - x0) ** 2 + (Y - y0) ** 2) / var)
+
+
+def test_batch_matches_single_pairs():
+    g = np.linspace(-1.0, 1.0, 40)
+    X, Y = np.meshgrid(g, g, indexing="ij")
+    a = np.stack([gaussian(X, Y, 0.0, 0.0, 0.02), gaussian(X, Y, -0.3, 0.1, 0.05),
+                  gaussian(X, Y, 0.2, -0.2, 0.01)])
+    b = np.stack([gaussian(X, Y, 0.4, 0.0, 0.02), gaussian(X, Y, 0.3, -0.2, 0.02),
+                  gaussian(X, Y, 0.2, -0.2, 0.03)])
+    batch = sinkhorn(a, b, [g, g], eps=4e-3)
+    assert batch.converged and batch.cost.shape == (3,)
+    for i in range(3):
+        single = sinkhorn(a[i], b[i], [g, g], eps=4e-3)
+        assert single.converged
+        assert batch.cost[i] == pytest.approx(float(single.cost), rel=1e-8)
+
+
+def test_broadcast_source_matches_stacked_copies():
+    g = np.linspace(-1.0, 1.0, 32)
+    X, Y = np.meshgrid(g, g, indexing="ij")
+    a = gaussian(X, Y, 0.0, 0.0, 0.02)
+    b = np.stack([gaussian(X, Y, s, 0.0, 0.02) for s in (0.1, 0.3, 0.5)])
+    shared = sinkhorn(a, b, [g, g], eps=4e-3)
+    stacked = sinkhorn(np.broadcast_to(a, b.shape), b, [g, g], eps=4e-3)
+    np.testing.assert_allclose(shared.cost, stacked.cost, rtol=1e-12)
+    # gaussiennes translatées de s : W2² = s², plus un terme entropique commun
+    np.testing.assert_allclose(shared.cost[1:] - shared.cost[0], [0.09 - 0.01, 0.25 - 0.01], atol=1e-5)
+
+
+def test_radial_matches_exact_w2():
+    r = np.linspace(0.0, 3.0, 300)
+    res = sinkhorn(radial_masses(np.exp(-r**2 / 0.5), r), radial_masses(np.exp(-r**2 / 0.2), r),
+                   [r], eps=1e-3)
+    # gaussiennes 3D isotropes de variance σ² par axe : W2² = 3 (σ_a - σ_b)²
+    assert float(res.cost) == pytest.approx(3 * (0.5 - np.sqrt(0.1)) ** 2, rel=5e-2)
@@ -0,0 +1,15 @@
+"""Balayage simulé aux valeurs par défaut : la bulle SBSL du document émet."""
+import numpy as np
+
+from sweep import DEFAULTS, load_sweep, sweep
+
+
+def test_simulated_columns_describe_sbsl(tmp_path):
+    n = sweep(tmp_path, {"Pa": [1.1 * 101325.0, DEFAULTS["Pa"]]}, simulate=True, jobs=1)
+    header, cols = load_sweep(tmp_path)
+    assert n == 2 and header["params"]["R0_bubble"] == [4.5e-6]
+    assert np.all(cols["ok"])
+    # 1,1 atm : sous le seuil d'ionisation ; 1,2 atm : collapse violent et flash
+    assert cols["T_max"][0] < DEFAULTS["T_ion"] and cols["flash"][0] == 0
+    assert cols["R_min"][1] < DEFAULTS["R0_bubble"] / 3
+    assert cols["T_max"][1] > DEFAULTS["T_ion"] and cols["flash"][1] > 0
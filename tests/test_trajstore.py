@@ -0,0 +1,57 @@
+"""Fenêtres du magasin compressé identiques à celles du memmap (entiers, pas négatifs, vides)."""
+import numpy as np
+import pytest
+
+from trajstore import TrajectoryStore
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    root = tmp_path_factory.mktemp("trajstore")
+    data = np.random.default_rng(0).random((1000, 4))
+    for compression in (None, "zlib"):
+        with TrajectoryStore(root / str(compression), "w", item_shape=(4,), chunk=64,
+                             compression=compression) as store:
+            run = store.new_run()
+            store.append(run, data[:500])
+            store.append(run, data[500:])
+    return TrajectoryStore(root / "None"), TrajectoryStore(root / "zlib")
+
+
+@pytest.mark.parametrize("t", [0, 5, -1, -1000, 999, slice(None, None, -1), slice(900, 100, -7),
+                               slice(-5, None), slice(10, 3), slice(100, 900, 13), slice(3, 4, -1)])
+@pytest.mark.parametrize("space", [(), (slice(1, 3),), (2,)])
+def test_compressed_window_matches_memmap(stores, t, space):
+    raw, packed = stores
+    expected = np.asarray(raw.window(0, t, space))
+    got = packed.window(0, t, space)
+    assert got.shape == expected.shape
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize("t", [1000, -1001])
+def test_out_of_range(stores, t):
+    for store in stores:
+        with pytest.raises(IndexError):
+            store.window(0, t)
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_reopen_discards_unflushed_slices(tmp_path, compression):
+    store = TrajectoryStore(tmp_path, "w", chunk=4, compression=compression)
+    run = store.new_run()
+    store.append(run, np.zeros(10))
+    store.flush()
+    store.append(run, np.ones(5))  # un bloc écrit, jamais enregistré dans l'en-tête
+    orphan = store.new_run()
+    store.append(orphan, np.ones(8))
+    del store  # arrêt brutal : pas de flush()
+
+    with TrajectoryStore(tmp_path, "a") as store:
+        assert store.runs == 1 and store.length(run) == 10
+        store.append(run, np.full(3, 7.0))
+        assert store.new_run() == orphan
+        store.append(orphan, np.full(2, 5.0))
+    store = TrajectoryStore(tmp_path)
+    np.testing.assert_array_equal(store.window(run), np.r_[np.zeros(10), np.full(3, 7.0)])
+    np.testing.assert_array_equal(store.window(orphan), np.full(2, 5.0))
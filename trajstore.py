@@ -0,0 +1,289 @@
+"""Magasin de trajectoires par blocs, projeté en mémoire (R(t), chemins {ρ_t}, ...).
+
+Un magasin est un dossier (par défaut STORE_DIR, à côté de OUTPUT_DIR) :
+
+    store.json          en-tête : dtype, forme d'un instant, taille des blocs,
+                        compression, longueur de chaque run, attributs libres
+    run-00000.bin       instants du run 0 bout à bout (dtype natif, ordre C)
+    run-00000.idx.npy   blocs compressés seulement : (t début, t fin, offset, octets, compressé)
+
+Chaque run est une suite d'instants de même forme (scalaire R, profil ρ(r),
+grille 3D...). Les instants sont ajoutés au fil de l'intégration (append) ;
+sans compression le fichier d'un run est lu par np.memmap et une fenêtre
+(run, plage de temps, plage d'espace) est une vue, sans copie : elle se
+passe telle quelle à fisher.fisher_radial/fisher_grid ou à matplotlib.
+Avec compression (zlib, lzma) les instants sont regroupés en blocs de
+`chunk` instants compressés séparément ; une fenêtre ne décompresse que les
+blocs qu'elle touche (le résultat est alors une copie). Un bloc que la
+compression n'a pas réduit est gardé brut.
+
+L'en-tête est réécrit atomiquement (fichier temporaire puis os.replace) à
+chaque flush() : un lecteur voit toujours un état cohérent, au plus les
+instants ajoutés depuis le dernier flush() lui manquent. Rouvert en mode
+"a", un magasin interrompu avant flush() est tronqué à ce même état.
+"""
+import json
+import lzma
+import os
+import zlib
+from math import prod
+from pathlib import Path
+
+import numpy as np
+
+# ------------ Config ------------
+STORE_DIR = Path("trajectories")  # à côté de OUTPUT_DIR (output/)
+HEADER = "store.json"
+CHUNK_SLICES = 256                # instants par bloc compressé
+COMPRESSORS = {
+    "zlib": (lambda b: zlib.compress(b, 1), zlib.decompress),
+    "lzma": (lambda b: lzma.compress(b, preset=1), lzma.decompress),
+}
+# --------------------------------
+
+_INDEX_FIELDS = 5  # t début, t fin, offset, octets, compressé
+
+
+class TrajectoryStore:
+    """Runs d'instants de forme `item_shape`, ajoutés par tranches et relus par fenêtres.
+
+    `mode` : "r" (lecture), "a" (ajout, crée le magasin s'il manque) ou "w"
+    (remplace un magasin existant). dtype, item_shape, chunk et compression
+    ne servent qu'à la création ; ensuite ils sont lus dans l'en-tête.
+    """
+
+    def __init__(self, path=STORE_DIR, mode="r", dtype=np.float64, item_shape=(),
+                 chunk=CHUNK_SLICES, compression=None, attrs=None):
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"mode inconnu : {mode!r} (r, a ou w)")
+        if compression not in (None, *COMPRESSORS):
+            raise ValueError(f"compression inconnue : {compression!r} ({', '.join(COMPRESSORS)})")
+        self.path = Path(path)
+        self.mode = mode
+        header_path = self.path / HEADER
+        if mode == "w" or (mode == "a" and not header_path.exists()):
+            self.path.mkdir(parents=True, exist_ok=True)
+            for old in self.path.glob("run-*"):
+                old.unlink()
+            self.header = {"dtype": np.dtype(dtype).str, "item_shape": list(item_shape),
+                           "chunk": int(chunk), "compression": compression,
+                           "lengths": [], "attrs": attrs or {}}
+            self._write_header()
+        else:
+            self.header = json.loads(header_path.read_text(encoding="utf-8"))
+        self.dtype = np.dtype(self.header["dtype"])
+        self.item_shape = tuple(self.header["item_shape"])
+        self.chunk = self.header["chunk"]
+        self.compression = self.header["compression"]
+        self._pending = {}  # run -> instants pas encore compressés (bloc incomplet)
+        self._index = {}    # run -> index des blocs (compression)
+        if mode == "a":
+            self._discard_unflushed()
+
+    # ------------ structure ------------
+    @property
+    def runs(self) -> int:
+        return len(self.header["lengths"])
+
+    @property
+    def attrs(self) -> dict:
+        return self.header["attrs"]
+
+    def length(self, run) -> int:
+        """Nombre d'instants du run (y compris ceux en attente de compression)."""
+        pending = self._pending.get(run)
+        return self.header["lengths"][run] + (0 if pending is None else len(pending))
+
+    def _data_path(self, run) -> Path:
+        return self.path / f"run-{run:05d}.bin"
+
+    def _index_path(self, run) -> Path:
+        return self.path / f"run-{run:05d}.idx.npy"
+
+    def _write_header(self):
+        tmp = self.path / f"{HEADER}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(self.header, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path / HEADER)
+
+    def _chunk_index(self, run) -> np.ndarray:
+        if run not in self._index:
+            path = self._index_path(run)
+            self._index[run] = np.load(path) if path.exists() \
+                else np.zeros((0, _INDEX_FIELDS), dtype=np.int64)
+        return self._index[run]
+
+    # ------------ écriture ------------
+    def _discard_unflushed(self):
+        """Tronque chaque run à ce que l'en-tête déclare.
+
+        Des instants ajoutés puis perdus avant flush() (arrêt brutal) restent
+        en fin de fichier : sans troncature, les ajouts suivants seraient
+        écrits après eux et les fenêtres reliraient les anciens octets.
+        """
+        item = self.dtype.itemsize * prod(self.item_shape)
+        for run, n in enumerate(self.header["lengths"]):
+            if self.compression is None:
+                size = n * item
+            else:
+                index = self._chunk_index(run)
+                kept = index[index[:, 1] <= n]
+                if len(kept) < len(index):
+                    self._index[run] = kept
+                    np.save(self._index_path(run), kept)
+                size = int(kept[-1, 2] + kept[-1, 3]) if len(kept) else 0
+            path = self._data_path(run)
+            if path.stat().st_size > size:
+                os.truncate(path, size)
+
+    def new_run(self) -> int:
+        """Ajoute un run vide et renvoie son numéro."""
+        self._check_writable()
+        self.header["lengths"].append(0)
+        run = self.runs - 1
+        self._data_path(run).write_bytes(b"")  # écrase un run créé mais jamais enregistré
+        self._index_path(run).unlink(missing_ok=True)
+        return run
+
+    def append(self, run, slices):
+        """Ajoute des instants (forme (k, *item_shape)) à la fin du run."""
+        self._check_writable()
+        slices = np.ascontiguousarray(slices, dtype=self.dtype)
+        if slices.shape[1:] != self.item_shape:
+            raise ValueError(f"instants de forme {slices.shape[1:]} pour un magasin {self.item_shape}")
+        if self.compression is None:
+            with open(self._data_path(run), "ab") as fh:
+                fh.write(slices.tobytes())
+            self.header["lengths"][run] += len(slices)
+            return
+        pending = self._pending.get(run)
+        pending = slices if pending is None else np.concatenate([pending, slices])
+        full = len(pending) - len(pending) % self.chunk
+        for start in range(0, full, self.chunk):
+            self._write_chunk(run, pending[start:start + self.chunk])
+        self._pending[run] = pending[full:] if full < len(pending) else None
+
+    def _write_chunk(self, run, block):
+        raw = block.tobytes()
+        packed = COMPRESSORS[self.compression][0](raw)
+        compressed = len(packed) < len(raw)
+        data = packed if compressed else raw
+        path = self._data_path(run)
+        offset = path.stat().st_size
+        with open(path, "ab") as fh:
+            fh.write(data)
+        t0 = self.header["lengths"][run]
+        row = np.array([[t0, t0 + len(block), offset, len(data), compressed]], dtype=np.int64)
+        self._index[run] = np.concatenate([self._chunk_index(run), row])
+        self.header["lengths"][run] += len(block)
+
+    def flush(self):
+        """Écrit les blocs incomplets et l'en-tête : tout ce qui a été ajouté devient lisible."""
+        self._check_writable()
+        for run, pending in self._pending.items():
+            if pending is not None and len(pending):
+                self._write_chunk(run, pending)
+        self._pending.clear()
+        for run, index in self._index.items():
+            np.save(self._index_path(run), index)
+        self._write_header()
+
+    def close(self):
+        if self.mode != "r":
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check_writable(self):
+        if self.mode == "r":
+            raise PermissionError(f"magasin {self.path} ouvert en lecture seule")
+
+    # ------------ lecture ------------
+    def window(self, run, t=slice(None), space=()):
+        """Instants `t` (tranche) du run, restreints à `space` (tranches des axes d'espace).
+
+        Sans compression : vue np.memmap en lecture seule, aucune copie.
+        Avec compression : seuls les blocs recouvrant `t` sont décompressés.
+        """
+        space = space if isinstance(space, tuple) else (space,)
+        n = self.header["lengths"][run]
+        if self.compression is None:
+            if n == 0:
+                return np.empty((0,) + self.item_shape, dtype=self.dtype)[(t,) + space]
+            data = np.memmap(self._data_path(run), dtype=self.dtype, mode="r",
+                             shape=(n,) + self.item_shape)
+            return data[(t,) + space]
+        # mêmes règles que le memmap : entier (négatif compris, IndexError hors
+        # bornes) ou tranche de pas quelconque ; on lit [lo, hi) dans l'ordre
+        steps = range(n)[t]
+        single = isinstance(steps, int)
+        if single:
+            steps = range(steps, steps + 1)
+        if not len(steps):
+            return np.empty((0,) + self.item_shape, dtype=self.dtype)[(slice(None),) + space]
+        lo, hi = min(steps[0], steps[-1]), max(steps[0], steps[-1]) + 1
+        index = self._chunk_index(run)
+        hit = index[(index[:, 1] > lo) & (index[:, 0] < hi)]
+        if not len(hit):
+            return np.empty((0,) + self.item_shape, dtype=self.dtype)[(slice(None),) + space]
+        blocks = []
+        with open(self._data_path(run), "rb") as fh:
+            for t0, t1, offset, nbytes, compressed in hit:
+                fh.seek(offset)
+                data = fh.read(nbytes)
+                if compressed:
+                    data = COMPRESSORS[self.compression][1](data)
+                blocks.append(np.frombuffer(data, dtype=self.dtype).reshape((t1 - t0,) + self.item_shape))
+        base = int(hit[0, 0])
+        joined = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        win = joined[lo - base:hi - base][::steps.step]
+        return win[(0,) + space] if single else win[(slice(None),) + space]
+
+    def __getitem__(self, key):
+        """store[run], store[run, t], store[run, t, espace...] : raccourci de window()."""
+        key = key if isinstance(key, tuple) else (key,)
+        run = key[0]
+        t = key[1] if len(key) > 1 else slice(None)
+        return self.window(run, t, tuple(key[2:]))
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    from time import perf_counter
+
+    from rayleigh_plesset import HARD_CORE_AR, Medium, integrate
+
+    # R(t), R'(t) de 8 bulles sur 3 périodes, produits période par période
+    Pa = np.linspace(1.0, 1.35, 8) * 101325.0
+    R, U, periods = np.full(8, 4.5e-6), np.zeros(8), []
+    for _ in range(3):
+        res = integrate(4.5e-6, Pa, 26.5e3, periods=1, n_out=2001, rtol=1e-6,
+                        medium=Medium(hard_core=HARD_CORE_AR), R_init=R, U_init=U)
+        periods.append(np.stack([res.R[:, 1:], res.U[:, 1:]], axis=-1))
+        R, U = res.R[:, -1], res.U[:, -1]
+
+    tmp = Path(tempfile.mkdtemp(prefix="trajstore-"))
+    try:
+        for compression in (None, "zlib"):
+            path = tmp / str(compression)
+            t0 = perf_counter()
+            with TrajectoryStore(path, "w", item_shape=(2,), chunk=500, compression=compression,
+                                 attrs={"Pa": Pa.tolist()}) as store:
+                runs = [store.new_run() for _ in Pa]
+                for block in periods:
+                    for run in runs:
+                        store.append(run, block[run])
+            elapsed = perf_counter() - t0
+            size = sum(p.stat().st_size for p in path.iterdir())
+            store = TrajectoryStore(path)
+            win = store[7, 2000:4000, 0]
+            print(f"[OK] compression {compression or 'aucune'} : {store.runs} runs × "
+                  f"{store.length(0)} instants, {size / 1024:.0f} Ko, écrit en {elapsed * 1e3:.1f} ms ; "
+                  f"fenêtre {win.shape} (vue : {isinstance(win, np.memmap)}), "
+                  f"R_min = {win.min() * 1e6:.3f} µm")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)